@@ -0,0 +1,41 @@
+"""Application factory."""
+import os
+
+from flask import Flask
+from flask_cors import CORS
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def create_app(preload=None):
+    """Create the Flask app.
+
+    With ``preload`` (or ``PRELOAD_APP=1``) the spaCy models, the document
+    templates and the field registries are warmed before returning, so a
+    pre-forking server such as gunicorn with ``preload_app = True`` shares
+    them copy-on-write across its workers.
+    """
+    if preload is None:
+        preload = os.getenv('PRELOAD_APP', '0').lower() in ('1', 'true', 'yes')
+
+    app = Flask(
+        __name__,
+        static_folder=os.path.join(PROJECT_ROOT, 'static'),
+        template_folder=os.path.join(PROJECT_ROOT, 'templates'),
+    )
+    app.secret_key = os.getenv('SECRET_KEY', 'your-secret-key-here')  # Change this in production
+    app.config['PRELOAD_APP'] = preload
+    CORS(app)
+
+    # Register blueprints
+    from app.routes import auth_bp, main_bp, document_bp
+    app.register_blueprint(auth_bp)
+    app.register_blueprint(main_bp)
+    app.register_blueprint(document_bp)
+
+    if preload:
+        from app.routes.document import processor, documents
+        from app.services.warmup import warm_all
+        warm_all(processor, documents)
+
+    return app
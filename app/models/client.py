@@ -0,0 +1,40 @@
+"""Supabase clients, created on first use instead of at import time.
+
+The data client is shared by the whole process. Auth calls that sign a user
+in store that user's session on the client they are made with, and
+supabase-py then sends the user's JWT with every later table request, so
+they go through ``auth_client`` instead: a fresh client per call that keeps
+no session.
+"""
+import os
+import threading
+from dotenv import load_dotenv
+
+load_dotenv()
+
+SUPABASE_URL = os.getenv('SUPABASE_URL')
+SUPABASE_KEY = os.getenv('SUPABASE_KEY')
+
+_client = None
+_lock = threading.Lock()
+
+def get_supabase():
+    """Return the process-wide Supabase client for table and admin calls."""
+    global _client
+    if _client is None:
+        with _lock:
+            if _client is None:
+                from supabase import create_client
+                _client = create_client(SUPABASE_URL, SUPABASE_KEY)
+    return _client
+
+def auth_client():
+    """Return a new Supabase client for one sign-in or sign-up call.
+
+    Sessions are neither persisted nor refreshed, so a user's login never
+    reaches the shared client.
+    """
+    from supabase import create_client
+    from supabase.lib.client_options import ClientOptions
+    return create_client(SUPABASE_URL, SUPABASE_KEY,
+                         options=ClientOptions(persist_session=False, auto_refresh_token=False))
@@ -1,14 +1,5 @@
-import os
-from supabase import create_client, Client
-from dotenv import load_dotenv
 from datetime import datetime
-
-load_dotenv()
-
-SUPABASE_URL = os.getenv('SUPABASE_URL')
-SUPABASE_KEY = os.getenv('SUPABASE_KEY')
-
-supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
+from .client import get_supabase
 
 def add_user_history(user_id, action, details=None):
     try:
@@ -26,12 +17,12 @@ def add_user_history(user_id, action, details=None):
             'details': details,
             'timestamp': datetime.utcnow().isoformat()
         }
-        response = supabase.table('user_history').insert(data).execute()
+        response = get_supabase().table('user_history').insert(data).execute()
         return response.data
     except Exception as e:
         print(f"Supabase connection error in add_user_history: {e}")
         return None
 
 def get_user_history(user_id, limit=50):
-    response = supabase.table('user_history').select('*').eq('user_id', user_id).order('timestamp', desc=True).limit(limit).execute()
+    response = get_supabase().table('user_history').select('*').eq('user_id', user_id).order('timestamp', desc=True).limit(limit).execute()
     return response.data
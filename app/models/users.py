@@ -1,18 +1,9 @@
-import os
-from supabase import create_client, Client
-from dotenv import load_dotenv
-
-load_dotenv()
-
-SUPABASE_URL = os.getenv('SUPABASE_URL')
-SUPABASE_KEY = os.getenv('SUPABASE_KEY')
-
-supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
+from .client import get_supabase
 
 def get_user(user_id):
     try:
         # Get user from Supabase Auth
-        response = supabase.auth.admin.get_user_by_id(user_id)
+        response = get_supabase().auth.admin.get_user_by_id(user_id)
         if response.user:
             return response.user
     except Exception as e:
@@ -22,7 +13,7 @@ def get_user(user_id):
 def get_user_by_email(email):
     try:
         # Get user from Supabase Auth by email
-        response = supabase.auth.admin.list_users()
+        response = get_supabase().auth.admin.list_users()
         for user in response.users:
             if user.email == email:
                 return user
@@ -41,7 +32,7 @@ def add_user_profile(user_id, language_preference='en'):
             'user_id': user_id,
             'language_preference': language_preference
         }
-        response = supabase.table('user_profiles').insert(data).execute()
+        response = get_supabase().table('user_profiles').insert(data).execute()
         return response.data
     except Exception as e:
         print(f"Supabase connection error in add_user_profile: {e}")
@@ -49,7 +40,7 @@ def add_user_profile(user_id, language_preference='en'):
 
 def get_user_profile(user_id):
     try:
-        response = supabase.table('user_profiles').select('*').eq('user_id', user_id).execute()
+        response = get_supabase().table('user_profiles').select('*').eq('user_id', user_id).execute()
         if response.data:
             return response.data[0]
     except Exception as e:
@@ -1,15 +1,9 @@
 """Authentication routes for the application."""
-import os
 from flask import render_template, redirect, url_for, request, flash, session, jsonify
-from supabase import create_client, Client
 
 from . import auth_bp
 from app.models.users import get_user, get_user_by_email, add_user_profile, get_user_profile
-
-SUPABASE_URL = os.getenv('SUPABASE_URL')
-SUPABASE_KEY = os.getenv('SUPABASE_KEY')  # Use service role key for server-side operations
-
-supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
+from app.models.client import SUPABASE_URL, SUPABASE_KEY, auth_client  # Use service role key for server-side operations
 
 @auth_bp.route('/login', methods=['GET'])
 def login():
@@ -40,7 +34,7 @@ def api_signup():
             return jsonify({'error': 'Password must be at least 6 characters long'}), 400
 
         # Sign up with Supabase Auth
-        response = supabase.auth.sign_up({
+        response = auth_client().auth.sign_up({
             'email': email,
             'password': password,
             'options': {
@@ -88,7 +82,7 @@ def api_login():
             return jsonify({'error': 'Please enter a valid email address'}), 400
 
         # Sign in with Supabase Auth
-        response = supabase.auth.sign_in_with_password({
+        response = auth_client().auth.sign_in_with_password({
             'email': email,
             'password': password
         })
@@ -129,10 +123,8 @@ def api_login():
 
 @auth_bp.route('/logout')
 def logout():
-    try:
-        supabase.auth.sign_out()
-    except:
-        pass
+    # The server keeps no Supabase session (see ``auth_client``); signing out
+    # only clears the Flask session.
     session.pop('user_id', None)
     session.pop('user_email', None)
     session.pop('user_username', None)
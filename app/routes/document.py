@@ -1,222 +1,75 @@
 """Document generation routes."""
-from flask import render_template, request, flash, session, jsonify
+from flask import Response, render_template, request, flash, session, jsonify
+from markupsafe import escape
 from . import document_bp
 from app.services.processor import LegalDocumentProcessor
 from app.models.history import add_user_history
-import spacy
+from app.services.nlp_registry import pipeline_stats
+from app.services.transcript_sessions import TranscriptSessionStore
+from app.services.translation_memory import get_translation_memory
+from app.services.field_translation import TIMED_OUT, translate_fields
+from app.services.batch_translation import BatchTranslator
+from app.services.translation_client import get_translation_client
+from app.services.field_schema import build_schema, translatable_fields, transliterable_fields
+from app.services.localization import localize_fields
+from app.services.number_words import fill_amount_words
+from app.services.transliteration import transliterate
+from app.services.default_data import complete_document_data
+from app.services.exporters import download_name, get_format
+from app.services.mail_merge import merge_documents, read_rows, rows_format, stream_zip
+from app.services.custom_templates import CustomTemplateCache
+import io
+import itertools
 import json
-import tempfile
-from docx import Document
-from reportlab.lib.pagesizes import A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.enums import TA_JUSTIFY
-from reportlab.lib.units import inch
+import os
+import time
 from datetime import datetime
-import re
-import requests
 
 
-nlp = spacy.load('en_core_web_sm')
 processor = LegalDocumentProcessor()
+transcript_sessions = TranscriptSessionStore()
+custom_templates = CustomTemplateCache()
 
-def translate_text(text, target_lang):
-    """Translate text using MyMemory API"""
-    if not text.strip():
-        return text
+# Formats sent as a chunked response while the template renders
+STREAMED_FORMATS = {
+    'txt': 'text/plain; charset=utf-8',
+    'html': 'text/html; charset=utf-8',
+}
 
-    try:
-        url = f"https://api.mymemory.translated.net/get?q={text}&langpair=en|{target_lang}"
-        print(f"Translating: '{text}' to {target_lang} using URL: {url}")
-        response = requests.get(url, timeout=5)
-        data = response.json()
-        print(f"Translation response: {data}")
-        if data['responseStatus'] == 200:
-            translated = data['responseData']['translatedText']
-            print(f"Translated '{text}' to '{translated}'")
-            return translated
-        else:
-            print(f"Translation failed for '{text}'")
-            return text  # Fallback to original text
-    except Exception as e:
-        print(f"Translation error for '{text}': {e}")
-        return text  # Fallback to original text
+TRANSLATION_PROVIDER = 'mymemory'
 
-def get_default_data_for_document(doc_type, language):
-    """Get default data for realistic document generation"""
-    current_date = datetime.now()
-    
-    defaults = {
-        'date': current_date.strftime('%B %d, %Y'),
-        'month': current_date.strftime('%B'),
-        'year': current_date.strftime('%Y'),
-        'execution_date': current_date.strftime('%d/%m/%Y'),
-        'execution_place': 'Chennai',
-        'witness1_name': 'Mr. Witness One',
-        'witness1_address': 'No. 123, Main Street, Chennai - 600001',
-        'witness2_name': 'Mr. Witness Two', 
-        'witness2_address': 'No. 456, Second Street, Chennai - 600002',
-        'jurisdiction': 'Chennai',
-        'registration_office': 'Chennai',
-        'stamp_duty_bearer': 'Vendee'
-    }
-    
-    if doc_type == 'rental_agreement':
-        defaults.update({
-            'owner_age': '45',
-            'renter_age': '35',
-            'owner_father': 'Father Name',
-            'renter_father': 'Father Name',
-            'owner_address': 'No. 123, Main Street',
-            'owner_city': 'Chennai',
-            'owner_pincode': '600001',
-            'renter_address': 'No. 456, Second Street',
-            'renter_city': 'Chennai',
-            'renter_pincode': '600002',
-            'property_address': 'No. 789, Property Street',
-            'property_city': 'Chennai',
-            'property_pincode': '600073',
-            'start_date': '1st April 2024',
-            'effective_date': '1st April 2024',
-            'duration': '11',
-            'renewal_period': '11',
-            'rent_amount': '15,000',
-            'rent_amount_words': 'Fifteen Thousand',
-            'rent_due_date': '1st',
-            'rent_increase_percentage': '10',
-            'security_deposit': '30,000',
-            'security_deposit_words': 'Thirty Thousand',
-            'notice_period': '2'
-        })
-    elif doc_type == 'land_sale_deed':
-        defaults.update({
-            'seller_age': '50',
-            'buyer_age': '40',
-            'seller_father': 'Father Name',
-            'buyer_father': 'Father Name',
-            'seller_address': 'No. 123, Main Street',
-            'seller_city': 'Chennai',
-            'seller_pincode': '600001',
-            'buyer_address': 'No. 456, Second Street',
-            'buyer_city': 'Chennai',
-            'buyer_pincode': '600002',
-            'property_address': 'No. 789, Property Street',
-            'property_city': 'Chennai',
-            'property_pincode': '600073',
-            'sale_amount': '50,00,000',
-            'sale_amount_words': 'Fifty Lakhs',
-            'sale_date': '1st April 2024',
-            'survey_number': '123/45',
-            'area': '2400',
-            'north_boundary': 'Main Road',
-            'south_boundary': 'Residential Area',
-            'east_boundary': 'Park',
-            'west_boundary': 'Commercial Area'
-        })
-    elif doc_type == 'power_of_attorney':
-        defaults.update({
-            'principal_age': '55',
-            'attorney_age': '40',
-            'principal_father': 'Father Name',
-            'attorney_father': 'Father Name',
-            'principal_address': 'No. 123, Main Street',
-            'principal_city': 'Chennai',
-            'principal_pincode': '600001',
-            'attorney_address': 'No. 456, Second Street',
-            'attorney_city': 'Chennai',
-            'attorney_pincode': '600002',
-            'matter_description': 'property management and legal representation',
-            'effective_date': '1st April 2024',
-            'expiry_date': '31st March 2025'
-        })
-    elif doc_type == 'house_lease':
-        defaults.update({
-            'lessor_age': '50',
-            'lessee_age': '35',
-            'lessor_father': 'Father Name',
-            'lessee_father': 'Father Name',
-            'lessor_address': 'No. 123, Main Street',
-            'lessor_city': 'Chennai',
-            'lessor_pincode': '600001',
-            'lessee_address': 'No. 456, Second Street',
-            'lessee_city': 'Chennai',
-            'lessee_pincode': '600002',
-            'property_address': 'No. 789, Property Street',
-            'property_city': 'Chennai',
-            'property_pincode': '600073',
-            'lease_period': '2',
-            'start_date': '1st April 2024',
-            'end_date': '31st March 2026',
-            'lease_amount': '25,000',
-            'lease_amount_words': 'Twenty Five Thousand',
-            'rent_due_date': '1st',
-            'security_deposit': '50,000',
-            'security_deposit_words': 'Fifty Thousand',
-            'notice_period': '3',
-            'number_of_rooms': '3'
-        })
-    
-    # Apply language-specific translations
-    translations = {
-        'en': {
-            'Father Name': 'Father Name',
-            'Mr. Witness One': 'Mr. Witness One',
-            'Chennai': 'Chennai'
-        },
-        'hi': {
-            'Father Name': 'अपने पिता का नाम',
-            'Mr. Witness One': 'श्री विजय एक',
-            'Chennai': 'चेन्नई'
-        },
-        'bn': {
-            'Father Name': 'আমার পিতার নাম',
-            'Mr. Witness One': 'শ্রী বিজয় এক',
-            'Chennai': 'চেন্নাই'
-        },
-        'te': {
-            'Father Name': 'నా పిల్లి పేరు',
-            'Mr. Witness One': 'శ్రీ విజయ ఒక',
-            'Chennai': 'చెన్నై'
-        },
-        'mr': {
-            'Father Name': 'माझा वडील यांचा नाव',
-            'Mr. Witness One': 'श्री విజయ एक',
-            'Chennai': 'चेन्नई'
-        },
-        'ur': {
-            'Father Name': 'میرے والد کا نام',
-            'Mr. Witness One': 'شری ویجی ہے',
-            'Chennai': 'چینనాی'
-        },
-        'gu': {
-            'Father Name': 'માઝા પિતાનું નામ',
-            'Mr. Witness One': 'શ્રી વિજય એક',
-            'Chennai': 'ચેન્નઈ'
-        },
-        'kn': {
-            'Father Name': 'ನನ್ನ ಪಿತಾನ ಹೆಸರು',
-            'Mr. Witness One': 'ಶ್ರೀ ವಿಜಯ ಒಂದು',
-            'Chennai': 'ಚೆನ್ನಾಯ'
-        },
-        'or': {
-            'Father Name': 'ଆମଦ୍ବାରା ପିତାଙ୍କ ନାମ',
-            'Mr. Witness One': 'ଶ୍ରୀ ବିଜଯ଼ ଏକ',
-            'Chennai': 'ଚେନ୍ନାଇ'
-        },
-        'ta': {
-            'Father Name': 'என் தந்தை பெயர்',
-            'Mr. Witness One': 'சிறுவர் விஜய் ஒன்று',
-            'Chennai': 'சென்னை'
-        }
-    }
+batch_translator = BatchTranslator(get_translation_client().translate)
+
+def translate_texts(texts, target_lang):
+    """Translate a list of texts, packing translation memory misses into as few calls as possible
 
-    for key, value in defaults.items():
-        if isinstance(value, str) and value in translations.get(language, {}):
-            defaults[key] = translations[language][value]
-        elif isinstance(value, str) and value.lower() in translations.get(language, {}):
-            defaults[key] = translations[language][value.lower()]
+    A text the provider could not translate comes back as ``None``.
+    """
+    memory = get_translation_memory()
+    results = [memory.get(text, target_lang, TRANSLATION_PROVIDER) if text.strip() else text for text in texts]
+    misses = [text for text, result in zip(texts, results) if result is None]
+    if misses:
+        translated = dict(zip(misses, batch_translator.translate(misses, target_lang)))
+        for text, result in translated.items():
+            if result is not None:
+                memory.put(text, target_lang, TRANSLATION_PROVIDER, result)
+        results = [translated.get(text) or None if result is None else result
+                   for text, result in zip(texts, results)]
+    return results
 
-    return defaults
+TRANSLITERATION_PROVIDER = 'transliteration'
+
+def transliterate_values(values, target_lang):
+    """Transliterate a mapping of names and addresses, preferring curated phrases from the translation memory"""
+    memory = get_translation_memory()
+    return {key: memory.get(value, target_lang, TRANSLITERATION_PROVIDER) or transliterate(value, target_lang)
+            if value.strip() else value
+            for key, value in values.items()}
+
+def translate_text(text, target_lang):
+    """Translate text using MyMemory API, consulting the translation memory first"""
+    # Fallback to original text when the provider failed
+    return translate_texts([text], target_lang)[0] or text
 
 documents = {
     'rental_agreement': {
@@ -301,6 +154,9 @@ documents = {
     }
 }
 
+# Field types per document, deciding which values are translated and which are formatted locally
+field_schemas = {doc_type: build_schema(spec['fields']) for doc_type, spec in documents.items()}
+
 @document_bp.route('/document/<doc_type>')
 def document_form(doc_type):
     if doc_type not in documents:
@@ -480,19 +336,28 @@ def generate_document():
             mapped_data[template_field] = data.get(form_field, '')
         data = mapped_data
 
+    # Spell amounts in the document language; English words typed by the user are kept
+    generated_words = fill_amount_words(data, language, keep_given=(language == 'en'))
+
     # Translate data if language is not English
+    degraded_fields = {}
     if language != 'en':
-        print(f"Translating data to {language}")
-        translated_data = {}
-        for key, value in data.items():
-            if value.strip():  # Only translate non-empty values
-                translated = translate_text(value, language)
-                translated_data[key] = translated
-                print(f"Translated {key}: '{value}' -> '{translated}'")
-            else:
-                translated_data[key] = value
-        data = translated_data
-        print(f"Translation complete for {language}")
+        schema = field_schemas[doc_type]
+        # Numbers, dates, pincodes and amounts are formatted locally, names and addresses are
+        # transliterated; only free text goes to the provider
+        data = localize_fields(data, schema, language)
+        data.update(transliterate_values(transliterable_fields(data, schema), language))
+        translated, degraded_fields = translate_fields(translatable_fields(data, schema, skip=generated_words),
+                                                       language, translate_texts)
+        data.update(translated)
+        timed_out = [field for field, reason in degraded_fields.items() if reason == TIMED_OUT]
+        failed = [field for field, reason in degraded_fields.items() if reason != TIMED_OUT]
+        if timed_out:
+            flash('Translation timed out for some fields; they are shown in English: '
+                  + ', '.join(field.replace('_', ' ') for field in timed_out), 'warning')
+        if failed:
+            flash('The translation service could not translate some fields; they are shown in English: '
+                  + ', '.join(field.replace('_', ' ') for field in failed), 'warning')
 
     # No longer require all fields to be filled. Missing fields will simply be empty in the template.
     # missing_fields = [field for field, value in data.items() if not value]
@@ -505,14 +370,14 @@ def generate_document():
     try:
         document = processor.generate_document(doc_type, data, language)
         # Use spaCy to extract entities
-        doc_nlp = nlp(document)
-        entities = [(ent.text, ent.label_) for ent in doc_nlp.ents]
+        entities = processor.document_entities(document)
 
         # Log history
         if 'user_id' in session:
             add_user_history(session['user_id'], 'generate_document', f'Generated {doc_type}')
 
-        return render_template('view_document.html', doc_type=doc_type, content=document, entities=entities)
+        return render_template('view_document.html', doc_type=doc_type, content=document, entities=entities,
+                               degraded_fields=degraded_fields)
     except Exception as e:
         import traceback
         error_message = f"Error generating document: {str(e)}"
@@ -529,25 +394,21 @@ def generate_from_prompt():
         return render_template('index.html')
 
     try:
-        # Extract language from prompt, default to 'en'
-        language_match = re.search(r'in\s+([a-zA-Z]+)', prompt)
-        language = language_match.group(1).lower() if language_match else 'en'
-
-        # Classify document type
-        doc_type = processor.classify_document_type(prompt)
-        if not doc_type:
+        # Classify document type, detect languages and extract entities (cached per normalized prompt).
+        # The output language is the one the prompt names, otherwise the language it is written in.
+        analysis = processor.analyze_prompt(prompt)
+        doc_type = analysis['document_type']
+        language = analysis['output_language']
+        if doc_type not in processor.document_types:
             flash('Could not determine document type from your prompt. Please try rephrasing.', 'error')
             return render_template('index.html')
-
-        # Extract entities
-        entities = processor.extract_entities(prompt)
+        entities = analysis['entities']
 
         # Generate document
         document = processor.generate_document(doc_type, entities, language=language)
 
         # Extract entities from generated document for display
-        doc_nlp = nlp(document)
-        extracted_entities = [(ent.text, ent.label_) for ent in doc_nlp.ents]
+        extracted_entities = processor.document_entities(document)
 
         # Log history
         if 'user_id' in session:
@@ -577,11 +438,11 @@ def api_process_prompt():
         if not prompt:
             return jsonify({'error': 'No prompt provided'}), 400
         
-        # Classify document type
-        doc_type = processor.classify_document_type(prompt)
-        
-        # Extract entities
-        entities = processor.extract_entities(prompt)
+        # Classify document type and extract entities (cached per normalized prompt)
+        analysis = processor.analyze_prompt(prompt)
+        doc_type = analysis['document_type']
+        confidence = analysis['confidence']
+        entities = analysis['entities']
         
         # Identify missing fields
         missing_fields = processor.identify_missing_fields(doc_type, entities)
@@ -589,6 +450,9 @@ def api_process_prompt():
         # Prepare response
         response = {
             'document_type': doc_type,
+            'confidence': confidence,
+            'language': analysis['language'],
+            'output_language': analysis['output_language'],
             'extracted_entities': entities,
             'missing_fields': missing_fields,
             'status': 'success'
@@ -599,6 +463,112 @@ def api_process_prompt():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+def _read_bulk_prompts():
+    """Read prompts from a JSON body (``{"prompts": [...]}`` or a bare list) or a JSONL stream"""
+    if request.is_json:
+        data = request.get_json()
+        if isinstance(data, list):
+            return data, request.args
+        if not isinstance(data, dict):
+            raise ValueError('the JSON body must be an object with "prompts" or a list of prompts')
+        return data.get('prompts', []), data
+    prompts = []
+    for line in request.get_data(as_text=True).splitlines():
+        if not line.strip():
+            continue
+        item = json.loads(line)
+        prompts.append(item.get('prompt', '') if isinstance(item, dict) else item)
+    return prompts, request.args
+
+@document_bp.route('/api/process-prompts', methods=['POST'])
+def api_process_prompts():
+    """Process many prompts in one request through ``nlp.pipe``"""
+    try:
+        prompts, options = _read_bulk_prompts()
+        if not isinstance(prompts, list) or not prompts:
+            return jsonify({'error': 'No prompts provided'}), 400
+        prompts = [prompt if isinstance(prompt, str) else '' for prompt in prompts]
+
+        max_processes = int(os.getenv('NLP_MAX_PROCESSES', '4'))
+        batch_size = int(options.get('batch_size', 0))
+        batch_size = max(1, batch_size) if batch_size else None
+        # spaCy reads -1 as "every CPU", so anything below 1 is clamped too
+        n_process = int(options.get('n_process', 0))
+        n_process = max(1, min(n_process, max_processes)) if n_process else None
+
+        started = time.perf_counter()
+        valid = [i for i, prompt in enumerate(prompts) if prompt.strip()]
+        analyses = processor.analyze_prompts([prompts[i] for i in valid], batch_size=batch_size, n_process=n_process)
+
+        results = [{'error': 'Empty prompt', 'status': 'error'} for _ in prompts]
+        for i, analysis in zip(valid, analyses):
+            doc_type = analysis['document_type']
+            results[i] = {
+                'document_type': doc_type,
+                'confidence': analysis['confidence'],
+                'language': analysis['language'],
+                'output_language': analysis['output_language'],
+                'extracted_entities': analysis['entities'],
+                'missing_fields': processor.identify_missing_fields(doc_type, analysis['entities']),
+                'status': 'success'
+            }
+        elapsed = time.perf_counter() - started
+
+        return jsonify({
+            'results': results,
+            'count': len(prompts),
+            'elapsed_seconds': round(elapsed, 4),
+            'prompts_per_second': round(len(prompts) / elapsed, 2) if elapsed else None,
+            'status': 'success'
+        })
+
+    except ValueError as e:
+        return jsonify({'error': f'Invalid bulk request: {str(e)}'}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@document_bp.route('/api/transcript/<session_id>', methods=['POST', 'DELETE'])
+def api_transcript_chunk(session_id):
+    """Extract incrementally from a streamed voice transcript chunk"""
+    if request.method == 'DELETE':
+        transcript_sessions.discard(session_id)
+        return jsonify({'status': 'success'})
+
+    try:
+        data = request.get_json() or {}
+        chunk = data.get('chunk', '')
+        if not isinstance(chunk, str):
+            return jsonify({'error': 'chunk must be a string'}), 400
+
+        session = transcript_sessions.get(session_id)
+        response = processor.extract_transcript_chunk(session, chunk)
+        if data.get('final'):
+            transcript_sessions.discard(session_id)
+            response['transcript'] = session.text
+        response['status'] = 'success'
+        return jsonify(response)
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@document_bp.route('/api/cache-stats', methods=['GET'])
+def api_cache_stats():
+    """Report hit/miss counters of the caches in this worker"""
+    return jsonify({
+        'extraction': processor.extraction_cache.stats(),
+        'templates': processor.document_generator.cache_stats(),
+        'custom_templates': custom_templates.stats(),
+        'transcript_sessions': transcript_sessions.stats(),
+        'translation_memory': get_translation_memory().stats(),
+        'translation_batches': batch_translator.stats(),
+        'translation_provider': get_translation_client().stats()
+    })
+
+@document_bp.route('/api/nlp-stats', methods=['GET'])
+def api_nlp_stats():
+    """Report load time and resident size of the spaCy pipelines in this worker"""
+    return jsonify(pipeline_stats())
+
 @document_bp.route('/api/generate-document', methods=['POST'])
 def api_generate_document():
     """Generate final document with all required data"""
@@ -613,110 +583,118 @@ def api_generate_document():
         if not doc_type or not filled_data:
             return jsonify({'error': 'Missing required data'}), 400
         
-        # Generate document content
+        # Generate document content; it is rendered in chunks as the response or exporter reads it
         if custom_template:
-            from jinja2 import Template
             try:
-                template = Template(custom_template)
-                document_content = template.render(**filled_data)
+                chunks = custom_templates.get_template(custom_template).generate(**filled_data)
+                # A broken custom template is the client's error: render it up front for the file formats
+                # and at least the first chunk for the streamed ones, so it is reported as a 400
+                chunks = _primed(chunks) if format_type in STREAMED_FORMATS else ''.join(chunks)
             except Exception as e:
                 return jsonify({'error': f'Error rendering custom template: {str(e)}'}), 400
         else:
             # Merge filled_data with default values for a complete document
-            complete_data = get_default_data_for_document(doc_type, language)
-            complete_data.update(filled_data)  # User data overrides defaults
-            document_content = processor.generate_document(doc_type, complete_data, language=language)
-        
+            complete_data = complete_document_data(doc_type, language, filled_data)
+            chunks = processor.stream_document(doc_type, complete_data, language=language)
+
         # Create file based on format
+        if format_type in STREAMED_FORMATS:
+            return _stream_document_response(chunks, doc_type, format_type)
         if format_type == 'docx':
-            return create_docx_file(document_content, doc_type)
+            return create_docx_file(chunks, doc_type)
         elif format_type == 'pdf':
-            return create_pdf_file(document_content, doc_type)
+            return create_pdf_file(chunks, doc_type)
         else:
             return jsonify({'error': 'Unsupported format'}), 400
     
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+def _primed(chunks):
+    """Render the first chunk now, so errors at the top of a template surface before the response starts"""
+    chunks = iter(chunks)
+    first = next(chunks, '')
+    return itertools.chain((first,), chunks)
+
+def _stream_document_response(chunks, doc_type, format_type):
+    """Send a document as it renders, as plain text or as escaped text in a minimal HTML page"""
+    if format_type == 'html':
+        title = escape(doc_type.replace('_', ' ').title())
+        chunks = itertools.chain(
+            (f'<!DOCTYPE html>\n<html><head><meta charset="utf-8"><title>{title}</title></head>'
+             f'<body><pre style="white-space: pre-wrap">',),
+            (str(escape(chunk)) for chunk in chunks),
+            ('</pre></body></html>\n',))
+    return Response(
+        chunks,
+        mimetype=STREAMED_FORMATS[format_type],
+        headers={'Content-Disposition': f'inline; filename="{download_name(doc_type, format_type)}"'}
+    )
+
+@document_bp.route('/api/generate-documents', methods=['POST'])
+def api_generate_documents():
+    """Mail merge: render one document per CSV/JSONL row and stream them back as a ZIP archive
+
+    Send the rows as a multipart ``rows`` file with ``document_type``, ``language`` and
+    ``format`` form fields, or as a raw CSV/JSONL body with those as query parameters.
+    """
+    try:
+        upload = request.files.get('rows')
+        options = request.form if upload else request.args
+        doc_type = options.get('document_type')
+        language = options.get('language', 'en')
+        format_type = options.get('format', 'docx')
+        if doc_type not in processor.document_types:
+            return jsonify({'error': f'Invalid document type: {doc_type}'}), 400
+        get_format(format_type)
+
+        if upload:
+            rows = read_rows(upload.read().decode('utf-8-sig'), rows_format(upload.filename, upload.mimetype))
+        else:
+            rows = read_rows(request.get_data(as_text=True), rows_format(None, request.mimetype))
+        if not rows:
+            return jsonify({'error': 'No rows provided'}), 400
+        max_rows = int(os.getenv('MAIL_MERGE_MAX_ROWS', '1000'))
+        if len(rows) > max_rows:
+            return jsonify({'error': f'Too many rows: {len(rows)} (limit {max_rows})'}), 400
+    except ValueError as e:
+        return jsonify({'error': f'Invalid mail merge request: {str(e)}'}), 400
+
+    results = merge_documents(rows, doc_type, language, format_type, processor.stream_document)
+    return Response(
+        stream_zip(results),
+        mimetype='application/zip',
+        headers={
+            'Content-Disposition': f'attachment; filename="{download_name(doc_type, "zip")}"',
+            'X-Mail-Merge-Rows': str(len(rows))
+        }
+    )
+
 def create_docx_file(content, doc_type):
     """Create DOCX file from content"""
     try:
-        doc = Document()
-        doc.add_heading(f'{doc_type.replace("_", " ").title()}', 0)
-        
-        # Add content
-        paragraphs = content.split('\n')
-        for para in paragraphs:
-            if para.strip():
-                doc.add_paragraph(para.strip())
-        
-        # Save to temporary file
-        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.docx')
-        doc.save(temp_file.name)
-        temp_file.close()
-        
-        from flask import send_file
-        from datetime import datetime
-        return send_file(
-            temp_file.name,
-            as_attachment=True,
-            download_name=f'{doc_type}_{datetime.now().strftime("%Y%m%d_%H%M%S")}.docx',
-            mimetype='application/vnd.openxmlformats-officedocument.wordprocessingml.document'
-        )
-    
+        return _send_export(content, doc_type, 'docx')
     except Exception as e:
         return jsonify({'error': f'Error creating DOCX: {str(e)}'}), 500
 
 def create_pdf_file(content, doc_type):
     """Create PDF file from content"""
     try:
-        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.pdf')
-        temp_path = temp_file.name
-        temp_file.close()
-
-        doc = SimpleDocTemplate(temp_path, pagesize=A4, leftMargin=54, rightMargin=54, topMargin=54, bottomMargin=54)
-        styles = getSampleStyleSheet()
-
-        body_style = ParagraphStyle(
-            name='Body',
-            parent=styles['Normal'],
-            fontSize=11,
-            leading=16,
-            alignment=TA_JUSTIFY,
-        )
-        title_style = ParagraphStyle(
-            name='Title',
-            parent=styles['Heading1'],
-            fontSize=18,
-            leading=22,
-            spaceAfter=12,
-        )
-
-        story = []
-        story.append(Paragraph(doc_type.replace('_', ' ').title(), title_style))
-        story.append(Spacer(1, 0.2 * inch))
-
-        # Convert plain text line breaks to simple paragraphs
-        for block in content.split('\n\n'):
-            block_html = block.strip().replace('\n', '<br/>')
-            if not block_html:
-                continue
-            story.append(Paragraph(block_html, body_style))
-            story.append(Spacer(1, 0.12 * inch))
-
-        doc.build(story)
-
-        from flask import send_file
-        from datetime import datetime
-        return send_file(
-            temp_path,
-            as_attachment=True,
-            download_name=f'{doc_type}_{datetime.now().strftime("%Y%m%d_%H%M%S")}.pdf',
-            mimetype='application/pdf'
-        )
+        return _send_export(content, doc_type, 'pdf')
     except Exception as e:
         return jsonify({'error': f'Error creating PDF: {str(e)}'}), 500
 
+def _send_export(content, doc_type, format_type):
+    """Send the exported document from memory, without a temporary file"""
+    from flask import send_file
+    export = get_format(format_type)
+    return send_file(
+        io.BytesIO(export.export(content, doc_type)),
+        as_attachment=True,
+        download_name=download_name(doc_type, export.extension),
+        mimetype=export.mimetype
+    )
+
 @document_bp.route('/edit_document', methods=['GET', 'POST'])
 def edit_document():
     doc_type = request.args.get('doc_type')
@@ -1,8 +1,9 @@
 """Main application routes."""
-from flask import render_template, session, flash
+from flask import render_template, session, flash, jsonify, current_app
 from . import main_bp
 from app.models.users import get_user_from_session
 from app.models.history import get_user_history
+from app.services.warmup import readiness
 
 @main_bp.route('/')
 def index():
@@ -18,3 +19,11 @@ def user_history():
     user = get_user_from_session(session)
     history = get_user_history(session['user_id'])
     return render_template('history.html', user=user, history=history)
+
+@main_bp.route('/readyz')
+def ready():
+    """Report what this worker has warmed; 503 until a preloaded app is warm."""
+    report = readiness()
+    report['mode'] = 'preload' if current_app.config.get('PRELOAD_APP') else 'lazy'
+    status = 200 if report['ready'] or report['mode'] == 'lazy' else 503
+    return jsonify(report), status
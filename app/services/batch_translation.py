@@ -0,0 +1,99 @@
+"""Pack many short field values into as few provider requests as possible.
+
+Values are joined with a newline, which machine translation providers keep
+as a line break, and split again after translation. A batch is only trusted
+when it comes back with exactly as many lines as were sent; otherwise its
+values are translated one by one so a result is never attached to the wrong
+field.
+"""
+import os
+import threading
+from typing import Callable, Iterable, List, Optional
+
+DELIMITER = '\n'
+
+# MyMemory rejects queries longer than 500 bytes; leave room for the delimiters' encoding
+DEFAULT_MAX_BYTES = 480
+
+
+def max_batch_bytes() -> int:
+    return int(os.getenv('TRANSLATION_BATCH_BYTES', str(DEFAULT_MAX_BYTES)))
+
+
+def pack_values(values: Iterable[str], max_bytes: Optional[int] = None) -> List[List[str]]:
+    """Group ``values`` into batches whose joined UTF-8 size stays within ``max_bytes``.
+
+    Values that contain the delimiter, or are too long to share a request,
+    get a batch of their own.
+    """
+    max_bytes = max_bytes or max_batch_bytes()
+    batches: List[List[str]] = []
+    current: List[str] = []
+    size = 0
+    for value in values:
+        length = len(value.encode('utf-8'))
+        if DELIMITER in value or length >= max_bytes:
+            batches.append([value])
+            continue
+        added = length + (len(DELIMITER) if current else 0)
+        if current and size + added > max_bytes:
+            batches.append(current)
+            current, size = [], 0
+            added = length
+        current.append(value)
+        size += added
+    if current:
+        batches.append(current)
+    return batches
+
+
+class BatchTranslator:
+    """Translates lists of values through a single-text ``request`` function.
+
+    ``request(text, target_lang)`` performs one provider call and returns the
+    translation, or ``None`` when the provider failed.
+    """
+
+    def __init__(self, request: Callable[[str, str], Optional[str]], max_bytes: Optional[int] = None):
+        self.request = request
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.values = 0
+        self.fallbacks = 0
+
+    def _call(self, text: str, target_lang: str) -> Optional[str]:
+        with self._lock:
+            self.requests += 1
+        return self.request(text, target_lang)
+
+    def translate(self, values: List[str], target_lang: str) -> List[Optional[str]]:
+        """Return one translation (or ``None`` on failure) per value, in order."""
+        results: List[Optional[str]] = []
+        for batch in pack_values(values, self.max_bytes):
+            with self._lock:
+                self.values += len(batch)
+            if len(batch) == 1:
+                results.append(self._call(batch[0], target_lang))
+                continue
+            translated = self._call(DELIMITER.join(batch), target_lang)
+            if translated is None:
+                results.extend([None] * len(batch))
+                continue
+            lines = translated.split(DELIMITER)
+            if len(lines) == len(batch):
+                results.extend(line.strip() for line in lines)
+                continue
+            # The provider merged or split lines; translate this batch value by value
+            with self._lock:
+                self.fallbacks += 1
+            results.extend(self._call(value, target_lang) for value in batch)
+        return results
+
+    def stats(self):
+        return {
+            'requests': self.requests,
+            'values': self.values,
+            'fallback_batches': self.fallbacks,
+            'values_per_request': round(self.values / self.requests, 2) if self.requests else None,
+        }
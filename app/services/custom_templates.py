@@ -0,0 +1,48 @@
+"""Compiled-template cache for template bodies sent with API requests.
+
+Clients of ``/api/generate-document`` send the same custom template body
+again and again. Bodies are keyed by their SHA-256. Each one is parsed and
+compiled once and then kept in a bounded LRU, separate from the shipped
+templates cached by ``DocumentGenerator``. User-supplied templates are
+untrusted, so they are compiled in a ``SandboxedEnvironment``. Unsafe
+attribute access raises ``jinja2.sandbox.SecurityError`` at render time.
+"""
+import hashlib
+import os
+from typing import Any, Dict, Mapping, Optional
+
+from jinja2 import Template
+from jinja2.sandbox import SandboxedEnvironment
+
+from app.services.extraction_cache import LRUCache
+
+
+def template_key(source: str) -> str:
+    return hashlib.sha256(source.encode('utf-8')).hexdigest()
+
+
+class CustomTemplateCache(LRUCache):
+    """LRU of sandbox-compiled templates keyed by the hash of their source."""
+
+    def __init__(self, maxsize: Optional[int] = None):
+        super().__init__(maxsize=maxsize or int(os.getenv('CUSTOM_TEMPLATE_CACHE_SIZE', '128')), ttl=None)
+        self.env = SandboxedEnvironment()
+        self.compiled = 0
+
+    def get_template(self, source: str) -> Template:
+        """Return the compiled template for ``source``; syntax errors propagate and are not cached."""
+        key = template_key(source)
+        template = self.get(key)
+        if template is None:
+            template = self.env.from_string(source)
+            self.compiled += 1
+            self.set(key, template)
+        return template
+
+    def render(self, source: str, data: Mapping[str, Any]) -> str:
+        return self.get_template(source).render(**data)
+
+    def stats(self) -> Dict[str, Any]:
+        stats = super().stats()
+        stats['compiled'] = self.compiled
+        return stats
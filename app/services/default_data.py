@@ -0,0 +1,233 @@
+"""Default values used to complete partially filled documents.
+
+The defaults and their per-language phrase translations are compiled once
+into immutable tables per (document type, language). Only the date-derived
+values depend on the clock; they are recomputed when the day changes and the
+tables are rebuilt at that point, so a lookup is a dictionary access.
+"""
+import threading
+from datetime import date, datetime
+from types import MappingProxyType
+from typing import Dict, Mapping, Tuple
+
+from app.services.number_words import fill_amount_words
+
+COMMON_DEFAULTS = {
+    'execution_place': 'Chennai',
+    'witness1_name': 'Mr. Witness One',
+    'witness1_address': 'No. 123, Main Street, Chennai - 600001',
+    'witness2_name': 'Mr. Witness Two',
+    'witness2_address': 'No. 456, Second Street, Chennai - 600002',
+    'jurisdiction': 'Chennai',
+    'registration_office': 'Chennai',
+    'stamp_duty_bearer': 'Vendee'
+}
+
+DOCUMENT_DEFAULTS = {
+    'rental_agreement': {
+        'owner_age': '45',
+        'renter_age': '35',
+        'owner_father': 'Father Name',
+        'renter_father': 'Father Name',
+        'owner_address': 'No. 123, Main Street',
+        'owner_city': 'Chennai',
+        'owner_pincode': '600001',
+        'renter_address': 'No. 456, Second Street',
+        'renter_city': 'Chennai',
+        'renter_pincode': '600002',
+        'property_address': 'No. 789, Property Street',
+        'property_city': 'Chennai',
+        'property_pincode': '600073',
+        'start_date': '1st April 2024',
+        'effective_date': '1st April 2024',
+        'duration': '11',
+        'renewal_period': '11',
+        'rent_amount': '15,000',
+        'rent_amount_words': 'Fifteen Thousand',
+        'rent_due_date': '1st',
+        'rent_increase_percentage': '10',
+        'security_deposit': '30,000',
+        'security_deposit_words': 'Thirty Thousand',
+        'notice_period': '2'
+    },
+    'land_sale_deed': {
+        'seller_age': '50',
+        'buyer_age': '40',
+        'seller_father': 'Father Name',
+        'buyer_father': 'Father Name',
+        'seller_address': 'No. 123, Main Street',
+        'seller_city': 'Chennai',
+        'seller_pincode': '600001',
+        'buyer_address': 'No. 456, Second Street',
+        'buyer_city': 'Chennai',
+        'buyer_pincode': '600002',
+        'property_address': 'No. 789, Property Street',
+        'property_city': 'Chennai',
+        'property_pincode': '600073',
+        'sale_amount': '50,00,000',
+        'sale_amount_words': 'Fifty Lakhs',
+        'sale_date': '1st April 2024',
+        'survey_number': '123/45',
+        'area': '2400',
+        'north_boundary': 'Main Road',
+        'south_boundary': 'Residential Area',
+        'east_boundary': 'Park',
+        'west_boundary': 'Commercial Area'
+    },
+    'power_of_attorney': {
+        'principal_age': '55',
+        'attorney_age': '40',
+        'principal_father': 'Father Name',
+        'attorney_father': 'Father Name',
+        'principal_address': 'No. 123, Main Street',
+        'principal_city': 'Chennai',
+        'principal_pincode': '600001',
+        'attorney_address': 'No. 456, Second Street',
+        'attorney_city': 'Chennai',
+        'attorney_pincode': '600002',
+        'matter_description': 'property management and legal representation',
+        'effective_date': '1st April 2024',
+        'expiry_date': '31st March 2025'
+    },
+    'house_lease': {
+        'lessor_age': '50',
+        'lessee_age': '35',
+        'lessor_father': 'Father Name',
+        'lessee_father': 'Father Name',
+        'lessor_address': 'No. 123, Main Street',
+        'lessor_city': 'Chennai',
+        'lessor_pincode': '600001',
+        'lessee_address': 'No. 456, Second Street',
+        'lessee_city': 'Chennai',
+        'lessee_pincode': '600002',
+        'property_address': 'No. 789, Property Street',
+        'property_city': 'Chennai',
+        'property_pincode': '600073',
+        'lease_period': '2',
+        'start_date': '1st April 2024',
+        'end_date': '31st March 2026',
+        'lease_amount': '25,000',
+        'lease_amount_words': 'Twenty Five Thousand',
+        'rent_due_date': '1st',
+        'security_deposit': '50,000',
+        'security_deposit_words': 'Fifty Thousand',
+        'notice_period': '3',
+        'number_of_rooms': '3'
+    }
+}
+
+# Default phrases replaced with their translation in each language
+PHRASE_TRANSLATIONS = {
+    'en': {
+        'Father Name': 'Father Name',
+        'Mr. Witness One': 'Mr. Witness One',
+        'Chennai': 'Chennai'
+    },
+    'hi': {
+        'Father Name': 'अपने पिता का नाम',
+        'Mr. Witness One': 'श्री विजय एक',
+        'Chennai': 'चेन्नई'
+    },
+    'bn': {
+        'Father Name': 'আমার পিতার নাম',
+        'Mr. Witness One': 'শ্রী বিজয় এক',
+        'Chennai': 'চেন্নাই'
+    },
+    'te': {
+        'Father Name': 'నా పిల్లి పేరు',
+        'Mr. Witness One': 'శ్రీ విజయ ఒక',
+        'Chennai': 'చెన్నై'
+    },
+    'mr': {
+        'Father Name': 'माझा वडील यांचा नाव',
+        'Mr. Witness One': 'श्री విజయ एक',
+        'Chennai': 'चेन्नई'
+    },
+    'ur': {
+        'Father Name': 'میرے والد کا نام',
+        'Mr. Witness One': 'شری ویجی ہے',
+        'Chennai': 'چینనాی'
+    },
+    'gu': {
+        'Father Name': 'માઝા પિતાનું નામ',
+        'Mr. Witness One': 'શ્રી વિજય એક',
+        'Chennai': 'ચેન્નઈ'
+    },
+    'kn': {
+        'Father Name': 'ನನ್ನ ಪಿತಾನ ಹೆಸರು',
+        'Mr. Witness One': 'ಶ್ರೀ ವಿಜಯ ಒಂದು',
+        'Chennai': 'ಚೆನ್ನಾಯ'
+    },
+    'or': {
+        'Father Name': 'ଆମଦ୍ବାରା ପିତାଙ୍କ ନାମ',
+        'Mr. Witness One': 'ଶ୍ରୀ ବିଜଯ଼ ଏକ',
+        'Chennai': 'ଚେନ୍ନାଇ'
+    },
+    'ta': {
+        'Father Name': 'என் தந்தை பெயர்',
+        'Mr. Witness One': 'சிறுவர் விஜய் ஒன்று',
+        'Chennai': 'சென்னை'
+    }
+}
+
+LANGUAGES = tuple(PHRASE_TRANSLATIONS)
+
+_lock = threading.Lock()
+_tables: Dict[Tuple[str, str], Mapping[str, str]] = {}
+_tables_day = None
+
+
+def _date_defaults(today: datetime) -> Dict[str, str]:
+    return {
+        'date': today.strftime('%B %d, %Y'),
+        'month': today.strftime('%B'),
+        'year': today.strftime('%Y'),
+        'execution_date': today.strftime('%d/%m/%Y'),
+    }
+
+
+def _translate_phrases(values: Dict[str, str], language: str) -> Dict[str, str]:
+    phrases = PHRASE_TRANSLATIONS.get(language, {})
+    return {key: phrases.get(value, phrases.get(value.lower(), value)) for key, value in values.items()}
+
+
+def _compile(today: datetime) -> Dict[Tuple[str, str], Mapping[str, str]]:
+    dated = _date_defaults(today)
+    tables = {}
+    for doc_type in (None,) + tuple(DOCUMENT_DEFAULTS):
+        values = dict(dated, **COMMON_DEFAULTS, **DOCUMENT_DEFAULTS.get(doc_type, {}))
+        for language in LANGUAGES:
+            tables[(doc_type, language)] = MappingProxyType(_translate_phrases(values, language))
+    return tables
+
+
+def get_default_data_for_document(doc_type: str, language: str) -> Mapping[str, str]:
+    """Return the read-only default data for ``doc_type`` in ``language``.
+
+    Unknown document types get the common defaults only; unknown languages
+    get the untranslated ones. Copy the mapping before changing it.
+    """
+    global _tables, _tables_day
+    today = date.today()
+    if _tables_day != today:
+        with _lock:
+            if _tables_day != today:
+                _tables = _compile(datetime.now())
+                _tables_day = today
+    tables = _tables
+    key = (doc_type if doc_type in DOCUMENT_DEFAULTS else None, language if language in LANGUAGES else 'en')
+    return tables[key]
+
+
+def complete_document_data(doc_type: str, language: str, filled_data: Mapping[str, str]) -> Dict[str, str]:
+    """Return the defaults for ``doc_type`` overridden by ``filled_data``.
+
+    The default amount words describe the default amounts. They are blanked
+    and spelled out again from the actual amounts; in English, words given in
+    ``filled_data`` are kept.
+    """
+    data = {key: '' if key.endswith('_words') else value
+            for key, value in get_default_data_for_document(doc_type, language).items()}
+    data.update(filled_data)
+    fill_amount_words(data, language, keep_given=(language == 'en'))
+    return data
@@ -0,0 +1,135 @@
+"""Document-type classification with an Aho-Corasick keyword automaton.
+
+All registered keywords and phrases of all document types are compiled into
+one automaton, so a prompt is classified in a single pass over its characters
+regardless of how many types or keywords are registered.
+"""
+from collections import deque
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple, Union
+
+UNKNOWN = 'unknown'
+
+
+class Classification(NamedTuple):
+    doc_type: str
+    confidence: float
+    scores: Dict[str, float]
+
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton over lowercase keywords.
+
+    Each keyword carries a payload; ``find`` reports the payload of every
+    keyword occurrence that starts at a word boundary.
+    """
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Tuple[int, object]]] = [[]]
+        self._built = True
+
+    def add(self, keyword: str, payload) -> None:
+        keyword = keyword.lower()
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = next_state
+        self._out[state].append((len(keyword), payload))
+        self._built = False
+
+    def build(self) -> None:
+        """Compute failure links breadth-first and merge their outputs."""
+        queue = deque(self._goto[0].values())
+        for state in queue:
+            self._fail[state] = 0
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                self._out[next_state] = self._out[next_state] + self._out[self._fail[next_state]]
+        self._built = True
+
+    def find(self, text: str):
+        """Yield ``(start, payload)`` for each keyword occurrence in ``text``."""
+        if not self._built:
+            self.build()
+        goto, fail, out = self._goto, self._fail, self._out
+        text = text.lower()
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for length, payload in out[state]:
+                start = index - length + 1
+                if start == 0 or not text[start - 1].isalnum():
+                    yield start, payload
+
+
+class DocumentClassifier:
+    """Weighted keyword classifier over registered document types."""
+
+    def __init__(self):
+        self._automaton = KeywordAutomaton()
+        self._types: List[str] = []
+        self._keywords: List[Tuple[str, float]] = []
+
+    def register(self, doc_type: str, keywords: Union[Iterable[str], Dict[str, float]]) -> None:
+        """Register ``keywords`` (a list, weight 1 each, or a ``{phrase: weight}`` dict) for ``doc_type``."""
+        if doc_type not in self._types:
+            self._types.append(doc_type)
+        weighted = keywords.items() if isinstance(keywords, dict) else ((keyword, 1.0) for keyword in keywords)
+        for keyword, weight in weighted:
+            self._automaton.add(keyword, len(self._keywords))
+            self._keywords.append((doc_type, float(weight)))
+
+    @property
+    def document_types(self) -> List[str]:
+        return list(self._types)
+
+    def classify(self, prompt: str) -> Classification:
+        """Score every type by the weights of the distinct keywords found in ``prompt``.
+
+        Returns ``UNKNOWN`` with confidence 0 when nothing matches; otherwise the
+        confidence is the best type's share of the total matched weight.
+        """
+        return self.score(self.matched_keywords(prompt))
+
+    def matched_keywords(self, text: str) -> Set[int]:
+        """Return the ids of the distinct keywords found in ``text``.
+
+        Sets from overlapping pieces of a longer text can be unioned and passed
+        to ``score``, which lets transcripts be classified chunk by chunk.
+        """
+        return {keyword_id for _, keyword_id in self._automaton.find(text)}
+
+    def score(self, matched: Set[int]) -> Classification:
+        """Classify from a set of matched keyword ids."""
+        scores: Dict[str, float] = {}
+        for keyword_id in matched:
+            doc_type, weight = self._keywords[keyword_id]
+            scores[doc_type] = scores.get(doc_type, 0.0) + weight
+
+        if not scores:
+            return Classification(UNKNOWN, 0.0, {})
+
+        # Ties go to the type registered first
+        best = max(self._types, key=lambda doc_type: scores.get(doc_type, 0.0))
+        confidence = scores[best] / sum(scores.values())
+        return Classification(best, round(confidence, 3), scores)
+
+    def best_type(self, prompt: str) -> Optional[str]:
+        """Return the best document type, or ``None`` when the prompt matches nothing."""
+        result = self.classify(prompt)
+        return None if result.doc_type == UNKNOWN else result.doc_type
@@ -1,12 +1,80 @@
+"""Document rendering from the shipped and custom Jinja templates.
+
+Compiled templates are cached per ``(doc_type, language, custom template)``
+together with a fingerprint (mtime and size) of their source file, so
+resolving a template on the hot path is a dictionary lookup. With
+``TEMPLATE_AUTO_RELOAD=1`` the fingerprint is re-checked on every lookup and
+changed files are recompiled; otherwise files are only re-read after
+``invalidate``.
+
+Compiled bytecode is also written to an on-disk Jinja bytecode cache
+(``TEMPLATE_BYTECODE_CACHE_DIR``, default ``instance/jinja_bytecode``) that
+all workers share. A worker that has not seen a template yet loads its
+bytecode instead of parsing and compiling it; ``scripts/precompile_templates.py``
+fills the cache ahead of a deploy.
+
+``stream_document`` renders with Jinja's ``generate`` instead of ``render``.
+The document is produced in chunks and is never held as one string.
+"""
 from datetime import datetime
 import os
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 from jinja2 import Template, Environment
+from jinja2.bccache import FileSystemBytecodeCache
 from jinja2.loaders import FileSystemLoader
 
+from app.services.extraction_cache import LRUCache
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_BYTECODE_CACHE_DIR = os.path.join(PROJECT_ROOT, 'instance', 'jinja_bytecode')
+# Rendered pieces are joined into chunks of at least this many characters when streaming
+STREAM_CHUNK_CHARS = 8192
+
+TEMPLATE_FILES = {
+    'house_lease': 'house_lease_template.txt',
+    'power_of_attorney': 'power_of_attorney_template.txt',
+    'land_sale_deed': 'land_sale_deed_template.txt',
+    'rental_agreement': 'rental_agreement_template.txt'
+}
+
+
+def _fingerprint(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _bytecode_cache(directory: str) -> Optional[FileSystemBytecodeCache]:
+    """Shared on-disk bytecode cache in ``directory``; ``off`` disables it."""
+    if directory.lower() in ('', '0', 'off', 'none'):
+        return None
+    try:
+        os.makedirs(directory, exist_ok=True)
+    except OSError:
+        return None  # read-only deployment: compile in memory as before
+    # Writes go through a temporary file and a rename, so workers never read half a file
+    return FileSystemBytecodeCache(directory, pattern='legal-docs-%s.cache')
+
+
+def coalesce(chunks: Iterable[str], size: int = STREAM_CHUNK_CHARS) -> Iterator[str]:
+    """Join the small pieces ``generate`` yields into chunks of at least ``size`` characters."""
+    buffer: List[str] = []
+    length = 0
+    for chunk in chunks:
+        buffer.append(chunk)
+        length += len(chunk)
+        if length >= size:
+            yield ''.join(buffer)
+            buffer, length = [], 0
+    if buffer:
+        yield ''.join(buffer)
+
+
 class DocumentGenerator:
-    def __init__(self):
-        self.base_template_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'templates')
+    def __init__(self, bytecode_cache_dir: Optional[str] = None):
+        self.base_template_dir = os.path.join(PROJECT_ROOT, 'templates')
         self.custom_template_dir = os.path.join(self.base_template_dir, 'custom')
         self.ta_template_dir = os.path.join(self.base_template_dir, 'ta')
         
@@ -14,11 +82,19 @@ class DocumentGenerator:
         os.makedirs(self.custom_template_dir, exist_ok=True)
         os.makedirs(os.path.join(self.custom_template_dir, 'versions'), exist_ok=True)
 
+        self.auto_reload = os.getenv('TEMPLATE_AUTO_RELOAD', '0').lower() in ('1', 'true', 'yes')
+        self.bytecode_cache = _bytecode_cache(
+            bytecode_cache_dir or os.getenv('TEMPLATE_BYTECODE_CACHE_DIR', DEFAULT_BYTECODE_CACHE_DIR))
         self.env = Environment(
             loader=FileSystemLoader(self.base_template_dir),
             trim_blocks=False,
-            lstrip_blocks=False
+            lstrip_blocks=False,
+            auto_reload=self.auto_reload,
+            bytecode_cache=self.bytecode_cache
         )
+        # (doc_type, language, custom_template) -> (source path, fingerprint, compiled template)
+        self._template_cache = LRUCache(maxsize=int(os.getenv('TEMPLATE_CACHE_SIZE', '256')), ttl=None)
+        self.template_reloads = 0
 
     def get_required_fields(self, doc_type: str) -> Dict[str, str]:
         """Get the required fields for a document type."""
@@ -63,43 +139,101 @@ class DocumentGenerator:
         return missing_fields
 
     def _load_template(self, doc_type: str, language: str = 'en', custom_template: Optional[str] = None) -> Template:
-        """Load the template file for the given document type and language."""
+        """Return the compiled template for the given document type and language."""
+        key = (doc_type, language, custom_template)
+        entry = self._template_cache.get(key)
+        if entry is not None:
+            path, fingerprint, template = entry
+            if not self.auto_reload or _fingerprint(path) == fingerprint:
+                return template
+            self.template_reloads += 1
+
+        path = self._template_path(doc_type, language, custom_template)
+        # Fingerprint before compiling, so a change made while compiling is picked up next time
+        fingerprint = _fingerprint(path)
+        if custom_template:
+            with open(path, 'r', encoding='utf-8') as f:
+                template = self.env.from_string(f.read())
+        else:
+            try:
+                template = self.env.get_template(self._template_name(path))
+            except Exception:
+                # A broken language-specific template falls back to the base one; the cache keeps
+                # the language file's fingerprint so fixing it is picked up on reload
+                base_name = TEMPLATE_FILES[doc_type]
+                if self._template_name(path) == base_name:
+                    raise
+                template = self.env.get_template(base_name)
+        self._template_cache.set(key, (path, fingerprint, template))
+        return template
+
+    def _template_path(self, doc_type: str, language: str, custom_template: Optional[str]) -> str:
+        """Resolve the source file: a custom template, the language-specific one, or the base one."""
         if custom_template:
             template_path = os.path.join(self.custom_template_dir, custom_template)
             if not os.path.exists(template_path):
                 raise ValueError(f"Custom template not found: {custom_template}")
-            with open(template_path, 'r', encoding='utf-8') as f:
-                return self.env.from_string(f.read())
-
-        template_map = {
-            'house_lease': 'house_lease_template.txt',
-            'power_of_attorney': 'power_of_attorney_template.txt',
-            'land_sale_deed': 'land_sale_deed_template.txt',
-            'rental_agreement': 'rental_agreement_template.txt'
-        }
+            return template_path
 
-        if doc_type not in template_map:
+        if doc_type not in TEMPLATE_FILES:
             raise ValueError(f"Invalid document type: {doc_type}")
 
-        template_file_name = template_map[doc_type]
-        
-        # Use language subdirectory if exists, else fallback to base_template_dir
-        template_dir = os.path.join(self.base_template_dir, language)
-        template_full_path_lang = os.path.join(template_dir, template_file_name)
-        template_relative_path_lang = os.path.join(language, template_file_name).replace(os.sep, '/')
-        template_relative_path_base = template_file_name
-
-        # Try loading language-specific template first
-        if os.path.exists(template_full_path_lang): # Check if the language-specific file exists
-            try:
-                print(f"Attempting to load language-specific template: {template_relative_path_lang}")
-                return self.env.get_template(template_relative_path_lang)
-            except Exception as e:
-                print(f"Error loading language-specific template '{template_relative_path_lang}': {e}. Falling back to base template.")
-                return self.env.get_template(template_relative_path_base)
-        else:
-            print(f"Language-specific template file not found at '{template_full_path_lang}'. Falling back to base template.")
-            return self.env.get_template(template_relative_path_base)
+        template_file_name = TEMPLATE_FILES[doc_type]
+        template_full_path_lang = os.path.join(self.base_template_dir, language, template_file_name)
+        if os.path.exists(template_full_path_lang):
+            return template_full_path_lang
+        return os.path.join(self.base_template_dir, template_file_name)
+
+    def _template_name(self, path: str) -> str:
+        return os.path.relpath(path, self.base_template_dir).replace(os.sep, '/')
+
+    def invalidate(self, doc_type: Optional[str] = None, language: Optional[str] = None,
+                   custom_template: Optional[str] = None) -> int:
+        """Drop cached templates matching the given filters (all of them by default) and return how many.
+
+        Call this after template files change when ``TEMPLATE_AUTO_RELOAD`` is off.
+        """
+        dropped = 0
+        for key in self._template_cache.keys():
+            cached_type, cached_language, cached_custom = key
+            if ((doc_type is None or cached_type == doc_type)
+                    and (language is None or cached_language == language)
+                    and (custom_template is None or cached_custom == custom_template)):
+                self._template_cache.pop(key)
+                dropped += 1
+        # Jinja keeps its own compiled copies, which are not re-checked without auto reload
+        self.env.cache.clear()
+        return dropped
+
+    def cache_stats(self) -> Dict[str, Any]:
+        stats = self._template_cache.stats()
+        stats['reloads'] = self.template_reloads
+        stats['auto_reload'] = self.auto_reload
+        stats['bytecode_cache_dir'] = self.bytecode_cache.directory if self.bytecode_cache else None
+        return stats
+
+    def iter_template_names(self) -> List[str]:
+        """List every shipped document template, including language subfolders."""
+        names = []
+        for root, dirs, files in os.walk(self.base_template_dir):
+            dirs[:] = sorted(d for d in dirs if d != 'custom')
+            for file_name in sorted(files):
+                if file_name.endswith('.txt'):
+                    rel_path = os.path.relpath(os.path.join(root, file_name), self.base_template_dir)
+                    names.append(rel_path.replace(os.sep, '/'))
+        return names
+
+    def iter_languages(self) -> List[str]:
+        """Languages with a template subfolder, plus the base ``en``."""
+        return ['en'] + sorted(entry.name for entry in os.scandir(self.base_template_dir)
+                               if entry.is_dir() and entry.name not in ('custom', 'en'))
+
+    def precompile_templates(self) -> int:
+        """Compile every (document type, language) template up front and return how many were cached."""
+        for doc_type in TEMPLATE_FILES:
+            for language in self.iter_languages():
+                self._load_template(doc_type, language)
+        return len(self._template_cache)
 
     def save_custom_template(self, filename: str, content: str) -> str:
         """Save a custom template and return its filename."""
@@ -161,6 +295,17 @@ class DocumentGenerator:
         
         return document
 
+    def stream_document(self, doc_type: str, data: Dict, language: str = 'en') -> Iterator[str]:
+        """Render a document incrementally; yields text chunks of about ``STREAM_CHUNK_CHARS``.
+
+        The template is resolved (and an invalid ``doc_type`` rejected) before
+        this returns. Rendering errors surface while the chunks are consumed.
+        """
+        template = self._load_template(doc_type, language)
+        data_with_date = data.copy()
+        data_with_date['date'] = datetime.now().strftime("%B %d, %Y")
+        return coalesce(template.generate(**data_with_date))
+
     def generate_document(self, doc_type, data, language='en'):
         """Generate a document based on the type and data provided."""
         generators = {
@@ -0,0 +1,91 @@
+"""Rule-based named entity pipeline (tokenizer + gazetteer + cue matcher).
+
+Used as the cheap ``rules`` extraction mode. It needs no statistical model:
+places come from a gazetteer, people from honorifics ("Mr. Ramesh Kumar")
+and from capitalised words following a party cue ("between Anjali and Rohit").
+"""
+from typing import Iterable
+
+CITY_GAZETTEER = (
+    'Agra', 'Ahmedabad', 'Allahabad', 'Amritsar', 'Aurangabad', 'Bangalore', 'Bengaluru', 'Bhopal',
+    'Bhubaneswar', 'Chandigarh', 'Chennai', 'Coimbatore', 'Cuttack', 'Dehradun', 'Delhi', 'Dhanbad',
+    'Faridabad', 'Ghaziabad', 'Goa', 'Gurgaon', 'Gurugram', 'Guwahati', 'Gwalior', 'Howrah', 'Hubli',
+    'Hyderabad', 'Indore', 'Jabalpur', 'Jaipur', 'Jalandhar', 'Jodhpur', 'Kanpur', 'Kochi', 'Kolkata',
+    'Kota', 'Kozhikode', 'Lucknow', 'Ludhiana', 'Madurai', 'Mangalore', 'Meerut', 'Mumbai', 'Mysore',
+    'Mysuru', 'Nagpur', 'Nashik', 'Navi Mumbai', 'New Delhi', 'Noida', 'Patna', 'Puducherry', 'Pune',
+    'Raipur', 'Rajkot', 'Ranchi', 'Salem', 'Srinagar', 'Surat', 'Thane', 'Thiruvananthapuram',
+    'Tiruchirappalli', 'Tirunelveli', 'Trichy', 'Udaipur', 'Vadodara', 'Varanasi', 'Vijayawada',
+    'Visakhapatnam', 'Warangal',
+    'Andhra Pradesh', 'Assam', 'Bihar', 'Gujarat', 'Haryana', 'Karnataka', 'Kerala', 'Madhya Pradesh',
+    'Maharashtra', 'Odisha', 'Punjab', 'Rajasthan', 'Tamil Nadu', 'Telangana', 'Uttar Pradesh',
+    'West Bengal', 'India',
+)
+
+HONORIFICS = ('mr', 'mr.', 'mrs', 'mrs.', 'ms', 'ms.', 'dr', 'dr.', 'shri', 'sri', 'smt', 'smt.', 'kumari', 'thiru')
+
+PERSON_CUES = (
+    'between', 'and', 'from', 'to', 'by', 'landlord', 'tenant', 'owner', 'renter', 'seller', 'buyer',
+    'vendor', 'vendee', 'lessor', 'lessee', 'principal', 'attorney',
+)
+
+# Capitalised words that commonly follow a cue but never start a name
+NON_NAME_WORDS = (
+    'rs', 'rs.', 'inr', 'rupees', 'january', 'february', 'march', 'april', 'may', 'june', 'july',
+    'august', 'september', 'october', 'november', 'december', 'the', 'a', 'an', 'this', 'my',
+)
+
+MAX_NAME_TOKENS = 3
+
+RULE_NER_COMPONENT = 'legal_cue_persons'
+
+
+def _gazetteer_patterns(places: Iterable[str]):
+    return [{'label': 'GPE', 'pattern': [{'LOWER': part.lower()} for part in place.split()]} for place in places]
+
+
+def _honorific_patterns():
+    return [{'label': 'PERSON', 'pattern': [{'LOWER': honorific}, {'IS_TITLE': True, 'OP': '+'}]}
+            for honorific in HONORIFICS]
+
+
+def _cue_persons(doc):
+    """Tag runs of capitalised words that follow a party cue as PERSON."""
+    from spacy.tokens import Span
+    from spacy.util import filter_spans
+
+    places = {place.lower() for place in CITY_GAZETTEER}
+    cues = set(PERSON_CUES)
+    non_names = set(NON_NAME_WORDS)
+
+    def is_name_token(token):
+        return token.is_title and token.ent_type_ == '' and token.lower_ not in non_names
+
+    spans = list(doc.ents)
+    i = 0
+    while i < len(doc) - 1:
+        if doc[i].lower_ in cues and is_name_token(doc[i + 1]):
+            end = i + 1
+            while end < len(doc) and end - i <= MAX_NAME_TOKENS and is_name_token(doc[end]):
+                end += 1
+            if doc[i + 1:end].text.lower() not in places:
+                spans.append(Span(doc, i + 1, end, label='PERSON'))
+            i = end
+        else:
+            i += 1
+    doc.ents = filter_spans(spans)
+    return doc
+
+
+def build_rule_pipeline(lang: str = 'en'):
+    """Build a blank ``lang`` pipeline with the gazetteer ruler and cue matcher."""
+    import spacy
+    from spacy.language import Language
+
+    if not Language.has_factory(RULE_NER_COMPONENT):
+        Language.component(RULE_NER_COMPONENT, func=_cue_persons)
+
+    nlp = spacy.blank(lang)
+    ruler = nlp.add_pipe('entity_ruler')
+    ruler.add_patterns(_gazetteer_patterns(CITY_GAZETTEER) + _honorific_patterns())
+    nlp.add_pipe(RULE_NER_COMPONENT, after='entity_ruler')
+    return nlp
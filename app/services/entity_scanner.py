@@ -0,0 +1,81 @@
+"""Single-pass scanner for amounts, dates, durations, pincodes and ages.
+
+All patterns are compiled once into one alternation with named groups, so a
+prompt is scanned exactly once and every match is reported (not just the
+first one) as a typed, position-tagged ``EntitySpan``.
+
+Only numbers with a currency marker are ``amount`` spans. Other large numbers
+come out as ``number`` spans, and ``assign_roles`` treats them as amounts
+only after an amount cue ("rent 15000"). A duration's value is its number and
+unit ("2 year").
+"""
+import re
+from typing import List, NamedTuple
+
+MONTHS = (r'Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?'
+          r'|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?')
+
+# Order matters: at a given position the first alternative that matches wins,
+# so the more specific shapes (dates, ages) come before plain numbers.
+_PATTERNS = (
+    ('date', r'\b\d{1,2}[-/]\d{1,2}[-/]\d{4}\b'
+             r'|\b\d{1,2}(?:st|nd|rd|th)?\s+(?:' + MONTHS + r')\s+\d{4}\b'),
+    ('age', r'\baged?\s+(?:about\s+)?(?P<age_value>\d{1,3})\b'
+            r'|\b(?P<age_value_b>\d{1,3})\s*(?:years?|yrs?)\s+old\b'),
+    ('duration', r'\b(?P<duration_value>\d+)\s*(?P<duration_unit>year|month|week|day)s?\b'),
+    ('pincode', r'\bpin\s*(?:code)?\s*[:\-]?\s*(?P<pincode_value>\d{6})\b'
+                r'|(?<=-\s)(?P<pincode_value_b>\d{6})\b'
+                r'|(?<=-)(?P<pincode_value_c>\d{6})\b'),
+    ('amount', r'(?:\bRs\.?|\bINR|₹)\s*(?P<amount_value>\d+(?:,\d+)*(?:\.\d{1,2})?)'
+               r'|\b(?P<amount_value_b>\d+(?:,\d+)*(?:\.\d{1,2})?)\s*(?:/-|rupees?\b|Rs\b\.?|INR\b'
+               r'|(?:per|a)\s+month\b|/\s*(?:month|mo)\b)'),
+    # Unmarked numbers; phone numbers (10+ digits) and areas ("1200 sq ft") are left out
+    ('number', r'\b(?!(?:19|20)\d\d\b)(?P<number_value>\d{1,3}(?:,\d{2,3})+(?:\.\d{1,2})?|\d{4,9}(?:\.\d{1,2})?)\b'
+               r'(?!\s*(?:sq\b|sq\.|square|ft\b|feet|acres?\b|cents?\b|%))'),
+)
+
+# Every alternative starts with a digit or one of these letters; the leading
+# lookahead lets the engine skip all other positions without trying each branch.
+_FIRST_CHARS = r'\dRrIiAaPp₹'
+
+SCANNER = re.compile(f'(?=[{_FIRST_CHARS}])(?:'
+                     + '|'.join(f'(?P<{kind}>{pattern})' for kind, pattern in _PATTERNS) + ')', re.IGNORECASE)
+
+# Named groups carrying the normalised value of each kind; the whole match is used otherwise
+_VALUE_GROUPS = {
+    'age': ('age_value', 'age_value_b'),
+    'duration': ('duration_value',),
+    'pincode': ('pincode_value', 'pincode_value_b', 'pincode_value_c'),
+    'amount': ('amount_value', 'amount_value_b'),
+    'number': ('number_value',),
+}
+
+KINDS = tuple(kind for kind, _ in _PATTERNS)
+
+
+class EntitySpan(NamedTuple):
+    kind: str
+    text: str
+    value: str
+    start: int
+    end: int
+
+
+def scan(text: str, offset: int = 0) -> List[EntitySpan]:
+    """Return every amount, date, duration, pincode, age and unmarked number in ``text``.
+
+    ``offset`` is added to the reported positions, which lets callers scan a
+    tail of a longer text and keep positions relative to the whole.
+    """
+    spans = []
+    for match in SCANNER.finditer(text):
+        kind = match.lastgroup  # the enclosing kind group closes last
+        value = match.group(0)
+        for group in _VALUE_GROUPS.get(kind, ()):
+            if match.group(group) is not None:
+                value = match.group(group)
+                break
+        if kind == 'duration':
+            value = f"{value} {match.group('duration_unit').lower()}"
+        spans.append(EntitySpan(kind, match.group(0).strip(), value, match.start() + offset, match.end() + offset))
+    return spans
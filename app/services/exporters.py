@@ -0,0 +1,126 @@
+"""Export rendered document text to downloadable file formats.
+
+Every exporter returns the file as ``bytes``. Nothing is written to a
+temporary file, so the same exporters serve single downloads and bulk
+archives. The content can be a string or an iterable of text chunks, such
+as ``DocumentGenerator.stream_document``. Chunks are consumed line by line
+as they arrive, so the full text is never held as one string.
+python-docx and ReportLab are imported only when their format is
+requested.
+"""
+import io
+from datetime import datetime
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Union
+
+Content = Union[str, Iterable[str]]
+
+
+class ExportFormat(NamedTuple):
+    extension: str
+    mimetype: str
+    export: Callable[[Content, str], bytes]
+
+
+def _title(doc_type: str) -> str:
+    return doc_type.replace('_', ' ').title()
+
+
+def iter_lines(content: Content) -> Iterator[str]:
+    """Yield the lines of ``content``, each as soon as it is complete."""
+    pending = ''
+    for chunk in ((content,) if isinstance(content, str) else content):
+        *lines, pending = (pending + chunk).split('\n')
+        yield from lines
+    yield pending
+
+
+def iter_blocks(content: Content) -> Iterator[str]:
+    """Yield the blank-line separated blocks of ``content``, each as soon as it is complete."""
+    block: List[str] = []
+    for line in iter_lines(content):
+        if line:
+            block.append(line)
+        elif block:
+            yield '\n'.join(block)
+            block = []
+    if block:
+        yield '\n'.join(block)
+
+
+def export_docx(content: Content, doc_type: str) -> bytes:
+    from docx import Document
+
+    doc = Document()
+    doc.add_heading(_title(doc_type), 0)
+    for para in iter_lines(content):
+        if para.strip():
+            doc.add_paragraph(para.strip())
+
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+def export_pdf(content: Content, doc_type: str) -> bytes:
+    from reportlab.lib.pagesizes import A4
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.enums import TA_JUSTIFY
+    from reportlab.lib.units import inch
+
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=A4, leftMargin=54, rightMargin=54, topMargin=54, bottomMargin=54)
+    styles = getSampleStyleSheet()
+
+    body_style = ParagraphStyle(
+        name='Body',
+        parent=styles['Normal'],
+        fontSize=11,
+        leading=16,
+        alignment=TA_JUSTIFY,
+    )
+    title_style = ParagraphStyle(
+        name='Title',
+        parent=styles['Heading1'],
+        fontSize=18,
+        leading=22,
+        spaceAfter=12,
+    )
+
+    story = [Paragraph(_title(doc_type), title_style), Spacer(1, 0.2 * inch)]
+    # Convert plain text line breaks to simple paragraphs
+    for block in iter_blocks(content):
+        block_html = block.strip().replace('\n', '<br/>')
+        if not block_html:
+            continue
+        story.append(Paragraph(block_html, body_style))
+        story.append(Spacer(1, 0.12 * inch))
+
+    doc.build(story)
+    return buffer.getvalue()
+
+
+def export_txt(content: Content, doc_type: str) -> bytes:
+    if isinstance(content, str):
+        return content.encode('utf-8')
+    buffer = io.BytesIO()
+    for chunk in content:
+        buffer.write(chunk.encode('utf-8'))
+    return buffer.getvalue()
+
+
+FORMATS: Dict[str, ExportFormat] = {
+    'docx': ExportFormat('docx', 'application/vnd.openxmlformats-officedocument.wordprocessingml.document', export_docx),
+    'pdf': ExportFormat('pdf', 'application/pdf', export_pdf),
+    'txt': ExportFormat('txt', 'text/plain; charset=utf-8', export_txt),
+}
+
+
+def get_format(format_type: str) -> ExportFormat:
+    if format_type not in FORMATS:
+        raise ValueError(f'Unsupported format: {format_type}')
+    return FORMATS[format_type]
+
+
+def download_name(doc_type: str, extension: str, when: Optional[datetime] = None) -> str:
+    return f'{doc_type}_{(when or datetime.now()).strftime("%Y%m%d_%H%M%S")}.{extension}'
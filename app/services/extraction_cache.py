@@ -0,0 +1,107 @@
+"""LRU + TTL cache of prompt extraction results keyed by a normalized prompt hash."""
+import hashlib
+import os
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+_WHITESPACE = re.compile(r'\s+')
+_TRAILING_PUNCTUATION = re.compile(r'[\s.!?]+$')
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Normalize Unicode, collapse whitespace and drop trailing sentence punctuation.
+
+    Case is kept because named entity recognition depends on it.
+    """
+    text = unicodedata.normalize('NFC', prompt)
+    text = _WHITESPACE.sub(' ', text).strip()
+    return _TRAILING_PUNCTUATION.sub('', text)
+
+
+def prompt_key(prompt: str) -> str:
+    return hashlib.sha256(normalize_prompt(prompt).encode('utf-8')).hexdigest()
+
+
+class LRUCache:
+    """Thread-safe LRU mapping with a per-entry time to live and hit/miss counters."""
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = 3600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: 'OrderedDict[str, tuple]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                value, expires = entry
+                if expires is None or expires > time.monotonic():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+            self.misses += 1
+            return default
+
+    def set(self, key: str, value) -> None:
+        expires = time.monotonic() + self.ttl if self.ttl else None
+        with self._lock:
+            self._data[key] = (value, expires)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key: str, default=None):
+        with self._lock:
+            entry = self._data.pop(key, None)
+        return entry[0] if entry is not None else default
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def keys(self) -> List[Hashable]:
+        with self._lock:
+            return list(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._data),
+            'maxsize': self.maxsize,
+            'ttl_seconds': self.ttl,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else None,
+        }
+
+
+class ExtractionCache(LRUCache):
+    """Caches the result of analysing a prompt under its normalized hash."""
+
+    def __init__(self, maxsize: Optional[int] = None, ttl: Optional[float] = None):
+        super().__init__(
+            maxsize=maxsize or int(os.getenv('EXTRACTION_CACHE_SIZE', '1024')),
+            ttl=ttl if ttl is not None else float(os.getenv('EXTRACTION_CACHE_TTL', '3600')),
+        )
+
+    def get_or_compute(self, prompt: str, compute: Callable[[str], Any]):
+        key = prompt_key(prompt)
+        result = self.get(key)
+        if result is None:
+            result = compute(prompt)
+            self.set(key, result)
+        return result
@@ -0,0 +1,92 @@
+"""Typed field schema for the document forms.
+
+Every form field has a type that decides how its value is handled when a
+document is generated in another language: free text goes to translation,
+names and addresses are transliterated, and numbers, dates, pincodes and
+currency amounts are formatted locally. Only free text is ever sent to the
+translation provider.
+"""
+import re
+from typing import Dict, Iterable, Mapping
+
+NAME = 'name'
+ADDRESS = 'address'
+TEXT = 'text'
+NUMBER = 'number'
+DATE = 'date'
+PINCODE = 'pincode'
+CURRENCY = 'currency'
+IDENTIFIER = 'identifier'
+AMOUNT_WORDS = 'amount_words'
+
+FIELD_TYPES = (NAME, ADDRESS, TEXT, NUMBER, DATE, PINCODE, CURRENCY, IDENTIFIER, AMOUNT_WORDS)
+
+# Types whose values are sent to the translation provider. Amount words are
+# normally generated locally (see ``number_words``) and are only translated
+# when they could not be derived from the amount.
+TRANSLATED_TYPES = frozenset((TEXT, AMOUNT_WORDS))
+
+# Types whose values are transliterated locally rather than translated
+TRANSLITERATED_TYPES = frozenset((NAME, ADDRESS))
+
+# Party fields hold a person's name without a ``_name`` suffix
+PARTY_FIELDS = frozenset(('seller', 'buyer', 'principal', 'attorney', 'lessor', 'lessee', 'landlord', 'tenant'))
+
+# Fields whose type cannot be told from the naming rules below
+FIELD_OVERRIDES = {
+    'survey_number': IDENTIFIER,
+    'rent_due_date': NUMBER,  # a day of the month such as "1st"
+    'month': DATE,
+    'year': NUMBER,
+    'area': NUMBER,
+    'number_of_rooms': NUMBER,
+    'rent_increase_percentage': NUMBER,
+    'duration': NUMBER,
+    'renewal_period': NUMBER,
+    'lease_period': NUMBER,
+    'notice_period': NUMBER,
+    'security_deposit': CURRENCY,
+    'execution_place': ADDRESS,
+    'jurisdiction': ADDRESS,
+    'registration_office': ADDRESS,
+    'stamp_duty_bearer': TEXT,
+}
+
+# (pattern, type) naming rules, first match wins
+_SUFFIX_RULES = (
+    (re.compile(r'_words$'), AMOUNT_WORDS),
+    (re.compile(r'_amount$'), CURRENCY),
+    (re.compile(r'_pincode$'), PINCODE),
+    (re.compile(r'_age$'), NUMBER),
+    (re.compile(r'(?:^|_)date$'), DATE),
+    (re.compile(r'_(?:name|father)$'), NAME),
+    (re.compile(r'_(?:address|city)$'), ADDRESS),
+)
+
+
+def field_type(field: str) -> str:
+    """Return the type of ``field``; unknown fields are treated as free text."""
+    if field in FIELD_OVERRIDES:
+        return FIELD_OVERRIDES[field]
+    if field in PARTY_FIELDS:
+        return NAME
+    for pattern, kind in _SUFFIX_RULES:
+        if pattern.search(field):
+            return kind
+    return TEXT
+
+
+def build_schema(fields: Iterable[str]) -> Dict[str, str]:
+    return {field: field_type(field) for field in fields}
+
+
+def translatable_fields(data: Mapping[str, str], schema: Mapping[str, str], skip: Iterable[str] = ()) -> Dict[str, str]:
+    """Return the entries of ``data`` whose type needs translation, leaving out ``skip``."""
+    skip = set(skip)
+    return {key: value for key, value in data.items()
+            if key not in skip and schema.get(key, field_type(key)) in TRANSLATED_TYPES}
+
+
+def transliterable_fields(data: Mapping[str, str], schema: Mapping[str, str]) -> Dict[str, str]:
+    """Return the entries of ``data`` whose type is transliterated."""
+    return {key: value for key, value in data.items() if schema.get(key, field_type(key)) in TRANSLITERATED_TYPES}
@@ -0,0 +1,89 @@
+"""Concurrent translation of form fields under a per-request deadline.
+
+Field values are packed into provider-sized batches which are translated in
+parallel on a bounded, process-wide thread pool. Whatever has not finished
+when the request's deadline passes, whose batch raised, or whose values the
+provider could not translate keeps its original text, and those fields are
+reported as degraded together with the reason.
+"""
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional, Tuple
+
+from app.services.batch_translation import pack_values
+
+# Why a field kept its original text
+TIMED_OUT = 'timeout'
+FAILED = 'error'
+
+_lock = threading.Lock()
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_pid: Optional[int] = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    # Threads do not survive fork(), so each worker builds its own pool
+    global _executor, _executor_pid
+    with _lock:
+        if _executor is None or _executor_pid != os.getpid():
+            _executor = ThreadPoolExecutor(
+                max_workers=int(os.getenv('TRANSLATION_WORKERS', '8')),
+                thread_name_prefix='translate',
+            )
+            _executor_pid = os.getpid()
+        return _executor
+
+
+def translate_fields(data: Dict[str, str], language: str,
+                     translate_batch: Callable[[List[str], str], List[Optional[str]]],
+                     deadline: Optional[float] = None) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """Translate the non-empty values of ``data`` into ``language``.
+
+    ``translate_batch(values, language)`` returns one translation per value,
+    or ``None`` for a value the provider could not translate.
+    Distinct values are packed into provider-sized batches (see
+    ``batch_translation.pack_values``) and the batches run in parallel.
+    ``deadline`` is the total number of seconds the caller is willing to wait
+    (``TRANSLATION_DEADLINE``, default 8). Returns the translated mapping and
+    the fields that fell back to their original text, mapped to ``TIMED_OUT``
+    when their batch did not finish in time or ``FAILED`` when it raised or
+    returned ``None`` for them.
+    """
+    if deadline is None:
+        deadline = float(os.getenv('TRANSLATION_DEADLINE', '8'))
+    expires = time.monotonic() + deadline
+
+    values = list(dict.fromkeys(value for value in data.values() if value.strip()))
+    executor = _get_executor()
+    futures = [(batch, executor.submit(translate_batch, batch, language)) for batch in pack_values(values)]
+
+    wait([future for _, future in futures], timeout=max(expires - time.monotonic(), 0))
+
+    done, reasons = {}, {}
+    for batch, future in futures:
+        if future.done() and future.exception() is None:
+            for value, result in zip(batch, future.result()):
+                if result is None:
+                    reasons[value] = FAILED
+                else:
+                    done[value] = result
+        elif future.done():
+            reasons.update(dict.fromkeys(batch, FAILED))
+        else:
+            reasons.update(dict.fromkeys(batch, TIMED_OUT))
+            # Late batches still finish in the background and land in the
+            # translation memory, so a retry of the same form is usually complete
+            future.cancel()
+
+    translated, degraded = {}, {}
+    for key, value in data.items():
+        if not value.strip():
+            translated[key] = value
+        elif value in done:
+            translated[key] = done[value]
+        else:
+            translated[key] = value
+            degraded[key] = reasons.get(value, FAILED)
+    return translated, degraded
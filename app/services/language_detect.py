@@ -0,0 +1,147 @@
+"""Prompt language and requested output language detection.
+
+The prompt language comes from a histogram of the Unicode scripts of its
+letters; each Indic script block is 128 code points wide, so a character's
+block is ``ord(char) >> 7``. Devanagari is shared by Hindi and Marathi, which
+are told apart by Marathi-only words and inflections against frequent Hindi
+function words; a Marathi language name in the prompt counts for Marathi.
+
+The output language is the language the prompt asks for by name ("in Tamil",
+"हिंदी में", "தமிழில்"), found with the same keyword automaton the document
+classifier uses, and otherwise the prompt's own language.
+"""
+import re
+from typing import Dict, NamedTuple, Optional
+
+from app.services.doc_classifier import KeywordAutomaton
+
+DEFAULT_LANGUAGE = 'en'
+
+# Unicode block (code point >> 7) -> language written in that script
+SCRIPT_LANGUAGES = {
+    0x0900 >> 7: 'hi',
+    0x0980 >> 7: 'bn',
+    0x0A80 >> 7: 'gu',
+    0x0B00 >> 7: 'or',
+    0x0B80 >> 7: 'ta',
+    0x0C00 >> 7: 'te',
+    0x0C80 >> 7: 'kn',
+    0x0600 >> 7: 'ur',
+    0x0680 >> 7: 'ur',
+}
+
+MARATHI_MARKERS = frozenset((
+    'आहे', 'आणि', 'च्या', 'साठी', 'करून', 'मध्ये', 'नाही', 'व', 'ला', 'चा', 'ची', 'चे',
+    'करार', 'करारनामा', 'भाडे', 'भाड्याने', 'भाडेकरू', 'भाडेकरार', 'मालक', 'घरमालक', 'खरेदीखत', 'विक्रीखत',
+    'यांच्यात', 'यांच्यामध्ये', 'करा', 'द्या', 'बनवा', 'मला', 'माझे', 'आम्ही', 'येथे', 'पासून', 'महिन्यांसाठी',
+))
+# Marathi case endings (locative -त, dative -ला, instrumental -ने, genitive -चा/-ची/-चे)
+MARATHI_SUFFIXES = ('च्या', 'ाचा', 'ाची', 'ाचे', 'ांचा', 'ांची', 'ांचे', 'ांना', 'ांनी', 'ात', 'ीत', 'ईत',
+                    'ाला', 'ीला', 'ाने', 'ीने')
+# Hindi words that happen to end like a Marathi inflection
+HINDI_LOOKALIKES = frozenset(('बात', 'रात', 'शुरुआत', 'मुलाकात', 'हालात', 'संगीत', 'गीत', 'जीत', 'प्रतीत', 'वाला',
+                              'ताला', 'मसाला', 'जाने', 'आने', 'खाने', 'पाने', 'गाने', 'दिलाने'))
+HINDI_MARKERS = frozenset((
+    'है', 'और', 'के', 'में', 'का', 'की', 'को', 'से', 'लिए', 'नहीं', 'एक',
+    'किराया', 'किराये', 'किराए', 'किरायेदार', 'किराएदार', 'मालिक', 'मकान', 'समझौता', 'महीने', 'महीना',
+    'वाला', 'वाले', 'वाली', 'तैयार', 'बनाएं', 'बनाइए', 'बनाओ', 'करें', 'कीजिए', 'चाहिए', 'हुआ', 'हुई',
+))
+
+# Names of the supported output languages, in English and in the language itself
+LANGUAGE_NAMES = {
+    'en': ('english', 'अंग्रेज़ी', 'अंग्रेजी', 'ஆங்கிலம்', 'ஆங்கிலத்தில்'),
+    'hi': ('hindi', 'हिंदी', 'हिन्दी'),
+    'mr': ('marathi', 'मराठी', 'मराठीत'),
+    'bn': ('bengali', 'bangla', 'বাংলা', 'বাংলায়'),
+    'gu': ('gujarati', 'ગુજરાતી', 'ગુજરાતીમાં'),
+    'or': ('odia', 'oriya', 'ଓଡ଼ିଆ', 'ଓଡିଆ'),
+    'ta': ('tamil', 'தமிழ்', 'தமிழில்'),
+    'te': ('telugu', 'తెలుగు', 'తెలుగులో'),
+    'kn': ('kannada', 'ಕನ್ನಡ', 'ಕನ್ನಡದಲ್ಲಿ'),
+    'ur': ('urdu', 'اردو', 'اُردو'),
+}
+
+# Mentions of a language name that do not ask for that language
+NOT_A_REQUEST = ('tamil nadu', 'tamilnadu', 'தமிழ்நாடு', 'தமிழ் நாடு')
+
+
+class LanguageDecision(NamedTuple):
+    prompt_language: str
+    output_language: str
+    scripts: Dict[str, int]
+
+
+def _build_gazetteer() -> KeywordAutomaton:
+    automaton = KeywordAutomaton()
+    for language, names in LANGUAGE_NAMES.items():
+        for name in names:
+            automaton.add(name, (language, len(name)))
+    for phrase in NOT_A_REQUEST:
+        automaton.add(phrase, (None, len(phrase)))
+    automaton.build()
+    return automaton
+
+
+_GAZETTEER = _build_gazetteer()
+
+
+def script_histogram(text: str) -> Dict[str, int]:
+    """Count the letters of ``text`` per language script (Latin counts as ``en``)."""
+    counts: Dict[str, int] = {}
+    for char in text:
+        code = ord(char)
+        if code < 0x80:
+            if char.isalpha():
+                counts[DEFAULT_LANGUAGE] = counts.get(DEFAULT_LANGUAGE, 0) + 1
+            continue
+        language = SCRIPT_LANGUAGES.get(code >> 7)
+        if language is not None:
+            counts[language] = counts.get(language, 0) + 1
+    return counts
+
+
+_WORD = re.compile(r'[\u0900-\u0963\u0971-\u097f]+|[a-z]+')
+
+
+def _is_marathi_word(word: str) -> bool:
+    if word in MARATHI_MARKERS or word in LANGUAGE_NAMES['mr']:
+        return True
+    return len(word) > 3 and word.endswith(MARATHI_SUFFIXES) and word not in HINDI_LOOKALIKES
+
+
+def _devanagari_language(text: str) -> str:
+    words = _WORD.findall(text.lower())
+    marathi = sum(map(_is_marathi_word, words)) + text.count('ळ')
+    hindi = sum(word in HINDI_MARKERS for word in words)
+    return 'mr' if marathi > hindi else 'hi'
+
+
+def prompt_language(text: str, scripts: Optional[Dict[str, int]] = None) -> str:
+    """Return the language of the script most of the prompt's letters are written in."""
+    scripts = script_histogram(text) if scripts is None else scripts
+    if not scripts:
+        return DEFAULT_LANGUAGE
+    language = max(scripts, key=scripts.get)
+    return _devanagari_language(text) if language == 'hi' else language
+
+
+def requested_language(text: str) -> Optional[str]:
+    """Return the first output language named in ``text``, or ``None`` when none is named."""
+    lowered = text.lower()
+    matches = sorted(_GAZETTEER.find(text), key=lambda match: match[0])
+    blocked = {start for start, (language, _) in matches if language is None}
+    for start, (language, length) in matches:
+        if language is None or start in blocked:
+            continue
+        # Latin names must end at a word boundary ("Tamil", not "Tamilian")
+        end = start + length
+        if end < len(lowered) and lowered[end].isascii() and lowered[end].isalpha():
+            continue
+        return language
+    return None
+
+
+def detect_languages(text: str) -> LanguageDecision:
+    scripts = script_histogram(text)
+    language = prompt_language(text, scripts)
+    return LanguageDecision(language, requested_language(text) or language, scripts)
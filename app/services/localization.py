@@ -0,0 +1,127 @@
+"""Local formatters for numeric, date and currency field values.
+
+Values are reformatted for the target language without any network call:
+amounts get Indian digit grouping (``50,00,000``) and month names are
+replaced with the language's own. Anything that cannot be parsed is returned
+unchanged.
+"""
+import re
+from typing import Dict, Mapping, Optional
+
+from app.services import field_schema
+
+MONTH_NAMES = {
+    'en': ('January', 'February', 'March', 'April', 'May', 'June', 'July', 'August',
+           'September', 'October', 'November', 'December'),
+    'hi': ('जनवरी', 'फ़रवरी', 'मार्च', 'अप्रैल', 'मई', 'जून', 'जुलाई', 'अगस्त',
+           'सितंबर', 'अक्टूबर', 'नवंबर', 'दिसंबर'),
+    'mr': ('जानेवारी', 'फेब्रुवारी', 'मार्च', 'एप्रिल', 'मे', 'जून', 'जुलै', 'ऑगस्ट',
+           'सप्टेंबर', 'ऑक्टोबर', 'नोव्हेंबर', 'डिसेंबर'),
+    'bn': ('জানুয়ারি', 'ফেব্রুয়ারি', 'মার্চ', 'এপ্রিল', 'মে', 'জুন', 'জুলাই', 'আগস্ট',
+           'সেপ্টেম্বর', 'অক্টোবর', 'নভেম্বর', 'ডিসেম্বর'),
+    'te': ('జనవరి', 'ఫిబ్రవరి', 'మార్చి', 'ఏప్రిల్', 'మే', 'జూన్', 'జూలై', 'ఆగస్టు',
+           'సెప్టెంబర్', 'అక్టోబర్', 'నవంబర్', 'డిసెంబర్'),
+    'ta': ('ஜனவரி', 'பிப்ரவரி', 'மார்ச்', 'ஏப்ரல்', 'மே', 'ஜூன்', 'ஜூலை', 'ஆகஸ்ட்',
+           'செப்டம்பர்', 'அக்டோபர்', 'நவம்பர்', 'டிசம்பர்'),
+    'kn': ('ಜನವರಿ', 'ಫೆಬ್ರವರಿ', 'ಮಾರ್ಚ್', 'ಏಪ್ರಿಲ್', 'ಮೇ', 'ಜೂನ್', 'ಜುಲೈ', 'ಆಗಸ್ಟ್',
+           'ಸೆಪ್ಟೆಂಬರ್', 'ಅಕ್ಟೋಬರ್', 'ನವೆಂಬರ್', 'ಡಿಸೆಂಬರ್'),
+    'gu': ('જાન્યુઆરી', 'ફેબ્રુઆરી', 'માર્ચ', 'એપ્રિલ', 'મે', 'જૂન', 'જુલાઈ', 'ઑગસ્ટ',
+           'સપ્ટેમ્બર', 'ઑક્ટોબર', 'નવેમ્બર', 'ડિસેમ્બર'),
+    'or': ('ଜାନୁଆରୀ', 'ଫେବୃଆରୀ', 'ମାର୍ଚ୍ଚ', 'ଅପ୍ରେଲ', 'ମଇ', 'ଜୁନ', 'ଜୁଲାଇ', 'ଅଗଷ୍ଟ',
+           'ସେପ୍ଟେମ୍ବର', 'ଅକ୍ଟୋବର', 'ନଭେମ୍ବର', 'ଡିସେମ୍ବର'),
+    'ur': ('جنوری', 'فروری', 'مارچ', 'اپریل', 'مئی', 'جون', 'جولائی', 'اگست',
+           'ستمبر', 'اکتوبر', 'نومبر', 'دسمبر'),
+}
+
+# English month name or abbreviation -> month index
+_MONTH_INDEX = {}
+for _index, _name in enumerate(MONTH_NAMES['en']):
+    _MONTH_INDEX[_name.lower()] = _index
+    _MONTH_INDEX[_name[:3].lower()] = _index
+_MONTH_INDEX['sept'] = 8
+
+_MONTH = r'(?P<month>[A-Za-z]{3,9})\.?'
+_DAY = r'(?P<day>\d{1,2})(?:st|nd|rd|th)?'
+_YEAR = r'(?P<year>\d{4})'
+_DATE_FORMS = (
+    re.compile(rf'^{_DAY}\s+(?:of\s+)?{_MONTH},?\s+{_YEAR}$', re.IGNORECASE),   # 1st April 2024
+    re.compile(rf'^{_MONTH}\s+{_DAY},?\s+{_YEAR}$', re.IGNORECASE),             # April 01, 2024
+    re.compile(rf'^{_MONTH},?\s+{_YEAR}$', re.IGNORECASE),                      # April 2024
+    re.compile(rf'^{_MONTH}$', re.IGNORECASE),                                   # April
+)
+
+_AMOUNT = re.compile(r'^(?P<prefix>(?:Rs\.?|INR|₹)\s*)?(?P<number>\d[\d,]*)(?P<fraction>\.\d+)?(?P<suffix>\s*/-)?$',
+                     re.IGNORECASE)
+
+
+def group_indian(digits: str) -> str:
+    """Group an integer string the Indian way: last three digits, then pairs."""
+    digits = digits.lstrip('0') or '0'
+    if len(digits) <= 3:
+        return digits
+    head, tail = digits[:-3], digits[-3:]
+    pairs = []
+    while len(head) > 2:
+        pairs.insert(0, head[-2:])
+        head = head[:-2]
+    return ','.join([head] + pairs + [tail])
+
+
+def format_currency(value: str) -> str:
+    match = _AMOUNT.match(value.strip())
+    if not match:
+        return value
+    grouped = group_indian(match.group('number').replace(',', ''))
+    return f"{match.group('prefix') or ''}{grouped}{match.group('fraction') or ''}{match.group('suffix') or ''}"
+
+
+def format_date(value: str, language: str) -> str:
+    """Replace the English month name in ``value`` with the ``language`` one.
+
+    Numeric dates such as ``01/04/2024`` are already language neutral and are
+    returned unchanged, as is anything that is not recognised as a date.
+    """
+    names = MONTH_NAMES.get(language)
+    text = value.strip()
+    if not names:
+        return value
+    for form in _DATE_FORMS:
+        match = form.match(text)
+        if not match:
+            continue
+        month = _MONTH_INDEX.get(match.group('month').lower())
+        if month is None:
+            return value
+        parts = match.groupdict()
+        pieces = [str(int(parts['day']))] if parts.get('day') else []
+        pieces.append(names[month])
+        if parts.get('year'):
+            pieces.append(parts['year'])
+        return ' '.join(pieces)
+    return value
+
+
+def format_number(value: str) -> str:
+    return value.strip()
+
+
+def localize_value(value: str, kind: str, language: str) -> Optional[str]:
+    """Format ``value`` of field type ``kind``; ``None`` when the type is not formatted locally."""
+    if kind == field_schema.CURRENCY:
+        return format_currency(value)
+    if kind == field_schema.DATE:
+        return format_date(value, language)
+    if kind in (field_schema.NUMBER, field_schema.PINCODE, field_schema.IDENTIFIER):
+        return format_number(value)
+    return None
+
+
+def localize_fields(data: Mapping[str, str], schema: Mapping[str, str], language: str) -> Dict[str, str]:
+    """Return ``data`` with every locally formatted field type formatted for ``language``."""
+    localized = dict(data)
+    for key, value in data.items():
+        if value.strip():
+            formatted = localize_value(value, schema.get(key, field_schema.field_type(key)), language)
+            if formatted is not None:
+                localized[key] = formatted
+    return localized
@@ -0,0 +1,182 @@
+"""Mail merge: one document type, many rows of field values, one ZIP archive.
+
+Rows come from a CSV file (one column per field) or a JSONL file (one
+object per line). Each row is completed with the document defaults, then
+rendered and exported on a bounded thread pool. The rendered chunks go straight
+into the exporter. The documents are written into a ZIP archive in the order
+they finish. The archive is produced as a
+stream of byte chunks, so the first documents reach the client while later
+rows are still rendering. A ``report.csv`` at the end of the archive lists
+every row with its file name, or with the error that stopped it.
+"""
+import csv
+import io
+import itertools
+import json
+import os
+import re
+import time
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Union
+
+from app.services.default_data import complete_document_data
+from app.services.exporters import Content, get_format
+
+REPORT_NAME = 'report.csv'
+# Optional row column naming the file inside the archive
+FILENAME_FIELD = 'filename'
+# Formats that are compressed already and are stored as they are
+_STORED_EXTENSIONS = frozenset(('docx', 'pdf'))
+_UNSAFE_FILENAME = re.compile(r'[^\w.-]+')
+
+Row = Union[Dict[str, str], ValueError]
+
+
+class MergeResult(NamedTuple):
+    row: int                # 1-based row number in the input
+    filename: str
+    data: Optional[bytes]   # ``None`` when the row failed
+    error: Optional[str]
+    seconds: float
+
+
+def rows_format(filename: Optional[str], mimetype: Optional[str]) -> str:
+    """Return ``'jsonl'`` or ``'csv'`` from an upload's file name or content type."""
+    name = (filename or '').lower()
+    if name.endswith(('.jsonl', '.ndjson', '.json')) or (mimetype or '') in (
+            'application/json', 'application/jsonl', 'application/x-ndjson', 'application/x-jsonlines'):
+        return 'jsonl'
+    return 'csv'
+
+
+def read_rows(text: str, kind: str) -> List[Row]:
+    """Parse CSV or JSONL ``text`` into rows of string values.
+
+    A malformed JSONL line becomes a ``ValueError`` in its place. It is then
+    reported under its row number instead of failing the whole batch.
+    """
+    if kind == 'csv':
+        return [_stringify(row) for row in csv.DictReader(io.StringIO(text))
+                if any((value or '').strip() for value in row.values())]
+    rows: List[Row] = []
+    for line_number, line in enumerate(text.splitlines(), 1):
+        if not line.strip():
+            continue
+        try:
+            item = json.loads(line)
+        except ValueError as e:
+            rows.append(ValueError(f'line {line_number}: invalid JSON ({e})'))
+            continue
+        rows.append(_stringify(item) if isinstance(item, dict)
+                    else ValueError(f'line {line_number}: expected an object of field values'))
+    return rows
+
+
+def _stringify(row: Dict) -> Dict[str, str]:
+    return {str(key): '' if value is None else str(value) for key, value in row.items() if key is not None}
+
+
+def _row_filename(index: int, row: Row, doc_type: str, extension: str) -> str:
+    name = row.get(FILENAME_FIELD, '') if isinstance(row, dict) else ''
+    name = _UNSAFE_FILENAME.sub('_', name).strip('._') or doc_type
+    return f'{index:04d}_{name}.{extension}'
+
+
+def _merge_row(index: int, row: Row, doc_type: str, language: str, format_type: str,
+               generate: Callable[[str, Dict[str, str], str], Content]) -> MergeResult:
+    started = time.perf_counter()
+    filename = _row_filename(index, row, doc_type, get_format(format_type).extension)
+    try:
+        if isinstance(row, ValueError):
+            raise row
+        data = {key: value for key, value in row.items() if key != FILENAME_FIELD}
+        content = generate(doc_type, complete_document_data(doc_type, language, data), language)
+        exported = get_format(format_type).export(content, doc_type)
+    except Exception as e:
+        return MergeResult(index, filename, None, str(e) or type(e).__name__, time.perf_counter() - started)
+    return MergeResult(index, filename, exported, None, time.perf_counter() - started)
+
+
+def merge_documents(rows: Iterable[Row], doc_type: str, language: str, format_type: str,
+                    generate: Callable[[str, Dict[str, str], str], Content],
+                    workers: Optional[int] = None) -> Iterator[MergeResult]:
+    """Render and export one document per row in parallel and yield results as they finish.
+
+    ``generate(doc_type, data, language)`` renders the document text, either
+    as a string or as chunks (``DocumentGenerator.stream_document``). At most
+    ``2 * workers`` rows are in flight (``MAIL_MERGE_WORKERS``, default up to
+    4), which bounds memory however many rows there are. Closing the iterator
+    early cancels the rows that have not started.
+    """
+    get_format(format_type)  # fail fast on an unsupported format
+    workers = workers or int(os.getenv('MAIL_MERGE_WORKERS', str(min(4, os.cpu_count() or 1))))
+    numbered = enumerate(rows, 1)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='mail-merge') as executor:
+        pending = set()
+        try:
+            while True:
+                for index, row in itertools.islice(numbered, 2 * workers - len(pending)):
+                    pending.add(executor.submit(_merge_row, index, row, doc_type, language, format_type, generate))
+                if not pending:
+                    return
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=lambda future: future.result().row):
+                    yield future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+class _ZipSink:
+    """Write-only, non-seekable file object for ``zipfile``.
+
+    Without ``seek``/``tell`` zipfile writes sizes in data descriptors after
+    each member, so the archive can be sent while it is being built.
+    ``drain`` takes the bytes written so far.
+    """
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b''.join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _report(results: List[MergeResult]) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(('row', 'filename', 'status', 'error', 'seconds'))
+    for result in sorted(results, key=lambda result: result.row):
+        writer.writerow((result.row, result.filename if result.error is None else '',
+                         'error' if result.error else 'ok', result.error or '', f'{result.seconds:.3f}'))
+    return buffer.getvalue().encode('utf-8')
+
+
+def stream_zip(results: Iterable[MergeResult], on_result: Optional[Callable[[MergeResult], None]] = None) -> Iterator[bytes]:
+    """Yield a ZIP archive of the successful results chunk by chunk, ending with ``report.csv``."""
+    sink = _ZipSink()
+    finished: List[MergeResult] = []
+    with zipfile.ZipFile(sink, 'w') as archive:
+        for result in results:
+            if result.error is None:
+                extension = result.filename.rsplit('.', 1)[-1]
+                compression = zipfile.ZIP_STORED if extension in _STORED_EXTENSIONS else zipfile.ZIP_DEFLATED
+                archive.writestr(result.filename, result.data, compress_type=compression)
+            finished.append(result)
+            if on_result:
+                on_result(result)
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+        archive.writestr(REPORT_NAME, _report(finished), compress_type=zipfile.ZIP_DEFLATED)
+    yield sink.drain()
@@ -0,0 +1,317 @@
+"""Rule-based entity extraction for prompts written in Tamil and Hindi.
+
+The English path runs spaCy NER and then the Latin entity scanner. Neither
+one works on Tamil or Devanagari text. This module takes its place with a
+lexicon for each language:
+
+- currency markers, scale words (lakh, crore) and month names for amounts
+  and dates;
+- duration units, and cue words for amounts, deposits and notice periods
+  (both languages put the cue before or right after the number:
+  "जमानत 50000 रुपये", "50000 रुपये जमानत");
+- role words ("வாடகைதாரர்", "किरायेदार") that name the party that follows them;
+- honorifics, and "X and Y between" constructions for unmarked names;
+- a gazetteer of cities.
+
+Native digits are mapped to ASCII first. The mapping is one character to
+one character, so positions stay valid. The spans come out in the same
+``EntitySpan`` shape as the English path and are assigned to fields by
+``LegalDocumentProcessor.assign_roles``. Nothing here uses the network.
+"""
+import re
+from typing import Dict, List, NamedTuple, Optional, Pattern, Tuple
+
+from app.services.doc_classifier import KeywordAutomaton
+from app.services.entity_scanner import EntitySpan
+from app.services.localization import MONTH_NAMES
+
+# At most this many words are read as one name after a role word or honorific
+NAME_WORDS = 2
+
+
+class NativeLexicon(NamedTuple):
+    letters: str                             # character class body of the script's letters and signs
+    digits: str                              # native digits 0-9
+    currency_before: str                     # regex for markers written before a number
+    currency_after: str                      # regex for markers written after a number
+    scales: Dict[str, int]                   # scale word -> multiplier
+    months: Tuple[str, ...]
+    duration_units: Dict[str, str]           # unit stem -> year/month/week/day; inflected endings are allowed
+    age: Tuple[str, ...]                     # age patterns with an ``age_value*`` group
+    pincode: str                             # pincode label
+    amount_cues: Tuple[str, ...]             # make an unmarked number an amount
+    deposit_cues: Tuple[str, ...]
+    notice_cues: Tuple[str, ...]
+    roles: Dict[str, str]                    # role word stem -> party field
+    honorifics: Tuple[str, ...]
+    between: Tuple[str, ...]                 # "A and B between" patterns with ``a``/``b`` groups; {W} is a word
+    case_suffixes: Tuple[Tuple[str, str], ...]  # (suffix, replacement) stripped from the end of a name
+    stopwords: frozenset
+    places: Tuple[str, ...]
+
+
+TAMIL = NativeLexicon(
+    letters='஀-௿',
+    digits='௦௧௨௩௪௫௬௭௮௯',
+    currency_before=r'(?:ரூ[஀-௿]*\.?|₹|Rs\.?)',
+    currency_after=r'(?:ரூ[஀-௿]*|₹|/-|Rs\b)',
+    scales={'ஆயிரம்': 1000, 'லட்சம்': 100000, 'இலட்சம்': 100000, 'லட்ச': 100000, 'கோடி': 10000000},
+    months=MONTH_NAMES['ta'] + ('பிப்ரவரி', 'ஆகஸ்டு', 'செப்டெம்பர்'),
+    duration_units={'மாத': 'month', 'ஆண்டு': 'year', 'வருட': 'year', 'வார': 'week', 'நாள்': 'day', 'நாட்': 'day'},
+    age=(r'வயது\s*:?\s*(?P<age_value>\d{1,3})(?!\d)',
+         r'(?P<age_value_b>\d{1,3})\s*வயது'),
+    pincode=r'(?:பின்\s*(?:கோடு|குறியீடு)?|அஞ்சல்\s*குறியீடு)',
+    amount_cues=('வாடகை', 'விலை', 'தொகை', 'கட்டணம்', 'மதிப்பு', 'முன்பண', 'வைப்பு'),
+    deposit_cues=('முன்பண', 'வைப்பு', 'டெபாசிட்', 'அட்வான்ஸ்'),
+    notice_cues=('அறிவிப்பு', 'நோட்டீஸ்'),
+    roles={
+        'வீட்டு உரிமையாளர': 'landlord',
+        'உரிமையாளர': 'landlord',
+        'வாடகைதாரர': 'tenant',
+        'குடியிருப்பவர': 'tenant',
+        'விற்பனையாளர': 'seller',
+        'விற்பவர': 'seller',
+        'வாங்குபவர': 'buyer',
+        'அதிகாரம் அளிப்பவர': 'principal',
+        'முகவர': 'attorney',
+        'குத்தகைக்கு விடுபவர': 'lessor',
+        'குத்தகைதாரர': 'lessee',
+    },
+    honorifics=('திருமதி', 'திரு', 'செல்வி', 'டாக்டர்', 'டாக்டர்.'),
+    between=(r'(?P<a>{W}(?:\s+{W})?)\s+மற்றும்\s+(?P<b>{W}(?:\s+{W})?)\s+(?:இடையே|இடையில்|இடையிலான)',
+             r'(?P<a>(?:{W}\s+)?{W}?க்கும்)\s+(?P<b>(?:{W}\s+)?{W}?க்கும்)\s+(?:இடையே|இடையில்|இடையிலான)'),
+    case_suffixes=(('வுக்கும்', ''), ('வுக்கு', ''), ('ுக்கும்', '்'), ('ுக்கு', '்'), ('க்கும்', ''), ('க்கு', ''),
+                   ('வும்', ''), ('ும்', '்'), ('வின்', ''), ('ின்', '்')),
+    stopwords=frozenset((
+        'மற்றும்', 'இடையே', 'இடையில்', 'இடையிலான', 'ஒரு', 'என்ற', 'என்பவர்', 'ஆகியோர்', 'ஆகியோருக்கு',
+        'வாடகை', 'ஒப்பந்தம்', 'ஒப்பந்தத்தை', 'பத்திரம்', 'வீடு', 'வீட்டை', 'வீட்டுக்கு', 'மாத', 'மாதம்',
+        'தயார்', 'செய்யவும்', 'செய்', 'உருவாக்கவும்', 'உருவாக்கு', 'வேண்டும்', 'தேவை', 'வயது', 'முதல்',
+        'தமிழில்', 'ஆங்கிலத்தில்', 'முகவரி', 'அவர்களின்', 'அவரது',
+    )),
+    places=('சென்னை', 'மதுரை', 'கோயம்புத்தூர்', 'கோவை', 'திருச்சி', 'திருச்சிராப்பள்ளி', 'சேலம்', 'திருநெல்வேலி',
+            'வேலூர்', 'ஈரோடு', 'தஞ்சாவூர்', 'தூத்துக்குடி', 'காஞ்சிபுரம்', 'புதுச்சேரி', 'பெங்களூரு', 'பெங்களூர்',
+            'மும்பை', 'டெல்லி', 'தில்லி', 'ஹைதராபாத்', 'கொல்கத்தா', 'தாம்பரம்', 'அண்ணா நகர்', 'தி நகர்'),
+)
+
+HINDI = NativeLexicon(
+    letters='ऀ-ॣॱ-ॿ',  # without the danda and the digits
+    digits='०१२३४५६७८९',
+    currency_before=r'(?:(?:रु|रू)[ऀ-ॿ]*\.?|₹|Rs\.?)',
+    currency_after=r'(?:(?:रु|रू)[ऀ-ॣॱ-ॿ]*|₹|/-|Rs\b)',
+    scales={'हज़ार': 1000, 'हजार': 1000, 'लाख': 100000, 'करोड़': 10000000, 'करोड': 10000000},
+    months=MONTH_NAMES['hi'] + ('फरवरी', 'सितम्बर', 'नवम्बर', 'दिसम्बर', 'अप्रेल'),
+    duration_units={'महीन': 'month', 'महिन': 'month', 'माह': 'month', 'मास': 'month', 'साल': 'year', 'वर्ष': 'year',
+                    'सप्ताह': 'week', 'हफ्त': 'week', 'हफ़्त': 'week', 'दिन': 'day'},
+    age=(r'(?:उम्र|आयु)\s*:?\s*(?P<age_value>\d{1,3})(?!\d)',
+         r'(?P<age_value_b>\d{1,3})\s*(?:वर्ष|साल)\s*(?:की|के)?\s*(?:उम्र|आयु)',
+         r'(?P<age_value_c>\d{1,3})\s*वर्षीय'),
+    pincode=r'(?:पिन\s*(?:कोड)?|पिनकोड)',
+    amount_cues=('किराया', 'किराये', 'किराए', 'कीमत', 'मूल्य', 'राशि', 'रकम', 'भुगतान', 'जमानत', 'ज़मानत'),
+    deposit_cues=('जमानत', 'ज़मानत', 'सुरक्षा राशि', 'सुरक्षा जमा', 'सिक्योरिटी', 'डिपॉजिट', 'अग्रिम', 'एडवांस'),
+    notice_cues=('नोटिस', 'सूचना'),
+    roles={
+        'मकान मालिक': 'landlord',
+        'मालिक': 'landlord',
+        'किरायेदार': 'tenant',
+        'किराएदार': 'tenant',
+        'विक्रेता': 'seller',
+        'क्रेता': 'buyer',
+        'खरीदार': 'buyer',
+        'प्रधान': 'principal',
+        'मुख्तार': 'attorney',
+        'अभिकर्ता': 'attorney',
+        'पट्टादाता': 'lessor',
+        'पट्टेदार': 'lessee',
+    },
+    honorifics=('श्रीमती', 'श्री', 'सुश्री', 'कुमारी', 'डॉ.', 'डॉ'),
+    between=(r'(?P<a>{W}(?:\s+{W})?)\s+(?:और|तथा|एवं)\s+(?P<b>{W}(?:\s+{W})?)\s+के\s+(?:बीच|मध्य)',),
+    case_suffixes=(),
+    stopwords=frozenset((
+        'और', 'तथा', 'एवं', 'के', 'की', 'का', 'में', 'से', 'को', 'ने', 'पर', 'तक', 'बीच', 'मध्य', 'लिए', 'साथ',
+        'है', 'हैं', 'एक', 'यह', 'जो', 'नाम', 'किराया', 'किराये', 'समझौता', 'अनुबंध', 'मकान', 'घर', 'संपत्ति',
+        'बनाएं', 'बनाइए', 'बनाओ', 'तैयार', 'करें', 'कीजिए', 'चाहिए', 'मासिक', 'प्रति', 'महीना', 'उम्र', 'आयु',
+        'हिंदी', 'हिन्दी', 'अंग्रेजी', 'पता', 'निवासी', 'दिनांक', 'तारीख',
+    )),
+    places=('दिल्ली', 'नई दिल्ली', 'मुंबई', 'कोलकाता', 'चेन्नई', 'बेंगलुरु', 'बैंगलोर', 'हैदराबाद', 'पुणे', 'जयपुर',
+            'लखनऊ', 'कानपुर', 'पटना', 'भोपाल', 'इंदौर', 'वाराणसी', 'अहमदाबाद', 'नोएडा', 'गुरुग्राम', 'गुड़गांव',
+            'चंडीगढ़', 'आगरा', 'नागपुर', 'सूरत', 'देहरादून'),
+)
+
+LEXICONS = {'ta': TAMIL, 'hi': HINDI}
+
+_NUMBER = r'\d+(?:,\d+)*(?:\.\d{1,2})?'
+
+
+def _alternation(words) -> str:
+    return '|'.join(re.escape(word) for word in sorted(words, key=len, reverse=True))
+
+
+def _cue(stems, reach: int) -> Pattern:
+    """Cue that must end right before a span, within the same clause, as used by ``assign_roles``."""
+    return re.compile(rf'(?:{_alternation(stems)})[^\d,;।|]{{0,{reach}}}$')
+
+
+def _cue_after(stems, letters: str) -> Pattern:
+    """Cue that follows a span directly or after one short particle ("50000 रुपये की जमानत")."""
+    return re.compile(rf'\s*(?:[{letters}]{{1,3}}\s+)?(?:{_alternation(stems)})')
+
+
+class NativeExtractor:
+    """Span extractor for one language, built from its ``NativeLexicon``."""
+
+    def __init__(self, lexicon: NativeLexicon):
+        self.lexicon = lexicon
+        self.amount_cue = _cue(lexicon.amount_cues, 20)
+        self.deposit_cue = _cue(lexicon.deposit_cues, 20)
+        self.notice_cue = _cue(lexicon.notice_cues, 25)
+        self.amount_cue_after = _cue_after(lexicon.amount_cues, lexicon.letters)
+        self.deposit_cue_after = _cue_after(lexicon.deposit_cues, lexicon.letters)
+        self.notice_cue_after = _cue_after(lexicon.notice_cues, lexicon.letters)
+        self._digits = str.maketrans(lexicon.digits, '0123456789')
+        self._letter = re.compile(f'[{lexicon.letters}]')
+        word = f'[{lexicon.letters}]+'
+        self._name_word = re.compile(rf'\s*({word})')
+        self._word_tail = re.compile(f'[{lexicon.letters}]*\\.?[\\s:,(\\-]*')
+        self._between = tuple(re.compile(f'(?<![{lexicon.letters}])' + pattern.replace('{W}', word))
+                              for pattern in lexicon.between)
+        self._scanner = self._compile_scanner()
+        self._stopwords = (set(lexicon.stopwords) | set(lexicon.months) | set(lexicon.scales)
+                           | set(lexicon.honorifics) | {cue.split()[0] for cue in lexicon.roles})
+        # Words that begin with a place or a role word ("சென்னையில்", "किरायेदारों") are never names
+        self._stop_prefix = re.compile(_alternation(set(lexicon.places) | {cue.split()[-1] for cue in lexicon.roles}))
+
+        self._gazetteer = KeywordAutomaton()
+        for cue, field in lexicon.roles.items():
+            self._gazetteer.add(cue, ('role', field))
+        for honorific in lexicon.honorifics:
+            self._gazetteer.add(honorific, ('honorific', None))
+        for place in lexicon.places:
+            self._gazetteer.add(place, ('place', place))
+        self._gazetteer.build()
+
+    def _compile_scanner(self) -> Pattern:
+        lexicon = self.lexicon
+        months = _alternation(lexicon.months)
+        scales = _alternation(lexicon.scales)
+        # Order matters as in ``entity_scanner``: dates and ages before plain numbers
+        patterns = (
+            ('date', rf'(?<!\d)\d{{1,2}}[-/.]\d{{1,2}}[-/.]\d{{4}}(?!\d)'
+                     rf'|(?<!\d)\d{{1,2}}\s*(?:{months})\s*,?\s*\d{{4}}(?!\d)'
+                     rf'|(?:{months})\s+\d{{1,2}}\s*,\s*\d{{4}}(?!\d)'),
+            ('age', '|'.join(lexicon.age)),
+            ('duration', rf'(?<!\d)(?P<duration_value>\d+)\s*(?P<duration_unit>{_alternation(lexicon.duration_units)})[{lexicon.letters}]*'),
+            ('pincode', rf'{lexicon.pincode}\s*[:\-]?\s*(?P<pincode_value>\d{{6}})(?!\d)'
+                        rf'|(?<=-)\s?(?P<pincode_value_b>\d{{6}})(?!\d)'),
+            ('amount', rf'{lexicon.currency_before}\s*(?P<amount_value>{_NUMBER})(?:\s*(?P<amount_scale>{scales}))?'
+                       rf'|(?<!\d)(?P<amount_value_b>{_NUMBER})(?:\s*(?P<amount_scale_b>{scales}))?\s*{lexicon.currency_after}'
+                       rf'|(?<!\d)(?P<amount_value_c>{_NUMBER})\s*(?P<amount_scale_c>{scales})'),
+            # Unmarked numbers count as amounts only next to an amount cue (see ``assign_roles``)
+            ('number', rf'(?<!\d)(?!(?:19|20)\d\d(?!\d))(?P<number_value>\d{{1,3}}(?:,\d{{2,3}})+|\d{{4,9}})(?!\d|,\d)'),
+        )
+        return re.compile('|'.join(f'(?P<{kind}>{pattern})' for kind, pattern in patterns), re.IGNORECASE)
+
+    def spans(self, prompt: str) -> List[EntitySpan]:
+        """Return the typed spans of ``prompt``; named parties have kind ``party`` and their field as value."""
+        text = prompt.translate(self._digits)
+        spans = self._scan(text)
+        names: Dict[int, EntitySpan] = {}
+        for start, (kind, payload) in self._matches(text):
+            if kind == 'place':
+                spans.append(EntitySpan('place', payload, payload, start, start + len(payload)))
+                continue
+            end = start + len(self._keyword_at(text, start, kind))
+            if kind == 'honorific' and self._letter.match(text, end):
+                continue  # "திரு" at the start of "திருநெல்வேலி"
+            after = self._word_tail.match(text, end)
+            name = self._read_name(text, after.end())
+            if name and (kind == 'role' or name.start not in names):
+                names[name.start] = name._replace(kind='party', value=payload) if kind == 'role' else name
+        for pattern in self._between:
+            for match in pattern.finditer(text):
+                for group in ('a', 'b'):
+                    name = self._clean_name(match.group(group), match.start(group))
+                    if name and name.start not in names:
+                        names[name.start] = name
+        spans.extend(names.values())
+        return spans
+
+    def _scan(self, text: str) -> List[EntitySpan]:
+        spans = []
+        for match in self._scanner.finditer(text):
+            kind = match.lastgroup
+            groups = match.groupdict()
+            value = next((groups[name] for name in sorted(groups)
+                          if name.startswith(f'{kind}_value') and groups[name] is not None), match.group(0))
+            if kind in ('amount', 'number'):
+                value = value.replace(',', '')
+                scale = next((groups[name] for name in groups if name.startswith('amount_scale') and groups[name]), None)
+                if scale:
+                    value = f'{round(float(value) * self.lexicon.scales[scale.lower()]):d}'
+            elif kind == 'duration':
+                value = f"{value} {self.lexicon.duration_units[groups['duration_unit']]}"
+            spans.append(EntitySpan(kind, match.group(0).strip(), value, match.start(), match.end()))
+        return spans
+
+    def _matches(self, text: str):
+        """Gazetteer matches that start on a word boundary of this script."""
+        for start, payload in sorted(self._gazetteer.find(text), key=lambda match: match[0]):
+            if start and self._letter.match(text, start - 1):
+                continue  # inside a word: "क्रेता" in "विक्रेता"
+            yield start, payload
+
+    def _keyword_at(self, text: str, start: int, kind: str) -> str:
+        """The longest role word or honorific starting at ``start``."""
+        if kind == 'role':
+            candidates = self.lexicon.roles
+        else:
+            candidates = self.lexicon.honorifics
+        return max((word for word in candidates if text.startswith(word, start)), key=len)
+
+    def _read_name(self, text: str, position: int) -> Optional[EntitySpan]:
+        """Read up to ``NAME_WORDS`` name words at ``position``, skipping a leading honorific."""
+        words: List[Tuple[int, str]] = []
+        while len(words) < NAME_WORDS:
+            match = self._name_word.match(text, position)
+            if not match:
+                break
+            word = match.group(1)
+            if not words and word.rstrip('.') in self.lexicon.honorifics:
+                position = self._word_tail.match(text, match.end()).end()
+                continue
+            if self._is_stopword(word):
+                break
+            words.append((match.start(1), word))
+            position = match.end()
+            if self._strip_suffix(word) != word or text.startswith(',', position):
+                break
+        if not words:
+            return None
+        return self._name_span(words)
+
+    def _clean_name(self, phrase: str, start: int) -> Optional[EntitySpan]:
+        """Turn the words of a "between" group into a name, dropping leading stopwords."""
+        words = []
+        for match in re.finditer(r'\S+', phrase):
+            if words or not self._is_stopword(match.group()):
+                words.append((start + match.start(), match.group()))
+        if not words or any(self._is_stopword(word) for _, word in words):
+            return None
+        return self._name_span(words)
+
+    def _name_span(self, words: List[Tuple[int, str]]) -> EntitySpan:
+        start = words[0][0]
+        end = words[-1][0] + len(words[-1][1])
+        name = ' '.join([word for _, word in words[:-1]] + [self._strip_suffix(words[-1][1])])
+        return EntitySpan('person', name, name, start, end)
+
+    def _is_stopword(self, word: str) -> bool:
+        return word in self._stopwords or self._stop_prefix.match(word) is not None
+
+    def _strip_suffix(self, word: str) -> str:
+        for suffix, replacement in self.lexicon.case_suffixes:
+            if word.endswith(suffix) and len(word) > len(suffix) + 1:
+                return word[:-len(suffix)] + replacement
+        return word
+
+
+NATIVE_EXTRACTORS = {language: NativeExtractor(lexicon) for language, lexicon in LEXICONS.items()}
@@ -0,0 +1,180 @@
+"""Process-wide registry of spaCy pipelines.
+
+Every pipeline is loaded at most once per process, either lazily on first use
+or eagerly through ``warm_up``. Callers that only need some components get a
+``PipelineView`` that shares the loaded weights and disables the rest per call.
+"""
+import os
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_PIPELINE = 'en_core_web_sm'
+RULES_PIPELINE = 'rules'
+BUNDLED_MODEL_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'models')
+
+_lock = threading.RLock()
+_pipelines: Dict[str, object] = {}
+_stats: Dict[str, Dict] = {}
+_builders: Dict[str, Callable[[], object]] = {}
+_views: Dict[Tuple, 'PipelineView'] = {}
+
+
+def _rss_bytes() -> int:
+    """Return the resident set size of the current process in bytes."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        import resource
+        import sys
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+        return rss if sys.platform == 'darwin' else rss * 1024
+
+
+def model_search_paths(name: str) -> List[str]:
+    """Local directories checked for ``name``, in order.
+
+    ``SPACY_MODEL_DIR`` may point at the model data directory itself or at a
+    directory that contains it; ``models/<name>`` in the project is the
+    bundled location filled by ``scripts/provision_spacy_model.py``.
+    """
+    paths = []
+    configured = os.getenv('SPACY_MODEL_DIR')
+    if configured:
+        paths.extend([configured, os.path.join(configured, name)])
+    paths.append(os.path.join(BUNDLED_MODEL_DIR, name))
+    return paths
+
+
+def _load_model(name: str):
+    """Load ``name`` from a local path or installed package, never from the network.
+
+    Returns ``(nlp, mode, source)``. When no model is available and
+    ``SPACY_ALLOW_FALLBACK`` is not disabled, the rule-based pipeline is used
+    instead so the app still boots in bounded time.
+    """
+    import spacy
+
+    for path in model_search_paths(name):
+        if os.path.isfile(os.path.join(path, 'config.cfg')):
+            return spacy.load(path), 'model', path
+    try:
+        return spacy.load(name), 'model', 'package'
+    except OSError as e:
+        if os.getenv('SPACY_ALLOW_FALLBACK', '1').lower() in ('0', 'false', 'no'):
+            raise
+        print(f"spaCy model '{name}' is not available ({e}). Falling back to the rule-based pipeline.")
+        return load_pipeline(RULES_PIPELINE), 'fallback', RULES_PIPELINE
+
+
+def _build_rules():
+    from app.services.entity_rules import build_rule_pipeline
+    return build_rule_pipeline()
+
+
+def register_pipeline(name: str, builder: Callable[[], object]) -> None:
+    """Register a custom builder used instead of ``spacy.load`` for ``name``."""
+    with _lock:
+        _builders[name] = builder
+
+
+register_pipeline(RULES_PIPELINE, _build_rules)
+
+
+class PipelineView:
+    """A callable view over a shared pipeline that only runs selected components."""
+
+    def __init__(self, nlp, disable: Tuple[str, ...] = ()):
+        self.nlp = nlp
+        self.disable = list(disable)
+
+    @property
+    def pipe_names(self):
+        return [name for name in self.nlp.pipe_names if name not in self.disable]
+
+    def __call__(self, text):
+        return self.nlp(text, disable=self.disable)
+
+    def pipe(self, texts, **kwargs):
+        return self.nlp.pipe(texts, disable=self.disable, **kwargs)
+
+
+def load_pipeline(name: str = DEFAULT_PIPELINE):
+    """Return the full pipeline ``name``, loading it on first use."""
+    nlp = _pipelines.get(name)
+    if nlp is not None:
+        return nlp
+
+    with _lock:
+        nlp = _pipelines.get(name)
+        if nlp is not None:
+            return nlp
+
+        rss_before = _rss_bytes()
+        started = time.perf_counter()
+        builder = _builders.get(name)
+        if builder:
+            nlp, mode, source = builder(), 'builder', name
+        else:
+            nlp, mode, source = _load_model(name)
+        _stats[name] = {
+            'mode': mode,
+            'source': source,
+            'load_seconds': round(time.perf_counter() - started, 4),
+            'rss_delta_bytes': max(_rss_bytes() - rss_before, 0),
+            'components': list(nlp.pipe_names),
+            'pid': os.getpid(),
+        }
+        _pipelines[name] = nlp
+        return nlp
+
+
+def get_pipeline(name: str = DEFAULT_PIPELINE, enable: Optional[Iterable[str]] = None) -> PipelineView:
+    """Return a view of pipeline ``name`` running only the ``enable`` components.
+
+    ``enable=None`` runs every component. Components that are not part of the
+    loaded pipeline are ignored, so ``enable=('ner',)`` works for any model.
+    """
+    key = (name, None if enable is None else frozenset(enable))
+    view = _views.get(key)
+    if view is not None:
+        return view
+
+    nlp = load_pipeline(name)
+    # The rule-based fallback has no statistical components to select from
+    if enable is None or _stats[name]['mode'] == 'fallback':
+        return _views.setdefault(key, PipelineView(nlp))
+    wanted = set(enable)
+    # Components such as the tagger and parser listen to a shared tok2vec
+    if 'tok2vec' in nlp.pipe_names:
+        listeners = getattr(nlp.get_pipe('tok2vec'), 'listening_components', [])
+        if wanted.intersection(listeners):
+            wanted.add('tok2vec')
+    return _views.setdefault(key, PipelineView(nlp, tuple(pipe for pipe in nlp.pipe_names if pipe not in wanted)))
+
+
+def warm_up(names: Iterable[str] = (DEFAULT_PIPELINE,)) -> Dict[str, Dict]:
+    """Eagerly load the given pipelines and return their load statistics."""
+    for name in names:
+        load_pipeline(name)
+    return pipeline_stats()
+
+
+def is_loaded(name: str = DEFAULT_PIPELINE) -> bool:
+    return name in _pipelines
+
+
+def pipeline_mode(name: str = DEFAULT_PIPELINE) -> Optional[str]:
+    """Return how a pipeline was loaded (``'model'``, ``'fallback'`` or ``'builder'``), ``None`` if not loaded."""
+    stats = _stats.get(name)
+    return stats['mode'] if stats else None
+
+
+def pipeline_stats() -> Dict[str, Dict]:
+    """Return load time and resident size for every loaded pipeline."""
+    return {
+        'pipelines': {name: dict(stats) for name, stats in _stats.items()},
+        'process_rss_bytes': _rss_bytes(),
+    }
@@ -0,0 +1,313 @@
+"""Offline amount-to-words conversion in the Indian numbering system.
+
+Amounts are spelled with thousand, lakh and crore groups in every language
+the templates ship in. Each language is described by a lookup table: the
+words for 0-99 (spelled out in full where the language's numbers are
+irregular, composed from tens and units otherwise), the hundreds, and the
+scale words in their standalone and "followed by more" forms. The words for
+0-999 are precomputed per language on first use, so converting an amount is
+a handful of table lookups.
+"""
+import re
+import threading
+from typing import Dict, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+
+class Scale(NamedTuple):
+    one: str          # exactly one of the unit, nothing after it
+    one_joined: str   # one of the unit, followed by a smaller group
+    many: str         # after a count of two or more
+    many_joined: str
+
+
+class LanguageTable(NamedTuple):
+    below_100: Sequence[str]
+    hundreds: Sequence[str]          # 100..900, standalone
+    hundreds_joined: Sequence[str]   # 100..900, followed by the rest of the group
+    thousand: Scale
+    lakh: Scale
+    crore: Scale
+    attributive: Dict[str, str] = {}  # final word replacements for a count before a scale word
+
+
+def _compose(units: Sequence[str], teens: Sequence[str], tens: Sequence[str], tens_joined: Sequence[str]) -> List[str]:
+    """Build 0-99 from units, 10-19 and tens for languages that say "twenty one"."""
+    words = list(units) + list(teens)
+    for ten in range(2, 10):
+        words.append(tens[ten - 2])
+        words.extend(f'{tens_joined[ten - 2]} {unit}' for unit in units[1:])
+    return words
+
+
+def _split(words: str) -> List[str]:
+    return words.split()
+
+
+_EN_UNITS = _split('Zero One Two Three Four Five Six Seven Eight Nine')
+
+TABLES: Dict[str, LanguageTable] = {
+    'en': LanguageTable(
+        below_100=_compose(
+            _EN_UNITS,
+            _split('Ten Eleven Twelve Thirteen Fourteen Fifteen Sixteen Seventeen Eighteen Nineteen'),
+            _split('Twenty Thirty Forty Fifty Sixty Seventy Eighty Ninety'),
+            _split('Twenty Thirty Forty Fifty Sixty Seventy Eighty Ninety'),
+        ),
+        hundreds=[f'{unit} Hundred' for unit in _EN_UNITS[1:]],
+        hundreds_joined=[f'{unit} Hundred' for unit in _EN_UNITS[1:]],
+        thousand=Scale('One Thousand', 'One Thousand', 'Thousand', 'Thousand'),
+        lakh=Scale('One Lakh', 'One Lakh', 'Lakh', 'Lakh'),
+        crore=Scale('One Crore', 'One Crore', 'Crore', 'Crore'),
+    ),
+    'hi': LanguageTable(
+        below_100=_split(
+            'शून्य एक दो तीन चार पाँच छह सात आठ नौ '
+            'दस ग्यारह बारह तेरह चौदह पंद्रह सोलह सत्रह अठारह उन्नीस '
+            'बीस इक्कीस बाईस तेईस चौबीस पच्चीस छब्बीस सत्ताईस अट्ठाईस उनतीस '
+            'तीस इकतीस बत्तीस तैंतीस चौंतीस पैंतीस छत्तीस सैंतीस अड़तीस उनतालीस '
+            'चालीस इकतालीस बयालीस तैंतालीस चवालीस पैंतालीस छियालीस सैंतालीस अड़तालीस उनचास '
+            'पचास इक्यावन बावन तिरपन चौवन पचपन छप्पन सत्तावन अट्ठावन उनसठ '
+            'साठ इकसठ बासठ तिरसठ चौंसठ पैंसठ छियासठ सड़सठ अड़सठ उनहत्तर '
+            'सत्तर इकहत्तर बहत्तर तिहत्तर चौहत्तर पचहत्तर छिहत्तर सतहत्तर अठहत्तर उन्यासी '
+            'अस्सी इक्यासी बयासी तिरासी चौरासी पचासी छियासी सत्तासी अट्ठासी नवासी '
+            'नब्बे इक्यानबे बानबे तिरानबे चौरानबे पंचानबे छियानबे सत्तानबे अट्ठानबे निन्यानबे'
+        ),
+        hundreds=[f'{unit} सौ' for unit in _split('एक दो तीन चार पाँच छह सात आठ नौ')],
+        hundreds_joined=[f'{unit} सौ' for unit in _split('एक दो तीन चार पाँच छह सात आठ नौ')],
+        thousand=Scale('एक हज़ार', 'एक हज़ार', 'हज़ार', 'हज़ार'),
+        lakh=Scale('एक लाख', 'एक लाख', 'लाख', 'लाख'),
+        crore=Scale('एक करोड़', 'एक करोड़', 'करोड़', 'करोड़'),
+    ),
+    'mr': LanguageTable(
+        below_100=_split(
+            'शून्य एक दोन तीन चार पाच सहा सात आठ नऊ '
+            'दहा अकरा बारा तेरा चौदा पंधरा सोळा सतरा अठरा एकोणीस '
+            'वीस एकवीस बावीस तेवीस चोवीस पंचवीस सव्वीस सत्तावीस अठ्ठावीस एकोणतीस '
+            'तीस एकतीस बत्तीस तेहेतीस चौतीस पस्तीस छत्तीस सदतीस अडतीस एकोणचाळीस '
+            'चाळीस एक्केचाळीस बेचाळीस त्रेचाळीस चव्वेचाळीस पंचेचाळीस सेहेचाळीस सत्तेचाळीस अठ्ठेचाळीस एकोणपन्नास '
+            'पन्नास एक्कावन्न बावन्न त्रेपन्न चोपन्न पंचावन्न छप्पन्न सत्तावन्न अठ्ठावन्न एकोणसाठ '
+            'साठ एकसष्ठ बासष्ठ त्रेसष्ठ चौसष्ठ पासष्ठ सहासष्ठ सदुसष्ठ अडुसष्ठ एकोणसत्तर '
+            'सत्तर एकाहत्तर बाहत्तर त्र्याहत्तर चौऱ्याहत्तर पंच्याहत्तर शहात्तर सत्याहत्तर अठ्ठ्याहत्तर एकोणऐंशी '
+            'ऐंशी एक्याऐंशी ब्याऐंशी त्र्याऐंशी चौऱ्याऐंशी पंच्याऐंशी शहाऐंशी सत्त्याऐंशी अठ्ठ्याऐंशी एकोणनव्वद '
+            'नव्वद एक्याण्णव ब्याण्णव त्र्याण्णव चौऱ्याण्णव पंच्याण्णव शहाण्णव सत्त्याण्णव अठ्ठ्याण्णव नव्याण्णव'
+        ),
+        hundreds=_split('शंभर दोनशे तीनशे चारशे पाचशे सहाशे सातशे आठशे नऊशे'),
+        hundreds_joined=_split('एकशे दोनशे तीनशे चारशे पाचशे सहाशे सातशे आठशे नऊशे'),
+        thousand=Scale('एक हजार', 'एक हजार', 'हजार', 'हजार'),
+        lakh=Scale('एक लाख', 'एक लाख', 'लाख', 'लाख'),
+        crore=Scale('एक कोटी', 'एक कोटी', 'कोटी', 'कोटी'),
+    ),
+    'gu': LanguageTable(
+        below_100=_split(
+            'શૂન્ય એક બે ત્રણ ચાર પાંચ છ સાત આઠ નવ '
+            'દસ અગિયાર બાર તેર ચૌદ પંદર સોળ સત્તર અઢાર ઓગણીસ '
+            'વીસ એકવીસ બાવીસ તેવીસ ચોવીસ પચ્ચીસ છવ્વીસ સત્તાવીસ અઠ્ઠાવીસ ઓગણત્રીસ '
+            'ત્રીસ એકત્રીસ બત્રીસ તેત્રીસ ચોત્રીસ પાંત્રીસ છત્રીસ સાડત્રીસ આડત્રીસ ઓગણચાલીસ '
+            'ચાલીસ એકતાલીસ બેતાલીસ તેતાલીસ ચુંમાલીસ પિસ્તાલીસ છેતાલીસ સુડતાલીસ અડતાલીસ ઓગણપચાસ '
+            'પચાસ એકાવન બાવન ત્રેપન ચોપન પંચાવન છપ્પન સત્તાવન અઠ્ઠાવન ઓગણસાઠ '
+            'સાઠ એકસઠ બાસઠ ત્રેસઠ ચોસઠ પાંસઠ છાસઠ સડસઠ અડસઠ ઓગણસિત્તેર '
+            'સિત્તેર એકોતેર બોતેર તોતેર ચુમોતેર પંચોતેર છોતેર સિત્યોતેર ઇઠ્યોતેર ઓગણએંસી '
+            'એંસી એક્યાસી બ્યાસી ત્યાસી ચોર્યાસી પંચાસી છ્યાસી સિત્યાસી ઈઠ્યાસી નેવ્યાસી '
+            'નેવું એકાણું બાણું ત્રાણું ચોરાણું પંચાણું છન્નું સત્તાણું અઠ્ઠાણું નવ્વાણું'
+        ),
+        hundreds=_split('એકસો બસો ત્રણસો ચારસો પાંચસો છસો સાતસો આઠસો નવસો'),
+        hundreds_joined=_split('એકસો બસો ત્રણસો ચારસો પાંચસો છસો સાતસો આઠસો નવસો'),
+        thousand=Scale('એક હજાર', 'એક હજાર', 'હજાર', 'હજાર'),
+        lakh=Scale('એક લાખ', 'એક લાખ', 'લાખ', 'લાખ'),
+        crore=Scale('એક કરોડ', 'એક કરોડ', 'કરોડ', 'કરોડ'),
+    ),
+    'bn': LanguageTable(
+        below_100=_split(
+            'শূন্য এক দুই তিন চার পাঁচ ছয় সাত আট নয় '
+            'দশ এগারো বারো তেরো চোদ্দ পনেরো ষোলো সতেরো আঠারো উনিশ '
+            'কুড়ি একুশ বাইশ তেইশ চব্বিশ পঁচিশ ছাব্বিশ সাতাশ আটাশ ঊনত্রিশ '
+            'ত্রিশ একত্রিশ বত্রিশ তেত্রিশ চৌত্রিশ পঁয়ত্রিশ ছত্রিশ সাঁইত্রিশ আটত্রিশ ঊনচল্লিশ '
+            'চল্লিশ একচল্লিশ বিয়াল্লিশ তেতাল্লিশ চুয়াল্লিশ পঁয়তাল্লিশ ছেচল্লিশ সাতচল্লিশ আটচল্লিশ ঊনপঞ্চাশ '
+            'পঞ্চাশ একান্ন বাহান্ন তিপ্পান্ন চুয়ান্ন পঞ্চান্ন ছাপ্পান্ন সাতান্ন আটান্ন ঊনষাট '
+            'ষাট একষট্টি বাষট্টি তেষট্টি চৌষট্টি পঁয়ষট্টি ছেষট্টি সাতষট্টি আটষট্টি ঊনসত্তর '
+            'সত্তর একাত্তর বাহাত্তর তিয়াত্তর চুয়াত্তর পঁচাত্তর ছিয়াত্তর সাতাত্তর আটাত্তর ঊনআশি '
+            'আশি একাশি বিরাশি তিরাশি চুরাশি পঁচাশি ছিয়াশি সাতাশি আটাশি ঊননব্বই '
+            'নব্বই একানব্বই বিরানব্বই তিরানব্বই চুরানব্বই পঁচানব্বই ছিয়ানব্বই সাতানব্বই আটানব্বই নিরানব্বই'
+        ),
+        hundreds=_split('একশো দুশো তিনশো চারশো পাঁচশো ছশো সাতশো আটশো নশো'),
+        hundreds_joined=_split('একশো দুশো তিনশো চারশো পাঁচশো ছশো সাতশো আটশো নশো'),
+        thousand=Scale('এক হাজার', 'এক হাজার', 'হাজার', 'হাজার'),
+        lakh=Scale('এক লক্ষ', 'এক লক্ষ', 'লক্ষ', 'লক্ষ'),
+        crore=Scale('এক কোটি', 'এক কোটি', 'কোটি', 'কোটি'),
+    ),
+    'or': LanguageTable(
+        below_100=_split(
+            'ଶୂନ ଏକ ଦୁଇ ତିନି ଚାରି ପାଞ୍ଚ ଛଅ ସାତ ଆଠ ନଅ '
+            'ଦଶ ଏଗାର ବାର ତେର ଚଉଦ ପନ୍ଦର ଷୋହଳ ସତର ଅଠର ଊଣେଇଶି '
+            'କୋଡ଼ିଏ ଏକୋଇଶି ବାଇଶି ତେଇଶି ଚବିଶି ପଚିଶି ଛବିଶି ସତାଇଶି ଅଠାଇଶି ଅଣତିରିଶି '
+            'ତିରିଶି ଏକତିରିଶି ବତିଶି ତେତିଶି ଚଉତିରିଶି ପଞ୍ଚତିରିଶି ଛତିଶି ସଇଁତିରିଶି ଅଠତିରିଶି ଅଣଚାଳିଶି '
+            'ଚାଳିଶି ଏକଚାଳିଶି ବୟାଳିଶି ତେୟାଳିଶି ଚଉରାଳିଶି ପଞ୍ଚଚାଳିଶି ଛୟାଳିଶି ସତଚାଳିଶି ଅଠଚାଳିଶି ଅଣଚାଶ '
+            'ପଚାଶ ଏକାବନ ବାଉନ ତେପନ ଚଉବନ ପଞ୍ଚାବନ ଛପନ ସନ୍ତାବନ ଅଠାବନ ଅଣଷଠି '
+            'ଷାଠିଏ ଏକଷଠି ବାଷଠି ତେଷଠି ଚଉଷଠି ପଞ୍ଚଷଠି ଛଅଷଠି ସତଷଠି ଅଠଷଠି ଅଣସ୍ତରି '
+            'ସତୁରି ଏକସ୍ତରି ବାସ୍ତରି ତେସ୍ତରି ଚଉସ୍ତରି ପଞ୍ଚସ୍ତରି ଛଅସ୍ତରି ସତସ୍ତରି ଅଠସ୍ତରି ଅଣାଅଶୀ '
+            'ଅଶୀ ଏକାଅଶୀ ବୟାଅଶୀ ତେୟାଅଶୀ ଚଉରାଅଶୀ ପଞ୍ଚାଅଶୀ ଛୟାଅଶୀ ସତାଅଶୀ ଅଠାଅଶୀ ଅଣାନବେ '
+            'ନବେ ଏକାନବେ ବୟାନବେ ତେୟାନବେ ଚଉରାନବେ ପଞ୍ଚାନବେ ଛୟାନବେ ସତାନବେ ଅଠାନବେ ଅନେଶତ'
+        ),
+        hundreds=[f'{unit} ଶହ' for unit in _split('ଏକ ଦୁଇ ତିନି ଚାରି ପାଞ୍ଚ ଛଅ ସାତ ଆଠ ନଅ')],
+        hundreds_joined=[f'{unit} ଶହ' for unit in _split('ଏକ ଦୁଇ ତିନି ଚାରି ପାଞ୍ଚ ଛଅ ସାତ ଆଠ ନଅ')],
+        thousand=Scale('ଏକ ହଜାର', 'ଏକ ହଜାର', 'ହଜାର', 'ହଜାର'),
+        lakh=Scale('ଏକ ଲକ୍ଷ', 'ଏକ ଲକ୍ଷ', 'ଲକ୍ଷ', 'ଲକ୍ଷ'),
+        crore=Scale('ଏକ କୋଟି', 'ଏକ କୋଟି', 'କୋଟି', 'କୋଟି'),
+    ),
+    'ur': LanguageTable(
+        below_100=_split(
+            'صفر ایک دو تین چار پانچ چھ سات آٹھ نو '
+            'دس گیارہ بارہ تیرہ چودہ پندرہ سولہ سترہ اٹھارہ انیس '
+            'بیس اکیس بائیس تئیس چوبیس پچیس چھبیس ستائیس اٹھائیس انتیس '
+            'تیس اکتیس بتیس تینتیس چونتیس پینتیس چھتیس سینتیس اڑتیس انتالیس '
+            'چالیس اکتالیس بیالیس تینتالیس چوالیس پینتالیس چھیالیس سینتالیس اڑتالیس انچاس '
+            'پچاس اکاون باون ترپن چون پچپن چھپن ستاون اٹھاون انسٹھ '
+            'ساٹھ اکسٹھ باسٹھ تریسٹھ چونسٹھ پینسٹھ چھیاسٹھ سڑسٹھ اڑسٹھ انہتر '
+            'ستر اکہتر بہتر تہتر چوہتر پچہتر چھہتر ستتر اٹھہتر اناسی '
+            'اسی اکیاسی بیاسی تراسی چوراسی پچاسی چھیاسی ستاسی اٹھاسی نواسی '
+            'نوے اکانوے بانوے ترانوے چورانوے پچانوے چھیانوے ستانوے اٹھانوے ننانوے'
+        ),
+        hundreds=[f'{unit} سو' for unit in _split('ایک دو تین چار پانچ چھ سات آٹھ نو')],
+        hundreds_joined=[f'{unit} سو' for unit in _split('ایک دو تین چار پانچ چھ سات آٹھ نو')],
+        thousand=Scale('ایک ہزار', 'ایک ہزار', 'ہزار', 'ہزار'),
+        lakh=Scale('ایک لاکھ', 'ایک لاکھ', 'لاکھ', 'لاکھ'),
+        crore=Scale('ایک کروڑ', 'ایک کروڑ', 'کروڑ', 'کروڑ'),
+    ),
+    'ta': LanguageTable(
+        below_100=_compose(
+            _split('பூஜ்ஜியம் ஒன்று இரண்டு மூன்று நான்கு ஐந்து ஆறு ஏழு எட்டு ஒன்பது'),
+            _split('பத்து பதினொன்று பன்னிரண்டு பதின்மூன்று பதினான்கு பதினைந்து பதினாறு பதினேழு பதினெட்டு பத்தொன்பது'),
+            _split('இருபது முப்பது நாற்பது ஐம்பது அறுபது எழுபது எண்பது தொண்ணூறு'),
+            _split('இருபத்தி முப்பத்தி நாற்பத்தி ஐம்பத்தி அறுபத்தி எழுபத்தி எண்பத்தி தொண்ணூற்றி'),
+        ),
+        hundreds=_split('நூறு இருநூறு முன்னூறு நானூறு ஐநூறு அறுநூறு எழுநூறு எண்ணூறு தொள்ளாயிரம்'),
+        hundreds_joined=_split('நூற்று இருநூற்று முன்னூற்று நானூற்று ஐநூற்று அறுநூற்று எழுநூற்று எண்ணூற்று தொள்ளாயிரத்து'),
+        thousand=Scale('ஆயிரம்', 'ஆயிரத்து', 'ஆயிரம்', 'ஆயிரத்து'),
+        lakh=Scale('ஒரு லட்சம்', 'ஒரு லட்சத்து', 'லட்சம்', 'லட்சத்து'),
+        crore=Scale('ஒரு கோடி', 'ஒரு கோடியே', 'கோடி', 'கோடியே'),
+        attributive={'ஒன்று': 'ஒரு'},
+    ),
+    'te': LanguageTable(
+        below_100=_compose(
+            _split('సున్నా ఒకటి రెండు మూడు నాలుగు ఐదు ఆరు ఏడు ఎనిమిది తొమ్మిది'),
+            _split('పది పదకొండు పన్నెండు పదమూడు పద్నాలుగు పదిహేను పదహారు పదిహేడు పద్దెనిమిది పందొమ్మిది'),
+            _split('ఇరవై ముప్పై నలభై యాభై అరవై డెబ్బై ఎనభై తొంభై'),
+            _split('ఇరవై ముప్పై నలభై యాభై అరవై డెబ్బై ఎనభై తొంభై'),
+        ),
+        hundreds=['వంద'] + [f'{unit} వందలు' for unit in _split('రెండు మూడు నాలుగు ఐదు ఆరు ఏడు ఎనిమిది తొమ్మిది')],
+        hundreds_joined=['నూట'] + [f'{unit} వందల' for unit in _split('రెండు మూడు నాలుగు ఐదు ఆరు ఏడు ఎనిమిది తొమ్మిది')],
+        thousand=Scale('వెయ్యి', 'వెయ్యి', 'వేలు', 'వేల'),
+        lakh=Scale('ఒక లక్ష', 'ఒక లక్ష', 'లక్షలు', 'లక్షల'),
+        crore=Scale('ఒక కోటి', 'ఒక కోటి', 'కోట్లు', 'కోట్ల'),
+        attributive={'ఒకటి': 'ఒక'},
+    ),
+    'kn': LanguageTable(
+        below_100=_compose(
+            _split('ಸೊನ್ನೆ ಒಂದು ಎರಡು ಮೂರು ನಾಲ್ಕು ಐದು ಆರು ಏಳು ಎಂಟು ಒಂಬತ್ತು'),
+            _split('ಹತ್ತು ಹನ್ನೊಂದು ಹನ್ನೆರಡು ಹದಿಮೂರು ಹದಿನಾಲ್ಕು ಹದಿನೈದು ಹದಿನಾರು ಹದಿನೇಳು ಹದಿನೆಂಟು ಹತ್ತೊಂಬತ್ತು'),
+            _split('ಇಪ್ಪತ್ತು ಮೂವತ್ತು ನಲವತ್ತು ಐವತ್ತು ಅರವತ್ತು ಎಪ್ಪತ್ತು ಎಂಬತ್ತು ತೊಂಬತ್ತು'),
+            _split('ಇಪ್ಪತ್ತು ಮೂವತ್ತು ನಲವತ್ತು ಐವತ್ತು ಅರವತ್ತು ಎಪ್ಪತ್ತು ಎಂಬತ್ತು ತೊಂಬತ್ತು'),
+        ),
+        hundreds=_split('ನೂರು ಇನ್ನೂರು ಮುನ್ನೂರು ನಾನ್ನೂರು ಐನೂರು ಆರುನೂರು ಏಳುನೂರು ಎಂಟುನೂರು ಒಂಬೈನೂರು'),
+        hundreds_joined=_split('ನೂರ ಇನ್ನೂರ ಮುನ್ನೂರ ನಾನ್ನೂರ ಐನೂರ ಆರುನೂರ ಏಳುನೂರ ಎಂಟುನೂರ ಒಂಬೈನೂರ'),
+        thousand=Scale('ಒಂದು ಸಾವಿರ', 'ಒಂದು ಸಾವಿರದ', 'ಸಾವಿರ', 'ಸಾವಿರದ'),
+        lakh=Scale('ಒಂದು ಲಕ್ಷ', 'ಒಂದು ಲಕ್ಷದ', 'ಲಕ್ಷ', 'ಲಕ್ಷದ'),
+        crore=Scale('ಒಂದು ಕೋಟಿ', 'ಒಂದು ಕೋಟಿ', 'ಕೋಟಿ', 'ಕೋಟಿ'),
+    ),
+}
+
+LANGUAGES = tuple(TABLES)
+
+_below_1000: Dict[str, Tuple[str, ...]] = {}
+_lock = threading.Lock()
+
+
+def _build_below_1000(table: LanguageTable) -> Tuple[str, ...]:
+    words = list(table.below_100)
+    for hundred in range(1, 10):
+        words.append(table.hundreds[hundred - 1])
+        words.extend(f'{table.hundreds_joined[hundred - 1]} {table.below_100[rest]}' for rest in range(1, 100))
+    return tuple(words)
+
+
+def _words_below_1000(language: str) -> Tuple[str, ...]:
+    words = _below_1000.get(language)
+    if words is None:
+        with _lock:
+            words = _below_1000.setdefault(language, _build_below_1000(TABLES[language]))
+    return words
+
+
+def _count_before_scale(words: str, table: LanguageTable) -> str:
+    head, _, last = words.rpartition(' ')
+    last = table.attributive.get(last, last)
+    return f'{head} {last}' if head else last
+
+
+def number_to_words(number: int, language: str = 'en') -> str:
+    """Spell a non-negative integer in ``language`` using crore, lakh and thousand groups."""
+    if number < 0:
+        raise ValueError('number must not be negative')
+    table = TABLES.get(language)
+    if table is None:
+        raise ValueError(f'Unsupported language: {language}')
+    below_1000 = _words_below_1000(language)
+    if number < 1000:
+        return below_1000[number]
+
+    crores, rest = divmod(number, 10 ** 7)
+    groups = ((crores, table.crore), (rest // 10 ** 5, table.lakh), (rest // 1000 % 100, table.thousand))
+    remainder = rest % 1000
+
+    parts = []
+    for index, (count, scale) in enumerate(groups):
+        if not count:
+            continue
+        joined = bool(remainder) or any(later for later, _ in groups[index + 1:])
+        if count == 1:
+            parts.append(scale.one_joined if joined else scale.one)
+        else:
+            # Crore counts can exceed 99 (e.g. "one hundred and fifty crore")
+            count_words = number_to_words(count, language)
+            parts.append(f'{_count_before_scale(count_words, table)} {scale.many_joined if joined else scale.many}')
+    if remainder:
+        parts.append(below_1000[remainder])
+    return ' '.join(parts)
+
+
+_AMOUNT = re.compile(r'^\s*(?:Rs\.?|INR|₹)?\s*(?P<rupees>\d[\d,]*)(?:\.(?P<paise>\d{1,2}))?\s*(?:/-)?\s*$', re.IGNORECASE)
+
+
+def amount_in_words(amount, language: str = 'en') -> Optional[str]:
+    """Spell a rupee amount such as ``"50,00,000"`` or ``"Rs. 15,000/-"``.
+
+    Returns ``None`` when the amount cannot be parsed or has non-zero paise,
+    so callers keep whatever words they already had rather than a rounded
+    figure.
+    """
+    if isinstance(amount, int):
+        return number_to_words(amount, language)
+    match = _AMOUNT.match(str(amount))
+    if not match or language not in TABLES or int(match.group('paise') or 0):
+        return None
+    return number_to_words(int(match.group('rupees').replace(',', '')), language)
+
+
+def fill_amount_words(data: Dict[str, str], language: str, keep_given: bool = False) -> Set[str]:
+    """Set every ``<amount>_words`` field in ``data`` from its ``<amount>`` field.
+
+    With ``keep_given`` a non-empty words field is left as entered. Returns
+    the names of the fields that were filled.
+    """
+    filled = set()
+    for key in list(data):
+        if not key.endswith('_words') or (keep_given and str(data[key]).strip()):
+            continue
+        amount = data.get(key[:-len('_words')])
+        if not amount:
+            continue
+        words = amount_in_words(amount, language)
+        if words is not None:
+            data[key] = words
+            filled.add(key)
+    return filled
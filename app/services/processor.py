@@ -1,162 +1,332 @@
 import os
 from datetime import datetime
+from functools import partial
 import re
-import spacy
-from jinja2 import Template
-from docx import Document
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.platypus import SimpleDocTemplate, Paragraph
-
-# Load spaCy model for NLP processing
-try:
-    nlp = spacy.load("en_core_web_sm")
-except OSError:
-    import subprocess
-    subprocess.run(["python", "-m", "spacy", "download", "en_core_web_sm"])
-    nlp = spacy.load("en_core_web_sm")
 
 from app.services.document_generator import DocumentGenerator
+from app.services.nlp_registry import get_pipeline, DEFAULT_PIPELINE, RULES_PIPELINE
+from app.services.entity_scanner import EntitySpan, scan
+from app.services.doc_classifier import DocumentClassifier
+from app.services.extraction_cache import ExtractionCache, prompt_key
+from app.services.transcript_sessions import scan_window
+from app.services.language_detect import detect_languages
+from app.services.native_extractors import NATIVE_EXTRACTORS
+
+# Pipeline and components run by each extraction mode. Only ``doc.ents`` is
+# read by the callers, so the tagger, parser and lemmatizer are skipped unless
+# the ``full`` mode is requested.
+EXTRACTION_MODES = {
+    'full': (DEFAULT_PIPELINE, None),
+    'ner': (DEFAULT_PIPELINE, ('ner',)),
+    'rules': (RULES_PIPELINE, None),
+}
+
+# Party and place fields, filled in the order people and places are mentioned
+PERSON_FIELDS = ('landlord', 'tenant', 'seller', 'buyer', 'principal', 'attorney', 'lessor', 'lessee')
+PLACE_FIELDS = ('landlord_address', 'tenant_address', 'seller_address', 'buyer_address', 'principal_address',
+                'attorney_address', 'lessor_address', 'lessee_address', 'property_address', 'address')
+
+# Cues that must end right before a span (searched in the ``CUE_WINDOW`` characters before it).
+# Languages that also put the cue after the number pass ``*_cue_after`` patterns, matched at the span's end.
+CUE_WINDOW = 40
+DEPOSIT_CUE = re.compile(r'(?:deposit|advance)[^\d]{0,20}$', re.IGNORECASE)
+NOTICE_CUE = re.compile(r'notice[^\d]{0,25}$', re.IGNORECASE)
+# Unmarked numbers (``number`` spans) are amounts only after one of these
+AMOUNT_CUE = re.compile(r'\b(?:rent(?:al)?|price|amount|consideration|sum|deposit|advance|payment|pay(?:able)?|paid'
+                        r'|fees?|cost|value|worth|for)\b[^\d]{0,20}$', re.IGNORECASE)
+
+# Unit the templates print after each duration field ("{{ duration }} months")
+DURATION_FIELD_UNITS = {'duration': 'month', 'renewal_period': 'month', 'lease_period': 'year', 'notice_period': 'month'}
+MONTHS_PER_UNIT = {'month': 1, 'year': 12}
+
+PROPERTY_DESCRIPTION = re.compile(r'a property located at (.+?)(?:\.|,|$)', re.IGNORECASE)
+MATTER_DESCRIPTION = re.compile(r'for (.+?) purposes', re.IGNORECASE)
+
 
 class LegalDocumentProcessor:
-    def __init__(self):
+    def __init__(self, extraction_mode=None, display_mode=None):
+        self.extraction_mode = extraction_mode or os.getenv('NLP_EXTRACTION_MODE', 'ner')
+        self.display_mode = display_mode or os.getenv('NLP_DISPLAY_MODE', 'ner')
+        for mode in (self.extraction_mode, self.display_mode):
+            if mode not in EXTRACTION_MODES:
+                raise ValueError(f"Unsupported extraction mode: {mode}")
+
         self.document_types = {
             'rental_agreement': {
-                'keywords': ['rental', 'rent', 'lease', 'tenant', 'landlord', 'monthly'],
+                'keywords': ['rental', 'rent', 'lease', 'tenant', 'landlord', 'monthly',
+                             'வாடகை', 'வாடகைதாரர்', 'किराया', 'किरायेदार', 'किराएदार', 'मकान मालिक'],
+                'phrases': {'rental agreement': 3, 'rent agreement': 3, 'tenancy agreement': 3,
+                            'வாடகை ஒப்பந்த': 3, 'किराया समझौता': 3, 'किराया अनुबंध': 3, 'किरायानामा': 3},
                 'required_fields': ['landlord', 'landlord_address', 'tenant', 'tenant_address', 'property_address', 'rent_amount', 'start_date', 'duration'],
                 'template': 'rental_agreement_template.txt'
             },
             'land_sale_deed': {
-                'keywords': ['sale', 'deed', 'property', 'buyer', 'seller', 'purchase'],
+                'keywords': ['sale', 'deed', 'property', 'buyer', 'seller', 'purchase',
+                             'விற்பனை', 'கிரையம்', 'வாங்குபவர்', 'बिक्री', 'विक्रय', 'विक्रेता', 'खरीदार'],
+                'phrases': {'sale deed': 3, 'land sale': 2, 'deed of sale': 3,
+                            'கிரைய பத்திர': 3, 'விற்பனை பத்திர': 3, 'बिक्री विलेख': 3, 'विक्रय पत्र': 3, 'बैनामा': 3},
                 'required_fields': ['seller', 'seller_address', 'buyer', 'buyer_address', 'property_address', 'sale_amount'],
                 'template': 'land_sale_deed_template.txt'
             },
             'power_of_attorney': {
-                'keywords': ['power', 'attorney', 'delegate', 'authority', 'behalf'],
+                'keywords': ['power', 'attorney', 'delegate', 'authority', 'behalf',
+                             'அதிகாரம்', 'முகவர்', 'अधिकार', 'मुख्तार'],
+                'phrases': {'power of attorney': 4, 'அதிகார பத்திர': 4, 'அதிகாரப் பத்திர': 4,
+                            'मुख्तारनाम': 4, 'पावर ऑफ अटॉर्नी': 4},
                 'required_fields': ['principal', 'principal_address', 'attorney', 'attorney_address', 'matter_description', 'effective_date', 'expiry_date'],
                 'template': 'power_of_attorney_template.txt'
             },
             'house_lease': {
-                'keywords': ['house', 'lease', 'lessor', 'lessee', 'property'],
+                'keywords': ['house', 'lease', 'lessor', 'lessee', 'property',
+                             'குத்தகை', 'குத்தகைதாரர்', 'पट्टा', 'पट्टेदार', 'पट्टादाता'],
+                'phrases': {'house lease': 3, 'lease deed': 2, 'lease agreement': 2,
+                            'குத்தகை ஒப்பந்த': 3, 'पट्टा विलेख': 3, 'पट्टा समझौता': 3},
                 'required_fields': ['lessor', 'lessor_address', 'lessee', 'lessee_address', 'property_address', 'lease_amount', 'start_date', 'duration'],
                 'template': 'house_lease_template.txt'
             }
         }
+        # Prompt language -> callable(prompt) returning extracted entities; prompts in
+        # other languages go through the English spaCy pipeline
+        self.language_extractors = {}
         self.document_generator = DocumentGenerator()
+        self.extraction_cache = ExtractionCache()
+        self._build_classifier()
+        for language, extractor in NATIVE_EXTRACTORS.items():
+            self.register_language_extractor(language, partial(self._extract_native, extractor))
+
+    def get_nlp(self, mode=None):
+        """Return the pipeline view for an extraction mode (defaults to ``extraction_mode``)."""
+        name, enable = EXTRACTION_MODES[mode or self.extraction_mode]
+        return get_pipeline(name, enable=enable)
+
+    def document_entities(self, text):
+        """Return ``(text, label)`` pairs for display, using ``display_mode``."""
+        doc = self.get_nlp(self.display_mode)(text)
+        return [(ent.text, ent.label_) for ent in doc.ents]
 
-        self.entity_patterns = {
-            'amounts': r'(?:Rs\.?|INR)?\s*(\d+(?:,\d+)*(?:\.\d{2})?)\s*(?:rupees?|Rs\.?|INR)?',
-            'dates': r'\d{1,2}[-/]\d{1,2}[-/]\d{4}|\d{1,2}(?:st|nd|rd|th)?\s+(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+\d{4}',
-            'locations': r'\b(?:at|in)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)',
-            'durations': r'(\d+)\s*(?:year|month|week|day)s?'
+    def _build_classifier(self):
+        self.classifier = DocumentClassifier()
+        for doc_type, info in self.document_types.items():
+            self.classifier.register(doc_type, info['keywords'])
+            self.classifier.register(doc_type, info.get('phrases', {}))
+
+    def register_document_type(self, doc_type, keywords, required_fields, template, phrases=None):
+        """Register an additional document type and rebuild the classifier"""
+        self.document_types[doc_type] = {
+            'keywords': list(keywords),
+            'phrases': dict(phrases or {}),
+            'required_fields': list(required_fields),
+            'template': template
         }
+        self._build_classifier()
+        self.extraction_cache.clear()
+
+    def register_language_extractor(self, language, extractor):
+        """Extract prompts written in ``language`` with ``extractor(prompt)`` instead of the English pipeline"""
+        self.language_extractors[language] = extractor
+        self.extraction_cache.clear()
+
+    def classify(self, prompt):
+        """Classify the prompt; returns ``(doc_type, confidence)`` with ``'unknown'`` when nothing matches"""
+        result = self.classifier.classify(prompt)
+        return result.doc_type, result.confidence
 
     def classify_document_type(self, prompt):
-        """Classify the document type based on the user's prompt"""
-        prompt_lower = prompt.lower()
+        """Classify the document type based on the user's prompt, or ``None`` if unknown"""
+        return self.classifier.best_type(prompt)
 
-        # Count keyword matches for each document type
-        scores = {}
-        for doc_type, info in self.document_types.items():
-            score = sum(1 for keyword in info['keywords'] if keyword in prompt_lower)
-            scores[doc_type] = score
+    def analyze_prompt(self, prompt):
+        """Classify and extract a prompt, reusing a cached result for the same normalized text"""
+        result = self.extraction_cache.get_or_compute(prompt, self._analyze)
+        return self._copy_result(result)
+
+    def analyze_prompts(self, prompts, batch_size=None, n_process=None):
+        """``analyze_prompt`` for many prompts; only cache misses go through ``nlp.pipe``"""
+        keys = [prompt_key(prompt) for prompt in prompts]
+        results = [self.extraction_cache.get(key) for key in keys]
+        misses = [i for i, result in enumerate(results) if result is None]
+        languages = {i: detect_languages(prompts[i]) for i in misses}
+        # Prompts with a native-language extractor skip the English pipeline
+        native = [i for i in misses if languages[i].prompt_language in self.language_extractors]
+        piped = [i for i in misses if languages[i].prompt_language not in self.language_extractors]
+        extracted = dict(zip(piped, self.extract_entities_batch([prompts[i] for i in piped],
+                                                                batch_size=batch_size, n_process=n_process)))
+        for i in native:
+            extracted[i] = self.language_extractors[languages[i].prompt_language](prompts[i])
+        for i in misses:
+            results[i] = self._result(prompts[i], languages[i], extracted[i])
+            self.extraction_cache.set(keys[i], results[i])
+        return [self._copy_result(result) for result in results]
+
+    def _analyze(self, prompt):
+        languages = detect_languages(prompt)
+        extractor = self.language_extractors.get(languages.prompt_language)
+        entities = extractor(prompt) if extractor else self.extract_entities(prompt)
+        return self._result(prompt, languages, entities)
+
+    def _result(self, prompt, languages, entities):
+        doc_type, confidence = self.classify(prompt)
+        return {
+            'document_type': doc_type,
+            'confidence': confidence,
+            'language': languages.prompt_language,
+            'output_language': languages.output_language,
+            'entities': entities
+        }
 
-        # Return the document type with the highest score
-        if scores:
-            return max(scores, key=scores.get)
-        return None
+    @staticmethod
+    def _copy_result(result):
+        return dict(result, entities=dict(result['entities']))
+
+    def extract_transcript_chunk(self, session, chunk):
+        """Merge a new transcript chunk into ``session`` and return the running extraction.
+
+        Only the new tail of the transcript (plus a small overlap) goes through NER,
+        the scanner and the classifier; roles are then reassigned over all spans.
+        """
+        with session.lock:
+            start = session.append(chunk)
+            session.merge(start, scan_window(self, session.text, start))
+            session.keywords |= self.classifier.matched_keywords(session.text[start:])
+
+            classification = self.classifier.score(session.keywords)
+            entities = self.assign_roles(session.spans, session.text)
+            changed = {field: value for field, value in entities.items() if session.entities.get(field) != value}
+            session.entities = entities
+
+            return {
+                'document_type': classification.doc_type,
+                'confidence': classification.confidence,
+                'extracted_entities': dict(entities),
+                'new_entities': changed,
+                'missing_fields': self.identify_missing_fields(classification.doc_type, entities),
+                'transcript_length': len(session.text),
+                'rescanned_chars': len(session.text) - start
+            }
 
     def extract_entities(self, prompt):
         """Extract entities from the user's prompt using spaCy and regex patterns"""
-        doc = nlp(prompt)
-        entities = {}
-
-        # Extract named entities using spaCy
-        for ent in doc.ents:
-            if ent.label_ == 'PERSON':
-                if 'landlord' not in entities:
-                    entities['landlord'] = ent.text
-                elif 'tenant' not in entities:
-                    entities['tenant'] = ent.text
-                elif 'seller' not in entities:
-                    entities['seller'] = ent.text
-                elif 'buyer' not in entities:
-                    entities['buyer'] = ent.text
-                elif 'principal' not in entities:
-                    entities['principal'] = ent.text
-                elif 'attorney' not in entities:
-                    entities['attorney'] = ent.text
-                elif 'lessor' not in entities:
-                    entities['lessor'] = ent.text
-                elif 'lessee' not in entities:
-                    entities['lessee'] = ent.text
-            elif ent.label_ == 'GPE' or ent.label_ == 'LOC':
-                # Try to assign to specific address fields first
-                if 'landlord_address' not in entities: # Added specific address field
-                    entities['landlord_address'] = ent.text
-                elif 'tenant_address' not in entities: # Added specific address field
-                    entities['tenant_address'] = ent.text
-                elif 'seller_address' not in entities: # Added specific address field
-                    entities['seller_address'] = ent.text
-                elif 'buyer_address' not in entities: # Added specific address field
-                    entities['buyer_address'] = ent.text
-                elif 'principal_address' not in entities: # Added specific address field
-                    entities['principal_address'] = ent.text
-                elif 'attorney_address' not in entities: # Added specific address field
-                    entities['attorney_address'] = ent.text
-                elif 'lessor_address' not in entities: # Added specific address field
-                    entities['lessor_address'] = ent.text
-                elif 'lessee_address' not in entities: # Added specific address field
-                    entities['lessee_address'] = ent.text
-                elif 'property_address' not in entities:
-                    entities['property_address'] = ent.text
-                elif 'address' not in entities:
-                    entities['address'] = ent.text
-
-        # Extract amounts using regex
-        amount_match = re.search(self.entity_patterns['amounts'], prompt, re.IGNORECASE)
-        if amount_match:
-            entities['rent_amount'] = amount_match.group(1)
-            entities['sale_amount'] = amount_match.group(1)
-            entities['lease_amount'] = amount_match.group(1)
-
-        # Extract dates
-        date_match = re.search(self.entity_patterns['dates'], prompt, re.IGNORECASE)
-        if date_match:
-            entities['start_date'] = date_match.group(0)
-            entities['effective_date'] = date_match.group(0)
-            entities['expiry_date'] = date_match.group(0)
-            entities['sale_date'] = date_match.group(0)
-
-        # Extract durations
-        duration_match = re.search(self.entity_patterns['durations'], prompt, re.IGNORECASE)
-        if duration_match:
-            entities['duration'] = duration_match.group(0)
-            entities['renewal_period'] = duration_match.group(0)
-            entities['lease_period'] = duration_match.group(0)
-            entities['notice_period'] = duration_match.group(0)
+        return self._entities_from_doc(self.get_nlp()(prompt), prompt)
+
+    def extract_entities_batch(self, prompts, batch_size=None, n_process=None):
+        """Extract entities for many prompts with ``nlp.pipe``, preserving input order"""
+        batch_size = batch_size or int(os.getenv('NLP_BATCH_SIZE', '64'))
+        n_process = n_process or int(os.getenv('NLP_N_PROCESS', '1'))
+        docs = self.get_nlp().pipe(prompts, batch_size=batch_size, n_process=n_process)
+        return [self._entities_from_doc(doc, prompt) for doc, prompt in zip(docs, prompts)]
+
+    def _extract_native(self, extractor, prompt):
+        """Extract a Tamil or Hindi prompt with its rule-based extractor (no spaCy, no network)"""
+        return self.assign_roles(extractor.spans(prompt), prompt,
+                                 deposit_cue=extractor.deposit_cue, notice_cue=extractor.notice_cue,
+                                 amount_cue=extractor.amount_cue, deposit_cue_after=extractor.deposit_cue_after,
+                                 notice_cue_after=extractor.notice_cue_after, amount_cue_after=extractor.amount_cue_after)
+
+    def _entities_from_doc(self, doc, prompt):
+        """Assign spaCy entities and scanned spans in ``prompt`` to document fields"""
+        spans = [EntitySpan('person' if ent.label_ == 'PERSON' else 'place', ent.text, ent.text, ent.start_char, ent.end_char)
+                 for ent in doc.ents if ent.label_ in ('PERSON', 'GPE', 'LOC')]
+        spans.extend(scan(prompt))
+        return self.assign_roles(spans, prompt)
+
+    def assign_roles(self, spans, prompt, deposit_cue=DEPOSIT_CUE, notice_cue=NOTICE_CUE, amount_cue=AMOUNT_CUE,
+                     deposit_cue_after=None, notice_cue_after=None, amount_cue_after=None):
+        """Map typed, position-tagged spans found in ``prompt`` onto document fields
+
+        ``party`` spans name their field in ``value`` and take it first; the other
+        people and places fill the remaining party fields in the order they are mentioned.
+        """
+        ordered = sorted(spans, key=lambda span: span.start)
+        entities = {span.value: span.text for span in reversed(ordered) if span.kind == 'party'}
+
+        # Ages and pincodes belong to the party or place mentioned just before them
+        party = place = None
+        for span in ordered:
+            if span.kind == 'party':
+                party = span.value
+            elif span.kind == 'person':
+                field = next((f for f in PERSON_FIELDS if f not in entities), None)
+                if field:
+                    entities[field] = span.text
+                    party = field
+            elif span.kind == 'place':
+                field = next((f for f in PLACE_FIELDS if f not in entities), None)
+                if field:
+                    entities[field] = span.text
+                    place = field
+            elif span.kind == 'age' and party:
+                entities.setdefault(f'{party}_age', span.value)
+            elif span.kind == 'pincode':
+                owner = place[:-len('_address')] if place and place.endswith('_address') else 'property'
+                entities.setdefault(f'{owner}_pincode', span.value)
+
+        amounts = [span for span in ordered if span.kind == 'amount' or span.kind == 'number'
+                   and self._cued(prompt, span, amount_cue, amount_cue_after)]
+        deposits = [span for span in amounts if self._cued(prompt, span, deposit_cue, deposit_cue_after)]
+        payments = [span for span in amounts if span not in deposits]
+        if payments:
+            entities['rent_amount'] = payments[0].value
+            entities['sale_amount'] = payments[0].value
+            entities['lease_amount'] = payments[0].value
+        if deposits:
+            entities['security_deposit'] = deposits[0].value
+
+        dates = [span for span in ordered if span.kind == 'date']
+        if dates:
+            entities['start_date'] = dates[0].text
+            entities['effective_date'] = dates[0].text
+            entities['expiry_date'] = dates[-1].text
+            entities['sale_date'] = dates[0].text
+            if len(dates) > 1:
+                entities['end_date'] = dates[-1].text
+
+        durations = [span for span in ordered if span.kind == 'duration']
+        notices = [span for span in durations if self._cued(prompt, span, notice_cue, notice_cue_after)]
+        terms = [span for span in durations if span not in notices]
+        if terms:
+            for field in ('duration', 'renewal_period', 'lease_period'):
+                entities[field] = self._duration_in(terms[0], DURATION_FIELD_UNITS[field])
+        if notices or terms:
+            entities['notice_period'] = self._duration_in((notices or terms)[0], DURATION_FIELD_UNITS['notice_period'])
 
         # Extract other specific fields if they are present in the prompt
         # For example, extracting property description for land_sale_deed
-        if 'property_description' not in entities:
-            # This is a simple placeholder. More sophisticated NLP might be needed for actual extraction.
-            # For now, if the prompt contains a phrase like "a property located at X", we can try to extract X
-            match = re.search(r'a property located at (.+?)(?:\.|,|$)', prompt, re.IGNORECASE)
-            if match:
-                entities['property_description'] = match.group(1).strip()
-        
-        if 'matter_description' not in entities:
-            match = re.search(r'for (.+?) purposes', prompt, re.IGNORECASE)
-            if match:
-                entities['matter_description'] = match.group(1).strip() + ' purposes'
-        
+        match = PROPERTY_DESCRIPTION.search(prompt)
+        if match:
+            entities['property_description'] = match.group(1).strip()
+
+        match = MATTER_DESCRIPTION.search(prompt)
+        if match:
+            entities['matter_description'] = match.group(1).strip() + ' purposes'
+
         # You might need more specific regex or NLP rules for other fields like father's name, city, pincode, etc.
         # For now, let's assume these would be provided through the form or default values.
 
         return entities
 
+    @staticmethod
+    def _cued(prompt, span, before, after):
+        """Whether a cue ends just before ``span`` or, with an ``after`` pattern, starts right after it"""
+        if before.search(prompt, max(span.start - CUE_WINDOW, 0), span.start):
+            return True
+        return after is not None and after.match(prompt, span.end, span.end + CUE_WINDOW) is not None
+
+    @staticmethod
+    def _duration_in(span, unit):
+        """Return a duration span's number converted to ``unit``, or its own text when it does not convert exactly"""
+        number, _, own_unit = span.value.partition(' ')
+        if own_unit == unit:
+            return number
+        if own_unit in MONTHS_PER_UNIT:
+            months = int(number) * MONTHS_PER_UNIT[own_unit]
+            if months % MONTHS_PER_UNIT[unit] == 0:
+                return str(months // MONTHS_PER_UNIT[unit])
+        return span.text
+
     def identify_missing_fields(self, doc_type, entities):
         """Identify missing required fields for the document type"""
+        if doc_type not in self.document_types:
+            return []
         required_fields = self.document_types[doc_type]['required_fields']
         missing_fields = []
         
@@ -174,8 +344,17 @@ class LegalDocumentProcessor:
         # Delegate to DocumentGenerator for multi-language support
         return self.document_generator.generate_document(doc_type, entities, language)
 
+    def stream_document(self, doc_type, entities, language='en'):
+        """Like ``generate_document``, but yields the document in text chunks as it renders"""
+        if doc_type not in self.document_types:
+            raise ValueError(f"Unsupported document type: {doc_type}")
+
+        return self.document_generator.stream_document(doc_type, entities, language)
+
     def generate_docx(self, content, filename):
         """Generate a .docx file from the document content"""
+        from docx import Document
+
         doc = Document()
         doc.add_heading('Legal Document', 0)
 
@@ -189,6 +368,10 @@ class LegalDocumentProcessor:
 
     def generate_pdf(self, content, filename):
         """Generate a .pdf file from the document content"""
+        from reportlab.lib.pagesizes import letter
+        from reportlab.lib.styles import getSampleStyleSheet
+        from reportlab.platypus import SimpleDocTemplate, Paragraph
+
         doc = SimpleDocTemplate(filename, pagesize=letter)
         styles = getSampleStyleSheet()
 
@@ -0,0 +1,83 @@
+"""Incremental extraction state for streaming voice transcripts.
+
+Each session keeps the transcript received so far, the entity spans found in
+it and the matched classifier keywords. A new chunk only re-scans the tail of
+the transcript (the new text plus a small overlap, so entities split across
+chunk boundaries are still found) and merges the result into that state.
+"""
+import os
+import threading
+from typing import Dict, List
+
+from app.services.entity_scanner import EntitySpan, scan
+from app.services.extraction_cache import LRUCache
+
+# Characters of already-scanned text re-read with every chunk; must be longer
+# than the longest keyword and the longest single entity we expect to straddle chunks
+OVERLAP_CHARS = 48
+
+
+class TranscriptSession:
+    def __init__(self, session_id: str):
+        self.session_id = session_id
+        self.text = ''
+        self.scanned_upto = 0
+        self.spans: List[EntitySpan] = []
+        self.keywords = set()
+        self.entities: Dict[str, str] = {}
+        self.lock = threading.Lock()
+
+    def append(self, chunk: str) -> int:
+        """Append ``chunk`` and return where the re-scan window starts."""
+        chunk = chunk.strip()
+        if chunk:
+            self.text = f'{self.text} {chunk}' if self.text else chunk
+        start = max(self.scanned_upto - OVERLAP_CHARS, 0)
+        # Start the window on a word boundary
+        while start > 0 and not self.text[start - 1].isspace():
+            start -= 1
+        return start
+
+    def merge(self, start: int, spans: List[EntitySpan]) -> None:
+        """Replace the spans found at or after ``start`` with a re-scan of the window."""
+        kept = [span for span in self.spans if span.start < start]
+        boundary = max((span.end for span in kept), default=0)
+        self.spans = kept + [span for span in spans if span.start >= boundary]
+        self.scanned_upto = len(self.text)
+
+
+def scan_window(processor, text: str, start: int) -> List[EntitySpan]:
+    """Run NER and the entity scanner over ``text[start:]`` with absolute positions."""
+    window = text[start:]
+    doc = processor.get_nlp()(window)
+    spans = [EntitySpan('person' if ent.label_ == 'PERSON' else 'place', ent.text, ent.text,
+                        ent.start_char + start, ent.end_char + start)
+             for ent in doc.ents if ent.label_ in ('PERSON', 'GPE', 'LOC')]
+    spans.extend(scan(window, offset=start))
+    return spans
+
+
+class TranscriptSessionStore:
+    """Bounded, expiring store of transcript sessions for this worker."""
+
+    def __init__(self, maxsize=None, ttl=None):
+        self._sessions = LRUCache(
+            maxsize=maxsize or int(os.getenv('TRANSCRIPT_SESSIONS', '1000')),
+            ttl=ttl if ttl is not None else float(os.getenv('TRANSCRIPT_SESSION_TTL', '900')),
+        )
+        self._lock = threading.Lock()
+
+    def get(self, session_id: str) -> TranscriptSession:
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is None:
+                session = TranscriptSession(session_id)
+            # Re-inserting refreshes the session's position and expiry
+            self._sessions.set(session_id, session)
+            return session
+
+    def discard(self, session_id: str) -> None:
+        self._sessions.pop(session_id)
+
+    def stats(self):
+        return self._sessions.stats()
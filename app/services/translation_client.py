@@ -0,0 +1,186 @@
+"""HTTP client for the translation provider (MyMemory's ``/get`` API).
+
+One keep-alive ``requests.Session`` with a pooled adapter is kept per worker
+process, so repeated calls reuse TLS connections. Transient failures are
+retried a bounded number of times with jittered exponential backoff, and a
+circuit breaker skips the provider entirely for a cool-down period after a
+run of failures, so a provider outage costs nothing but the original text.
+"""
+import os
+import random
+import threading
+import time
+from typing import Optional, Tuple
+
+DEFAULT_API_URL = 'https://api.mymemory.translated.net/get'
+SOURCE_LANG = 'en'
+
+# Statuses worth retrying; anything else is returned to the caller as a failure
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class CircuitBreaker:
+    """Opens after ``threshold`` consecutive failures and stays open for ``reset_after`` seconds.
+
+    Once the cool-down has passed a single trial call is let through
+    (half-open); its outcome closes or re-opens the circuit.
+    """
+
+    def __init__(self, threshold: int = 5, reset_after: float = 30.0):
+        self.threshold = threshold
+        self.reset_after = reset_after
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial = False
+        self.short_circuited = 0
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return 'closed'
+        return 'half-open' if time.monotonic() - self._opened_at >= self.reset_after else 'open'
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if not self._trial and time.monotonic() - self._opened_at >= self.reset_after:
+                self._trial = True
+                return True
+            self.short_circuited += 1
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._trial or self._failures >= self.threshold:
+                self._opened_at = time.monotonic()
+                self._trial = False
+
+
+class TranslationClient:
+    def __init__(self, base_url: Optional[str] = None, timeout: Optional[float] = None,
+                 retries: Optional[int] = None, pool_size: Optional[int] = None,
+                 breaker: Optional[CircuitBreaker] = None):
+        self.base_url = base_url or os.getenv('TRANSLATION_API_URL', DEFAULT_API_URL)
+        self.timeout = timeout or float(os.getenv('TRANSLATION_TIMEOUT', '5'))
+        self.retries = retries if retries is not None else int(os.getenv('TRANSLATION_RETRIES', '2'))
+        self.pool_size = pool_size or int(os.getenv('TRANSLATION_POOL_SIZE', '16'))
+        self.breaker = breaker or CircuitBreaker(
+            threshold=int(os.getenv('TRANSLATION_BREAKER_THRESHOLD', '5')),
+            reset_after=float(os.getenv('TRANSLATION_BREAKER_RESET', '30')),
+        )
+        self.backoff = 0.2
+        self._lock = threading.Lock()
+        self._session = None
+        self._session_pid = None
+        self.calls = 0
+        self.failures = 0
+        self.retried = 0
+
+    def _get_session(self):
+        # Sockets must not be shared across fork(), so each worker opens its own pool
+        with self._lock:
+            if self._session is None or self._session_pid != os.getpid():
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                self._session, self._session_pid = session, os.getpid()
+            return self._session
+
+    def _sleep_before_retry(self, attempt: int) -> None:
+        # Full jitter keeps concurrent workers from retrying in lockstep
+        time.sleep(random.uniform(0, self.backoff * (2 ** attempt)))
+
+    def _count(self, counter: str) -> None:
+        # Calls run on the translation pool's threads
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def translate(self, text: str, target_lang: str) -> Optional[str]:
+        """Translate ``text`` from English; returns ``None`` when the provider fails or the circuit is open."""
+        if not self.breaker.allow():
+            return None
+        healthy = False
+        try:
+            translated, healthy = self._request(text, target_lang)
+            return translated
+        finally:
+            # Every allowed call, the half-open trial included, ends in exactly one
+            # outcome; an unexpected exception counts as a failure
+            if healthy:
+                self.breaker.record_success()
+            else:
+                self._count('failures')
+                self.breaker.record_failure()
+
+    def _request(self, text: str, target_lang: str) -> Tuple[Optional[str], bool]:
+        """Return ``(translation, provider healthy)``."""
+        import requests
+
+        session = self._get_session()
+        params = {'q': text, 'langpair': f'{SOURCE_LANG}|{target_lang}'}
+        for attempt in range(self.retries + 1):
+            self._count('calls')
+            try:
+                response = session.get(self.base_url, params=params, timeout=self.timeout)
+                if response.status_code in RETRY_STATUSES:
+                    raise requests.HTTPError(f'HTTP {response.status_code}', response=response)
+            except requests.RequestException as e:
+                if attempt < self.retries:
+                    self._count('retried')
+                    self._sleep_before_retry(attempt)
+                    continue
+                print(f"Translation request failed for '{text[:40]}': {e}")
+                return None, False
+            try:
+                data = response.json()
+            except ValueError as e:
+                print(f"Translation provider returned invalid JSON: {e}")
+                return None, False
+            if not isinstance(data, dict):
+                print(f"Translation provider returned {type(data).__name__} instead of an object")
+                return None, False
+            # The provider is healthy even when it refuses a query, e.g. one that is too long
+            response_data = data.get('responseData')
+            translated = response_data.get('translatedText') if isinstance(response_data, dict) else None
+            if str(data.get('responseStatus')) == '200' and isinstance(translated, str):
+                return translated, True
+            print(f"Translation refused for '{text[:40]}': {data.get('responseDetails')}")
+            self._count('failures')
+            return None, True
+        return None, False
+
+    def stats(self):
+        return {
+            'base_url': self.base_url,
+            'calls': self.calls,
+            'retried': self.retried,
+            'failures': self.failures,
+            'circuit': self.breaker.state,
+            'short_circuited': self.breaker.short_circuited,
+        }
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_translation_client() -> TranslationClient:
+    """Return the process-wide translation client."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = TranslationClient()
+        return _client
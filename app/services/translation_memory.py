@@ -0,0 +1,146 @@
+"""Persistent translation memory: SQLite store with an in-memory LRU in front.
+
+Entries are keyed on (source text, target language, provider). Curated
+phrases loaded from the seed file are stored under the ``seed`` provider and
+take precedence over machine translations. Each worker keeps the whole seed
+table in a dict, so a lookup checks it without touching SQLite and only an LRU
+miss reaches the store.
+"""
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from app.services.extraction_cache import LRUCache
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_PATH = os.path.join(PROJECT_ROOT, 'instance', 'translation_memory.sqlite3')
+DEFAULT_SEED_FILE = os.path.join(PROJECT_ROOT, 'data', 'translation_seed.tsv')
+SEED_PROVIDER = 'seed'
+
+
+class TranslationMemory:
+    def __init__(self, path: Optional[str] = None, lru_size: Optional[int] = None, seed_file: Optional[str] = None):
+        self.path = path or os.getenv('TRANSLATION_MEMORY_PATH', DEFAULT_PATH)
+        self.seed_file = seed_file if seed_file is not None else os.getenv('TRANSLATION_SEED_FILE', DEFAULT_SEED_FILE)
+        self._lru = LRUCache(maxsize=lru_size or int(os.getenv('TRANSLATION_MEMORY_LRU', '4096')), ttl=None)
+        self._lock = threading.Lock()
+        self._conn = None
+        self._conn_pid = None
+        self._seeds = {}
+        self.memory_hits = 0
+        self.store_hits = 0
+        self.misses = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        # Connections must not be shared across fork(), so reopen in each worker
+        if self._conn is None or self._conn_pid != os.getpid():
+            if self.path != ':memory:':
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False, timeout=5)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS translations ('
+                'source TEXT NOT NULL, target_lang TEXT NOT NULL, provider TEXT NOT NULL, '
+                'translated TEXT NOT NULL, created REAL NOT NULL, '
+                'PRIMARY KEY (source, target_lang, provider))'
+            )
+            conn.commit()
+            self._conn, self._conn_pid = conn, os.getpid()
+            if self.seed_file and os.path.exists(self.seed_file):
+                self._seed(conn, self.seed_file)
+            self._load_seeds(conn)
+        return self._conn
+
+    def _load_seeds(self, conn: sqlite3.Connection) -> None:
+        self._seeds = {(source, target_lang): translated for source, target_lang, translated in conn.execute(
+            'SELECT source, target_lang, translated FROM translations WHERE provider = ?', (SEED_PROVIDER,))}
+
+    def _lookup(self, source: str, target_lang: str, provider: str):
+        key = (source, target_lang, provider)
+        translated = self._lru.get(key)
+        if translated is not None:
+            self.memory_hits += 1
+            return translated
+        # Misses are not cached, so translations stored by other workers are picked up
+        row = self._connection().execute(
+            'SELECT translated FROM translations WHERE source = ? AND target_lang = ? AND provider = ?', key
+        ).fetchone()
+        if row is None:
+            return None
+        self._lru.set(key, row[0])
+        self.store_hits += 1
+        return row[0]
+
+    def get(self, source: str, target_lang: str, provider: str) -> Optional[str]:
+        """Return a remembered translation, preferring curated seed phrases."""
+        with self._lock:
+            self._connection()  # loads the seed table on first use in this worker
+            translated = self._seeds.get((source, target_lang))
+            if translated is not None:
+                self.memory_hits += 1
+                return translated
+            translated = self._lookup(source, target_lang, provider)
+            if translated is None:
+                self.misses += 1
+            return translated
+
+    def put(self, source: str, target_lang: str, provider: str, translated: str) -> None:
+        with self._lock:
+            conn = self._connection()
+            conn.execute('INSERT OR REPLACE INTO translations VALUES (?, ?, ?, ?, ?)',
+                         (source, target_lang, provider, translated, time.time()))
+            conn.commit()
+            self._lru.set((source, target_lang, provider), translated)
+
+    def _seed(self, conn: sqlite3.Connection, path: str) -> int:
+        rows = []
+        with open(path, encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip() or line.startswith('#'):
+                    continue
+                fields = line.rstrip('\n').split('\t')
+                if len(fields) < 3 or not all(fields[:3]):
+                    print(f"Skipping malformed seed line {line_number} in {path}: {line.strip()[:60]!r}")
+                    continue
+                source, target_lang, translated = fields[:3]
+                rows.append((source, target_lang, SEED_PROVIDER, translated, time.time()))
+        conn.executemany('INSERT OR REPLACE INTO translations VALUES (?, ?, ?, ?, ?)', rows)
+        conn.commit()
+        return len(rows)
+
+    def seed(self, path: str) -> int:
+        """Load ``source<TAB>target_lang<TAB>translation`` lines as curated phrases.
+
+        Other running workers see the new phrases after they restart.
+        """
+        with self._lock:
+            conn = self._connection()
+            count = self._seed(conn, path)
+            self._load_seeds(conn)
+            self._lru.clear()
+            return count
+
+    def stats(self):
+        lookups = self.memory_hits + self.store_hits + self.misses
+        return {
+            'path': self.path,
+            'lru_size': len(self._lru),
+            'seed_phrases': len(self._seeds),
+            'memory_hits': self.memory_hits,
+            'store_hits': self.store_hits,
+            'misses': self.misses,
+            'hit_rate': round((self.memory_hits + self.store_hits) / lookups, 3) if lookups else None,
+        }
+
+
+_memory = None
+
+
+def get_translation_memory() -> TranslationMemory:
+    """Return the process-wide translation memory."""
+    global _memory
+    if _memory is None:
+        _memory = TranslationMemory()
+    return _memory
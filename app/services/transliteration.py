@@ -0,0 +1,235 @@
+"""Offline Latin-to-Indic transliteration for personal names and addresses.
+
+Romanised Indian names ("Ramesh Kumar", "Anna Salai") are parsed into
+consonant and vowel units with a longest-match phonetic scheme and written
+out in Devanagari. The other Brahmic scripts share Devanagari's layout, so
+they are produced by shifting each character into the target Unicode block,
+with a small substitution table for letters a script lacks (Tamil has no
+separate voiced or aspirated stops, Bengali writes "v" as "b" and "y" as
+"য়"). Tamil, Telugu and Kannada distinguish short and long e/o; an e or o
+before a consonant cluster is written short ("Chennai" becomes "சென்னை"),
+any other one long ("Ramesh" becomes "ரமேஷ்"). Urdu is
+rendered from the same units through its own letter table. Common name and
+place words whose vowel lengths the romanisation hides ("Kumar",
+"Narayanan") are looked up in a small lexicon before the rules. Honorifics and
+the "No." of a door number are not spelled out but replaced with the target
+language's own abbreviation ("Mr." becomes "श्री", "Dr." becomes "डॉ."). Tokens
+with digits ("2nd", "3B") are kept as they are.
+
+Everything is table driven and deterministic; results are cached per word.
+"""
+import re
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+# Unicode block of each Brahmic script; Devanagari is the reference layout
+SCRIPT_BLOCKS = {
+    'hi': 0x0900,
+    'mr': 0x0900,
+    'bn': 0x0980,
+    'gu': 0x0A80,
+    'or': 0x0B00,
+    'ta': 0x0B80,
+    'te': 0x0C00,
+    'kn': 0x0C80,
+}
+LANGUAGES = tuple(SCRIPT_BLOCKS) + ('ur',)
+
+# Scripts that mark a word-final consonant with a virama instead of leaving it bare
+_FINAL_VIRAMA = frozenset(('ta', 'te', 'kn'))
+# Scripts with separate short e and o
+_SHORT_E_O = frozenset(('ta', 'te', 'kn'))
+
+# Devanagari letters missing from a target script, mapped to its nearest letter
+_SUBSTITUTIONS = {
+    'bn': {'व': 'ব', 'य': '\u09df'},
+    'ta': {'ख': 'க', 'ग': 'க', 'घ': 'க', 'छ': 'ச', 'झ': 'ஜ', 'ठ': 'ட', 'ड': 'ட', 'ढ': 'ட',
+           'थ': 'த', 'द': 'த', 'ध': 'த', 'फ': 'ப', 'ब': 'ப', 'भ': 'ப', 'श': 'ஷ'},
+}
+
+# Phonetic scheme. Upper-case letters (retroflex T, D, N) only occur in the
+# respellings below, because input words are lower-cased first.
+_CONSONANTS = {
+    'ksh': 'क्ष', 'chh': 'छ', 'kh': 'ख', 'gh': 'घ', 'ch': 'च', 'jh': 'झ', 'th': 'थ', 'dh': 'ध',
+    'ph': 'फ', 'bh': 'भ', 'sh': 'श', 'Th': 'ठ', 'Dh': 'ढ',
+    'k': 'क', 'g': 'ग', 'c': 'क', 'j': 'ज', 'T': 'ट', 'D': 'ड', 'N': 'ण', 't': 'त', 'd': 'द', 'n': 'न',
+    'p': 'प', 'b': 'ब', 'm': 'म', 'y': 'य', 'r': 'र', 'l': 'ल', 'v': 'व', 'w': 'व', 's': 'स',
+    'h': 'ह', 'f': 'फ', 'z': 'ज', 'q': 'क', 'x': 'क्स',
+}
+# vowel -> (independent letter, dependent sign); the inherent "a" has no sign
+_VOWELS = {
+    'aa': ('आ', 'ा'), 'ai': ('ऐ', 'ै'), 'au': ('औ', 'ौ'), 'ee': ('ई', 'ी'), 'ii': ('ई', 'ी'),
+    'oo': ('ऊ', 'ू'), 'uu': ('ऊ', 'ू'), 'a': ('अ', ''), 'i': ('इ', 'ि'), 'u': ('उ', 'ु'),
+    'e': ('ए', 'े'), 'o': ('ओ', 'ो'),
+}
+_LONG_FINAL = {'a': 'ा', 'i': 'ी', 'u': 'ू'}
+# Devanagari's short e and o, used only for the Dravidian scripts
+_SHORT_VOWELS = {'e': ('ऎ', 'ॆ'), 'o': ('ऒ', 'ॊ')}
+VIRAMA = '्'
+
+# English address words respelled the way they are pronounced in India
+_RESPELLINGS = {
+    'street': 'sTreeT', 'road': 'roD', 'main': 'men', 'cross': 'kros', 'colony': 'kaalonee',
+    'lane': 'len', 'layout': 'leaauT', 'flat': 'phlaiT', 'floor': 'phlor', 'block': 'blaak',
+    'sector': 'sekTar', 'phase': 'phes', 'apartment': 'apaarTmenT', 'apartments': 'apaarTmenTs',
+    'building': 'bilDing', 'tower': 'Taavar', 'house': 'haaus', 'near': 'niyar', 'opposite': 'aapojiT',
+    'west': 'vesT', 'east': 'eesT', 'north': 'nort', 'south': 'saauth', 'district': 'Distrikt',
+    'city': 'siTee', 'town': 'Taaun', 'village': 'vilej', 'post': 'posT', 'office': 'aaphis',
+    'first': 'pharsT', 'second': 'sekanD', 'third': 'tharD', 'new': 'nyoo', 'property': 'praaparTee',
+    'witness': 'viTnes', 'one': 'van', 'two': 'Too', 'three': 'three',
+}
+
+# Name and place words respelled with the vowel lengths and retroflexes they are
+# pronounced with; looked up before the phonetic rules
+_NAME_SPELLINGS = {
+    'kumar': 'kumaar', 'narayan': 'naaraayaN', 'narayanan': 'naaraayaNan',
+    'raj': 'raaj', 'raja': 'raajaa', 'rajesh': 'raajesh', 'rajan': 'raajan', 'rao': 'raav',
+    'sharma': 'sharmaa', 'verma': 'varmaa', 'prakash': 'prakaash', 'anand': 'aanand', 'gopal': 'gopaal',
+    'balaji': 'baalaajee', 'krishnan': 'krishNan', 'krishna': 'krishNaa', 'subramanian': 'subramaNiyan',
+    'ganesh': 'gaNesh', 'ganesan': 'gaNesan', 'karthik': 'kaartik', 'iyer': 'ayyar',
+    'nair': 'naayar', 'reddy': 'reDDee', 'swamy': 'svaamee',
+    'salai': 'saalai', 'nadu': 'naaDu', 'delhi': 'dillee', 'kolkata': 'kolkaataa',
+    'hyderabad': 'haidaraabaad', 'bengaluru': 'bengalooru', 'bangalore': 'bainglor', 'pune': 'puNe',
+    'madras': 'madraas', 'coimbatore': 'koyambattoor', 'gandhi': 'gaandhee', 'nehru': 'neharoo',
+}
+
+# Honorifics and abbreviations written the target language's way, in ``LANGUAGES`` order
+_ABBREVIATIONS = {
+    'mr': ('श्री', 'श्री', 'শ্রী', 'શ્રી', 'ଶ୍ରୀ', 'திரு', 'శ్రీ', 'ಶ್ರೀ', 'جناب'),
+    'mrs': ('श्रीमती', 'श्रीमती', 'শ্রীমতী', 'શ્રીમતી', 'ଶ୍ରୀମତୀ', 'திருமதி', 'శ్రీమతి', 'ಶ್ರೀಮತಿ', 'محترمہ'),
+    'ms': ('सुश्री', 'सुश्री', 'সুশ্রী', 'સુશ્રી', 'ସୁଶ୍ରୀ', 'செல்வி', 'కుమారి', 'ಕುಮಾರಿ', 'محترمہ'),
+    'dr': ('डॉ.', 'डॉ.', 'ডাঃ', 'ડૉ.', 'ଡା.', 'டாக்டர்', 'డా.', 'ಡಾ.', 'ڈاکٹر'),
+    'no': ('नं.', 'क्र.', 'নং', 'નં.', 'ନଂ', 'எண்', 'నం.', 'ನಂ.', 'نمبر'),
+}
+_ABBREVIATIONS.update(shri=_ABBREVIATIONS['mr'], sri=_ABBREVIATIONS['mr'], smt=_ABBREVIATIONS['mrs'],
+                      miss=_ABBREVIATIONS['ms'], kumari=_ABBREVIATIONS['ms'])
+
+# Single letters are initials ("T Nagar", "R. Kumar") and are read out by name
+_LETTER_NAMES = dict(zip('abcdefghijklmnopqrstuvwxyz', (
+    'e', 'bee', 'see', 'Dee', 'ee', 'eph', 'jee', 'ech', 'aai', 'je', 'ke', 'el', 'em',
+    'en', 'o', 'pee', 'kyoo', 'aar', 'es', 'Tee', 'yoo', 'vee', 'Dablyoo', 'eks', 'vaai', 'jeD')))
+
+# Urdu letters for each consonant unit, and vowel spellings by position
+_URDU_CONSONANTS = {
+    'ksh': 'کش', 'chh': 'چھ', 'kh': 'کھ', 'gh': 'گھ', 'ch': 'چ', 'jh': 'جھ', 'th': 'تھ', 'dh': 'دھ',
+    'ph': 'پھ', 'bh': 'بھ', 'sh': 'ش', 'Th': 'ٹھ', 'Dh': 'ڈھ',
+    'k': 'ک', 'g': 'گ', 'c': 'ک', 'j': 'ج', 'T': 'ٹ', 'D': 'ڈ', 'N': 'ن', 't': 'ت', 'd': 'د', 'n': 'ن',
+    'p': 'پ', 'b': 'ب', 'm': 'م', 'y': 'ی', 'r': 'ر', 'l': 'ل', 'v': 'و', 'w': 'و', 's': 'س',
+    'h': 'ہ', 'f': 'ف', 'z': 'ز', 'q': 'ق', 'x': 'کس',
+}
+# vowel -> (word-initial, medial, word-final)
+_URDU_VOWELS = {
+    'aa': ('آ', 'ا', 'ا'), 'ai': ('اے', 'ے', 'ے'), 'au': ('او', 'و', 'و'), 'ee': ('ای', 'ی', 'ی'),
+    'ii': ('ای', 'ی', 'ی'), 'oo': ('او', 'و', 'و'), 'uu': ('او', 'و', 'و'), 'a': ('ا', '', 'ا'),
+    'i': ('ا', '', 'ی'), 'u': ('ا', '', 'و'), 'e': ('ای', 'ی', 'ے'), 'o': ('او', 'و', 'و'),
+}
+
+_CONSONANT_PATTERN = '|'.join(sorted(map(re.escape, _CONSONANTS), key=len, reverse=True))
+_VOWEL_PATTERN = '|'.join(sorted(map(re.escape, _VOWELS), key=len, reverse=True))
+_UNIT = re.compile(f'(?P<v>{_VOWEL_PATTERN})|(?P<c>{_CONSONANT_PATTERN})|(?P<x>.)')
+# An honorific with its optional period, "No." only before a number, or a word
+# without digits
+_LATIN_TOKEN = re.compile(r'(?P<abbreviation>\b(?:mrs|mr|ms|miss|dr|shri|sri|smt|kumari)\b\.?|\bno\b\.?(?=\s*\d))'
+                          r'|(?<![A-Za-z0-9])[A-Za-z]+(?![A-Za-z0-9])', re.IGNORECASE)
+_TAMIL_ALVEOLAR_N = re.compile('(?<=.)ந(?!்த)')
+
+
+def _units(word: str) -> List[Tuple[str, str]]:
+    """Split a Latin word into ``('v'|'c'|'x', text)`` units."""
+    word = word.lower()
+    word = _LETTER_NAMES.get(word) or _NAME_SPELLINGS.get(word) or _RESPELLINGS.get(word, word)
+    return [(match.lastgroup, match.group()) for match in _UNIT.finditer(word)]
+
+
+def _before_cluster(units: List[Tuple[str, str]], index: int) -> bool:
+    return [kind for kind, _ in units[index + 1:index + 3]] == ['c', 'c']
+
+
+def _to_devanagari(units: List[Tuple[str, str]], final_virama: bool, short_e_o: bool = False) -> str:
+    out = []
+    after_consonant = False
+    for index, (kind, text) in enumerate(units):
+        if kind == 'v':
+            if short_e_o and text in _SHORT_VOWELS and _before_cluster(units, index):
+                independent, sign = _SHORT_VOWELS[text]
+            else:
+                independent, sign = _VOWELS[text]
+            if not after_consonant:
+                out.append(independent)
+            elif index == len(units) - 1 and text in _LONG_FINAL:
+                out.append(_LONG_FINAL[text])  # final vowels in names are long: Priya, Lakshmi, Guru
+            else:
+                out.append(sign)
+            after_consonant = False
+        elif kind == 'c':
+            if after_consonant:
+                out.append(VIRAMA)
+            out.append(_CONSONANTS[text])
+            after_consonant = True
+        else:
+            out.append(text)
+            after_consonant = False
+    if after_consonant and final_virama:
+        out.append(VIRAMA)
+    return ''.join(out)
+
+
+def _to_urdu(units: List[Tuple[str, str]]) -> str:
+    out = []
+    for index, (kind, text) in enumerate(units):
+        if kind == 'v':
+            initial, medial, final = _URDU_VOWELS[text]
+            if index == 0:
+                out.append(initial)
+            elif index == len(units) - 1:
+                out.append(final)
+            else:
+                out.append(medial)
+        elif kind == 'c':
+            out.append(_URDU_CONSONANTS[text])
+        else:
+            out.append(text)
+    return ''.join(out)
+
+
+def _script_table(language: str) -> Dict[int, str]:
+    """Translation table from Devanagari into ``language``'s script."""
+    offset = SCRIPT_BLOCKS[language] - SCRIPT_BLOCKS['hi']
+    table = {code: chr(code + offset) for code in range(0x0900, 0x0980)}
+    table.update({ord(letter): target for letter, target in _SUBSTITUTIONS.get(language, {}).items()})
+    return table
+
+
+_SCRIPT_TABLES = {language: _script_table(language) for language in SCRIPT_BLOCKS}
+
+
+@lru_cache(maxsize=16384)
+def transliterate_word(word: str, language: str) -> str:
+    units = _units(word)
+    if language == 'ur':
+        return _to_urdu(units)
+    devanagari = _to_devanagari(units, final_virama=language in _FINAL_VIRAMA, short_e_o=language in _SHORT_E_O)
+    word = devanagari.translate(_SCRIPT_TABLES[language])
+    if language == 'ta':
+        # Tamil writes a dental n only at the start of a word and before a dental t
+        word = _TAMIL_ALVEOLAR_N.sub('ன', word)
+    return word
+
+
+def transliterate(text: str, language: str) -> str:
+    """Transliterate the Latin words of ``text`` into ``language``'s script.
+
+    Digits, punctuation and text already in another script are kept as they
+    are. Unsupported languages return ``text`` unchanged.
+    """
+    if language not in LANGUAGES:
+        return text
+    column = LANGUAGES.index(language)
+
+    def replace(match):
+        abbreviation = match.group('abbreviation')
+        if abbreviation:
+            return _ABBREVIATIONS[abbreviation.rstrip('.').lower()][column]
+        return transliterate_word(match.group(), language)
+
+    return _LATIN_TOKEN.sub(replace, text)
@@ -0,0 +1,74 @@
+"""Pre-fork warm-up of models, templates and field registries.
+
+When the app is preloaded in a WSGI master (``PRELOAD_APP=1`` together with
+gunicorn's ``preload_app``), everything built here is inherited by the workers
+through copy-on-write instead of being rebuilt in each of them.
+"""
+import gc
+import os
+import time
+from typing import Dict
+
+from app.services import nlp_registry
+from app.services.default_data import get_default_data_for_document
+
+_status: Dict = {
+    'ready': False,
+    'warmed_in_pid': None,
+    'warm_seconds': None,
+    'pipelines': [],
+    'templates_compiled': 0,
+    'field_registries': {},
+}
+
+
+def warm_all(processor, documents) -> Dict:
+    """Load models, compile templates and build field registries.
+
+    ``processor`` is the shared ``LegalDocumentProcessor`` and ``documents``
+    the form field registry used by the document routes.
+    """
+    started = time.perf_counter()
+
+    # Resolve the views used by the processor so their pipelines get loaded
+    processor.get_nlp(processor.extraction_mode)
+    processor.get_nlp(processor.display_mode)
+    _status['pipelines'] = list(nlp_registry.pipeline_stats()['pipelines'])
+
+    generator = processor.document_generator
+    _status['templates_compiled'] = generator.precompile_templates()
+
+    registries = {}
+    for doc_type, info in documents.items():
+        registries[doc_type] = {
+            'form_fields': len(info['fields']),
+            'required_fields': len(processor.document_types.get(doc_type, {}).get('required_fields', [])),
+            'languages': len(info['templates']),
+        }
+    _status['field_registries'] = registries
+
+    # Compiles the default-data tables of every document type and language
+    get_default_data_for_document(None, 'en')
+
+    _status['warm_seconds'] = round(time.perf_counter() - started, 4)
+    _status['warmed_in_pid'] = os.getpid()
+    _status['ready'] = True
+
+    # Move everything allocated so far into the permanent generation so the
+    # garbage collector does not touch (and thereby copy) shared pages in
+    # forked workers.
+    gc.collect()
+    if hasattr(gc, 'freeze'):
+        gc.freeze()
+
+    return readiness()
+
+
+def readiness() -> Dict:
+    """Report what has been warmed and whether it was inherited from a master."""
+    report = dict(_status)
+    report['pid'] = os.getpid()
+    report['preforked'] = bool(_status['warmed_in_pid']) and _status['warmed_in_pid'] != os.getpid()
+    report['nlp_mode'] = nlp_registry.pipeline_mode()
+    report['nlp'] = nlp_registry.pipeline_stats()
+    return report
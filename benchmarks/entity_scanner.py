@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""Microbenchmark: compiled single-pass scanner vs. the per-call ``re.search`` extraction.
+
+The legacy variant reproduces the previous ``extract_entities`` regex step:
+three ``re.search`` calls with pattern strings (first match only) plus the two
+inline description patterns. The scanner finds every amount, date, duration,
+pincode and age in one pass.
+
+Usage: python benchmarks/entity_scanner.py [--number 2000] [--corpus PATH]
+"""
+import argparse
+import os
+import re
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from app.services.entity_scanner import scan  # noqa: E402
+
+LEGACY_PATTERNS = {
+    'amounts': r'(?:Rs\.?|INR)?\s*(\d+(?:,\d+)*(?:\.\d{2})?)\s*(?:rupees?|Rs\.?|INR)?',
+    'dates': r'\d{1,2}[-/]\d{1,2}[-/]\d{4}|\d{1,2}(?:st|nd|rd|th)?\s+(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+\d{4}',
+    'durations': r'(\d+)\s*(?:year|month|week|day)s?',
+}
+
+
+def legacy_extract(prompt):
+    found = []
+    for name in ('amounts', 'dates', 'durations'):
+        match = re.search(LEGACY_PATTERNS[name], prompt, re.IGNORECASE)
+        if match:
+            found.append((name, match.group(0)))
+    re.search(r'a property located at (.+?)(?:\.|,|$)', prompt, re.IGNORECASE)
+    re.search(r'for (.+?) purposes', prompt, re.IGNORECASE)
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--number', type=int, default=2000)
+    parser.add_argument('--corpus', default=os.path.join(ROOT, 'benchmarks', 'data', 'prompts.txt'))
+    args = parser.parse_args()
+
+    with open(args.corpus, encoding='utf-8') as f:
+        prompts = [line.strip() for line in f if line.strip()]
+
+    for name, func in (('legacy re.search', legacy_extract), ('compiled scanner', scan)):
+        seconds = min(timeit.repeat(lambda: [func(p) for p in prompts], number=args.number // 10 or 1, repeat=5))
+        per_call_us = seconds / ((args.number // 10 or 1) * len(prompts)) * 1e6
+        found = sum(len(func(p)) for p in prompts)
+        print(f'{name:<18} {per_call_us:8.2f} us/prompt   {found} spans on {len(prompts)} prompts')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""Per-call latency of each entity extraction mode on the prompt corpus.
+
+Runs ``LegalDocumentProcessor.extract_entities`` for every mode in
+``EXTRACTION_MODES`` over ``benchmarks/data/prompts.txt``.
+
+Usage: python benchmarks/extraction_modes.py [--repeat 20] [--corpus PATH]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from app.services.processor import EXTRACTION_MODES, LegalDocumentProcessor  # noqa: E402
+
+
+def _time_calls(func, prompts, repeat):
+    timings = []
+    for _ in range(repeat):
+        for prompt in prompts:
+            started = time.perf_counter()
+            func(prompt)
+            timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    return {
+        'median_ms': round(statistics.median(timings), 3),
+        'p95_ms': round(timings[int(len(timings) * 0.95) - 1], 3),
+        'mean_ms': round(statistics.fmean(timings), 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--corpus', default=os.path.join(ROOT, 'benchmarks', 'data', 'prompts.txt'))
+    args = parser.parse_args()
+
+    with open(args.corpus, encoding='utf-8') as f:
+        prompts = [line.strip() for line in f if line.strip()]
+
+    print(f"{'mode':<8} {'components':<40} {'median_ms':>10} {'p95_ms':>10} {'mean_ms':>10}")
+    for mode in EXTRACTION_MODES:
+        processor = LegalDocumentProcessor(extraction_mode=mode, display_mode=mode)
+        nlp = processor.get_nlp(mode)
+        processor.extract_entities(prompts[0])  # warm-up outside the timed loop
+        result = _time_calls(processor.extract_entities, prompts, args.repeat)
+        print(f"{mode:<8} {','.join(nlp.pipe_names):<40} {result['median_ms']:>10} {result['p95_ms']:>10} {result['mean_ms']:>10}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Cold import-time budget for the web app.
+
+Imports ``wsgi`` (with ``PRELOAD_APP=0``) in fresh interpreters under
+``python -X importtime`` and fails when the best cumulative import time goes
+over the budget, or when a heavy dependency that should be deferred to its
+code path is imported eagerly.
+
+Usage: python benchmarks/import_time.py [--budget-ms 800] [--runs 5] [--module wsgi]
+Exit status is 1 when the budget is exceeded.
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Imported only by the code paths that need them
+DEFERRED_MODULES = ('spacy', 'docx', 'reportlab', 'requests', 'supabase')
+
+
+def measure(module):
+    """Return (total cumulative microseconds, {top-level package: microseconds}, imported names)."""
+    env = dict(os.environ, PRELOAD_APP='0')
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            cwd=ROOT, env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f'importing {module} failed:\n{result.stderr[-2000:]}')
+
+    total = 0
+    top_level = {}
+    imported = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|', 2)
+        package = name[1:]
+        imported.add(package.strip().split('.')[0])
+        if not package.startswith(' '):
+            top_level[package] = int(cumulative)
+            total += int(cumulative)
+    return total, top_level, imported
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--budget-ms', type=float, default=float(os.getenv('IMPORT_BUDGET_MS', '800')))
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--module', default='wsgi')
+    args = parser.parse_args()
+
+    runs = [measure(args.module) for _ in range(args.runs)]
+    best_total, best_top_level, imported = min(runs, key=lambda run: run[0])
+    best_ms = best_total / 1000
+
+    print(f'cold import of {args.module}: best {best_ms:.1f} ms over {args.runs} runs (budget {args.budget_ms:.0f} ms)')
+    for name, micros in sorted(best_top_level.items(), key=lambda item: -item[1])[:10]:
+        print(f'  {micros / 1000:8.1f} ms  {name}')
+
+    failed = False
+    eager = sorted(set(DEFERRED_MODULES) & imported)
+    if eager:
+        print(f'FAIL: deferred dependencies imported eagerly: {", ".join(eager)}')
+        failed = True
+    if best_ms > args.budget_ms:
+        print(f'FAIL: import time {best_ms:.1f} ms exceeds budget {args.budget_ms:.0f} ms')
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
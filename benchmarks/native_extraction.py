@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""Per-language latency and coverage of the native Tamil and Hindi extractors.
+
+Runs ``LegalDocumentProcessor.language_extractors`` (registered from
+``NATIVE_EXTRACTORS``) over ``benchmarks/data/prompts_<language>.txt`` and
+reports the per-prompt latency, the average number of fields filled and how
+many prompts were classified.
+
+Usage: python benchmarks/native_extraction.py [--repeat 200] [--languages ta hi]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from app.services.native_extractors import NATIVE_EXTRACTORS  # noqa: E402
+from app.services.processor import LegalDocumentProcessor  # noqa: E402
+
+
+def _time_calls(func, prompts, repeat):
+    timings = []
+    for _ in range(repeat):
+        for prompt in prompts:
+            started = time.perf_counter()
+            func(prompt)
+            timings.append((time.perf_counter() - started) * 1e6)
+    timings.sort()
+    return round(statistics.median(timings), 1), round(timings[int(len(timings) * 0.95) - 1], 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=200)
+    parser.add_argument('--languages', nargs='+', default=list(NATIVE_EXTRACTORS))
+    args = parser.parse_args()
+
+    processor = LegalDocumentProcessor(extraction_mode='rules', display_mode='rules')
+    print(f"{'language':<9} {'prompts':>7} {'median_us':>10} {'p95_us':>10} {'fields':>7} {'classified':>11}")
+    for language in args.languages:
+        with open(os.path.join(ROOT, 'benchmarks', 'data', f'prompts_{language}.txt'), encoding='utf-8') as f:
+            prompts = [line.strip() for line in f if line.strip()]
+        extract = processor.language_extractors[language]
+        median, p95 = _time_calls(extract, prompts, args.repeat)
+        fields = statistics.fmean(len(extract(prompt)) for prompt in prompts)
+        classified = sum(processor.classify_document_type(prompt) is not None for prompt in prompts)
+        print(f"{language:<9} {len(prompts):>7} {median:>10} {p95:>10} {fields:>7.1f} {classified:>6}/{len(prompts)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Compare per-worker memory and first-request latency with and without preloading.
+
+Starts gunicorn twice (``PRELOAD_APP=0`` and ``PRELOAD_APP=1``), waits for
+``/readyz``, times the first ``/api/process-prompt`` call and reads the PSS and
+private dirty memory of every worker from ``/proc/<pid>/smaps_rollup`` (Linux).
+
+Usage: python benchmarks/prefork_memory.py [--workers 4] [--port 5055]
+"""
+import argparse
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+import urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROMPT = 'Create a rental agreement between Anjali and Rohit for a flat in Mumbai for Rs. 30,000 per month for 11 months'
+
+
+def _children(pid):
+    try:
+        with open(f'/proc/{pid}/task/{pid}/children') as f:
+            return [int(p) for p in f.read().split()]
+    except OSError:
+        return []
+
+
+def _memory_kb(pid):
+    values = {}
+    with open(f'/proc/{pid}/smaps_rollup') as f:
+        for line in f:
+            key, _, rest = line.partition(':')
+            if key in ('Rss', 'Pss', 'Private_Dirty'):
+                values[key] = int(rest.split()[0])
+    return values
+
+
+def _wait_ready(url, timeout=120):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with urllib.request.urlopen(url, timeout=2) as resp:
+                if resp.status == 200:
+                    return True
+        except OSError:
+            time.sleep(0.5)
+    return False
+
+
+def run(preload, workers, port):
+    env = dict(os.environ, PRELOAD_APP='1' if preload else '0', GUNICORN_WORKERS=str(workers),
+               GUNICORN_BIND=f'127.0.0.1:{port}')
+    master = subprocess.Popen([sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', 'wsgi:app'],
+                              cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        base = f'http://127.0.0.1:{port}'
+        if not _wait_ready(base + '/readyz'):
+            raise RuntimeError('server did not become ready')
+
+        request = urllib.request.Request(base + '/api/process-prompt', data=json.dumps({'prompt': PROMPT}).encode(),
+                                         headers={'Content-Type': 'application/json'})
+        started = time.perf_counter()
+        urllib.request.urlopen(request, timeout=120).read()
+        first_request_ms = (time.perf_counter() - started) * 1000
+
+        worker_mem = [_memory_kb(pid) for pid in _children(master.pid)]
+        return {
+            'preload': preload,
+            'first_request_ms': round(first_request_ms, 1),
+            'workers': len(worker_mem),
+            'avg_worker_pss_kb': sum(m['Pss'] for m in worker_mem) // max(len(worker_mem), 1),
+            'avg_worker_private_dirty_kb': sum(m['Private_Dirty'] for m in worker_mem) // max(len(worker_mem), 1),
+        }
+    finally:
+        master.send_signal(signal.SIGTERM)
+        master.wait(timeout=30)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--port', type=int, default=5055)
+    args = parser.parse_args()
+    for preload in (False, True):
+        print(json.dumps(run(preload, args.workers, args.port)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""First-render latency of the shipped templates: cold compile vs. bytecode cache vs. in-memory cache.
+
+For every (document type, language) pair it measures a render in a fresh
+``DocumentGenerator``, the way a new worker sees it:
+
+- ``cold``: no bytecode cache, so the template is parsed and compiled;
+- ``bytecode``: the shared bytecode cache is filled by a previous
+  ``precompile_templates`` run, so the template is only unmarshalled;
+- ``warm``: a second render on the same generator, served from its cache.
+
+Usage: python benchmarks/template_render.py [--repeat 5]
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from app.services.default_data import get_default_data_for_document  # noqa: E402
+from app.services.document_generator import TEMPLATE_FILES, DocumentGenerator  # noqa: E402
+
+
+def _render_ms(generator, doc_type, language, data):
+    started = time.perf_counter()
+    generator.generate_document(doc_type, data, language)
+    return (time.perf_counter() - started) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        DocumentGenerator(bytecode_cache_dir=cache_dir).precompile_templates()
+        languages = DocumentGenerator(bytecode_cache_dir='off').iter_languages()
+        timings = {'cold': [], 'bytecode': [], 'warm': []}
+        for _ in range(args.repeat):
+            for doc_type in TEMPLATE_FILES:
+                for language in languages:
+                    data = dict(get_default_data_for_document(doc_type, language))
+                    timings['cold'].append(_render_ms(DocumentGenerator(bytecode_cache_dir='off'), doc_type, language, data))
+                    generator = DocumentGenerator(bytecode_cache_dir=cache_dir)
+                    timings['bytecode'].append(_render_ms(generator, doc_type, language, data))
+                    timings['warm'].append(_render_ms(generator, doc_type, language, data))
+
+    pairs = len(TEMPLATE_FILES) * len(languages)
+    print(f'{pairs} templates, {args.repeat} rounds')
+    print(f"{'mode':<9} {'median_ms':>10} {'p95_ms':>10} {'total_ms':>10}")
+    for mode, values in timings.items():
+        values.sort()
+        total = sum(values) / args.repeat
+        print(f'{mode:<9} {statistics.median(values):>10.3f} {values[int(len(values) * 0.95) - 1]:>10.3f} {total:>10.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Form translation latency against the provider at TRANSLATION_API_URL.
+
+Translates a full rental-agreement form (bypassing the translation memory)
+``--forms`` times from ``--concurrency`` threads and reports per-form latency,
+provider calls per form and the client's retry/circuit counters. Point it at
+``scripts/fake_translation_server.py`` to test under controlled latency and
+error rates.
+
+Usage:
+    python scripts/fake_translation_server.py --latency 0.15 --error-rate 0.05 &
+    TRANSLATION_API_URL=http://127.0.0.1:8765/get python benchmarks/translation_provider.py --forms 50
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from app.services.batch_translation import BatchTranslator  # noqa: E402
+from app.services.field_translation import translate_fields  # noqa: E402
+from app.services.translation_client import get_translation_client  # noqa: E402
+
+FORM = {
+    'owner_name': 'Ramesh Kumar', 'owner_father': 'Suresh Kumar', 'owner_address': '12 Anna Salai, T Nagar',
+    'owner_city': 'Chennai', 'renter_name': 'Priya Sharma', 'renter_father': 'Vijay Sharma',
+    'renter_address': '45 MG Road', 'renter_city': 'Bengaluru', 'property_address': '7 Lake View Street',
+    'property_city': 'Chennai', 'duration': '11 months', 'rent_amount_words': 'Fifteen Thousand Rupees Only',
+    'security_deposit_words': 'Fifty Thousand Rupees Only', 'notice_period': '1 month',
+    'jurisdiction': 'Chennai', 'witness1_name': 'Arun Prakash', 'witness1_address': '3 Gandhi Nagar',
+    'witness2_name': 'Lakshmi Narayanan', 'witness2_address': '9 Nehru Street', 'execution_place': 'Chennai',
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--forms', type=int, default=20)
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--language', default='ta')
+    args = parser.parse_args()
+
+    client = get_translation_client()
+    translator = BatchTranslator(client.translate)
+
+    def translate_form(index):
+        # A per-form suffix keeps every form a cache miss at the provider
+        form = {key: f'{value} {index}' for key, value in FORM.items()}
+        started = time.perf_counter()
+        # Values the provider fails on come back as ``None`` and are reported as degraded
+        translated, degraded = translate_fields(form, args.language, translator.translate)
+        assert all(isinstance(value, str) for value in translated.values()), 'a field was left without text'
+        return (time.perf_counter() - started) * 1000, len(degraded)
+
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        results = list(pool.map(translate_form, range(args.forms)))
+
+    timings = sorted(ms for ms, _ in results)
+    print(f"provider      {client.base_url}")
+    print(f"forms         {args.forms} x {len(FORM)} fields, concurrency {args.concurrency}")
+    print(f"median_ms     {statistics.median(timings):.1f}")
+    print(f"p95_ms        {timings[max(int(len(timings) * 0.95) - 1, 0)]:.1f}")
+    print(f"degraded      {sum(count for _, count in results)} fields")
+    print(f"calls/form    {translator.stats()['requests'] / args.forms:.2f}")
+    print(f"client        {client.stats()}")
+
+
+if __name__ == '__main__':
+    main()
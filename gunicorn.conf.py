@@ -0,0 +1,14 @@
+"""Gunicorn settings for the pre-fork deployment mode.
+
+Run with ``gunicorn -c gunicorn.conf.py wsgi:app``. The master imports
+``wsgi`` once with ``PRELOAD_APP=1``, warming models and templates before the
+workers are forked, so they share that memory copy-on-write.
+"""
+import os
+
+os.environ.setdefault('PRELOAD_APP', '1')
+
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:5000')
+workers = int(os.getenv('GUNICORN_WORKERS', '4'))
+threads = int(os.getenv('GUNICORN_THREADS', '1'))
+preload_app = True
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Local stand-in for the MyMemory ``/get`` translation API.
+
+Answers with MyMemory-shaped JSON whose translation is the query with every
+line prefixed by the target language (``[ta] Chennai``), keeping the line
+structure batched requests rely on. Latency and failure rates can be
+injected for load and resilience tests.
+
+Usage:
+    python scripts/fake_translation_server.py --port 8765 --latency 0.2 --error-rate 0.1
+    TRANSLATION_API_URL=http://127.0.0.1:8765/get gunicorn wsgi:app
+"""
+import argparse
+import json
+import random
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+MAX_QUERY_BYTES = 500
+
+
+class FakeTranslationHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive, like the real provider
+    latency = 0.0
+    jitter = 0.0
+    error_rate = 0.0
+    requests_served = 0
+
+    def _send(self, status, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        FakeTranslationHandler.requests_served += 1
+        url = urlparse(self.path)
+        if url.path == '/stats':
+            return self._send(200, {'requests_served': FakeTranslationHandler.requests_served})
+        if url.path != '/get':
+            return self._send(404, {'responseStatus': 404, 'responseDetails': 'NOT FOUND'})
+
+        time.sleep(max(self.latency + random.uniform(-self.jitter, self.jitter), 0))
+        if random.random() < self.error_rate:
+            return self._send(503, {'responseStatus': 503, 'responseDetails': 'SERVICE UNAVAILABLE'})
+
+        query = parse_qs(url.query)
+        text = query.get('q', [''])[0]
+        langpair = query.get('langpair', ['en|en'])[0]
+        if len(text.encode('utf-8')) > MAX_QUERY_BYTES:
+            return self._send(200, {'responseStatus': 403, 'responseData': {'translatedText': ''},
+                                    'responseDetails': 'QUERY LENGTH LIMIT EXCEEDED. MAX ALLOWED QUERY : 500 CHARS'})
+
+        target = langpair.split('|')[-1]
+        translated = '\n'.join(f'[{target}] {line}' for line in text.split('\n'))
+        self._send(200, {'responseStatus': 200, 'responseData': {'translatedText': translated, 'match': 1}})
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Fake MyMemory translation server')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds added to every response')
+    parser.add_argument('--jitter', type=float, default=0.0, help='random +/- seconds around the latency')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of requests answered with 503')
+    args = parser.parse_args()
+
+    FakeTranslationHandler.latency = args.latency
+    FakeTranslationHandler.jitter = args.jitter
+    FakeTranslationHandler.error_rate = args.error_rate
+    server = ThreadingHTTPServer((args.host, args.port), FakeTranslationHandler)
+    print(f'Fake translation server on http://{args.host}:{args.port}/get')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
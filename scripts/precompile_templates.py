@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""Compile every shipped document template into the shared Jinja bytecode cache.
+
+Run it once per deploy (or in the image build). Workers then load template
+bytecode from the cache directory instead of parsing and compiling every
+(document type, language) template on first use.
+
+Usage: python scripts/precompile_templates.py [--cache-dir DIR] [--clear]
+"""
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from app.services.document_generator import DocumentGenerator  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--cache-dir', help='bytecode cache directory (default: TEMPLATE_BYTECODE_CACHE_DIR or instance/)')
+    parser.add_argument('--clear', action='store_true', help='remove existing bytecode first')
+    args = parser.parse_args()
+
+    generator = DocumentGenerator(bytecode_cache_dir=args.cache_dir)
+    if generator.bytecode_cache is None:
+        parser.error('the bytecode cache is disabled or its directory is not writable')
+    if args.clear:
+        generator.bytecode_cache.clear()
+
+    started = time.perf_counter()
+    count = generator.precompile_templates()
+    elapsed = time.perf_counter() - started
+    print(f'Compiled {count} templates into {generator.bytecode_cache.directory} in {elapsed:.2f}s')
+
+
+if __name__ == '__main__':
+    main()
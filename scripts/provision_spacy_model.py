@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Copy a spaCy model into the bundled ``models/`` directory for offline hosts.
+
+The app never downloads models at runtime. Run this on a build machine that
+has the model, either installed as a package or as a release archive, and
+ship the resulting ``models/<name>`` directory (or point ``SPACY_MODEL_DIR``
+at it).
+
+Usage:
+    python scripts/provision_spacy_model.py                      # from the installed package
+    python scripts/provision_spacy_model.py --archive en_core_web_sm-3.7.1.tar.gz
+"""
+import argparse
+import json
+import os
+import shutil
+import sys
+import tarfile
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from app.services.nlp_registry import BUNDLED_MODEL_DIR, DEFAULT_PIPELINE  # noqa: E402
+
+
+def _find_model_dir(root):
+    """Return the directory under ``root`` that holds the model's config.cfg."""
+    for dirpath, _, files in os.walk(root):
+        if 'config.cfg' in files and 'meta.json' in files:
+            return dirpath
+    return None
+
+
+def _extract(archive_path, destination):
+    """Unpack a release archive, refusing absolute paths, ``..`` and link members."""
+    with tarfile.open(archive_path) as archive:
+        if hasattr(tarfile, 'data_filter'):
+            archive.extractall(destination, filter='data')
+            return
+        root = os.path.realpath(destination)
+        for member in archive.getmembers():
+            path = os.path.realpath(os.path.join(root, member.name))
+            if not (member.isfile() or member.isdir()) or os.path.commonpath((root, path)) != root:
+                raise ValueError(f'unsafe archive member: {member.name}')
+        archive.extractall(destination)
+
+
+def _validate(model_dir, name):
+    """Raise ``ValueError`` unless ``model_dir`` holds a loadable model."""
+    try:
+        with open(os.path.join(model_dir, 'meta.json'), encoding='utf-8') as f:
+            meta = json.load(f)
+    except (OSError, ValueError) as e:
+        raise ValueError(f'unreadable meta.json ({e})')
+    if not isinstance(meta, dict) or not meta.get('lang') or not meta.get('name'):
+        raise ValueError('meta.json has no lang or name')
+    if not os.path.isfile(os.path.join(model_dir, 'config.cfg')):
+        raise ValueError('config.cfg is missing')
+    try:
+        import spacy
+    except ImportError:
+        return  # archives can be provisioned without spaCy; the app checks the model when it loads it
+    spacy.load(model_dir)
+    print(f"Validated {meta['lang']}_{meta['name']} {meta.get('version', '')} as {name}")
+
+
+def _replace(staged, target):
+    """Move ``staged`` to ``target``, keeping the old model until the new one is in place."""
+    previous = None
+    if os.path.exists(target):
+        previous = f'{target}.old-{os.getpid()}'
+        os.rename(target, previous)
+    try:
+        os.rename(staged, target)
+    except OSError:
+        if previous:
+            os.rename(previous, target)
+        raise
+    if previous:
+        shutil.rmtree(previous)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--name', default=DEFAULT_PIPELINE)
+    parser.add_argument('--archive', help='model release archive (.tar.gz) to unpack instead of the installed package')
+    parser.add_argument('--target', help=f'destination directory (default: {BUNDLED_MODEL_DIR}/<name>)')
+    args = parser.parse_args()
+
+    target = os.path.abspath(args.target or os.path.join(BUNDLED_MODEL_DIR, args.name))
+    parent = os.path.dirname(target)
+    os.makedirs(parent, exist_ok=True)
+
+    # Staged next to the target so the final swap is a rename on one filesystem;
+    # the existing model is untouched until the new one has been validated
+    with tempfile.TemporaryDirectory(dir=parent, prefix='.provision-') as tmp:
+        staged = os.path.join(tmp, 'model')
+        if args.archive:
+            unpacked = os.path.join(tmp, 'archive')
+            try:
+                _extract(args.archive, unpacked)
+            except (tarfile.TarError, ValueError, OSError) as e:
+                sys.exit(f'Cannot unpack {args.archive}: {e}')
+            model_dir = _find_model_dir(unpacked)
+            if not model_dir:
+                sys.exit(f'No spaCy model data found in {args.archive}')
+            shutil.copytree(model_dir, staged)
+        else:
+            import spacy
+            spacy.load(args.name).to_disk(staged)
+
+        try:
+            _validate(staged, args.name)
+        except Exception as e:
+            sys.exit(f'Model {args.name} failed validation, {target} left unchanged: {e}')
+        _replace(staged, target)
+
+    print(f'Model {args.name} provisioned at {target}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""Load curated phrases into the persistent translation memory.
+
+Each line of the phrase file is ``source<TAB>target language<TAB>translation``;
+lines starting with ``#`` are ignored. The default seed file
+(``data/translation_seed.tsv``) is also loaded automatically when a worker
+opens the memory.
+
+Usage: python scripts/seed_translation_memory.py phrases.tsv [--db PATH]
+"""
+import argparse
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from app.services.translation_memory import TranslationMemory  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('phrase_file')
+    parser.add_argument('--db', help='translation memory database (default: TRANSLATION_MEMORY_PATH or instance/)')
+    args = parser.parse_args()
+
+    memory = TranslationMemory(path=args.db)
+    count = memory.seed(args.phrase_file)
+    print(f'Seeded {count} phrases into {memory.path}')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,10 +1,14 @@
 // Voice input functionality using Web Speech API
 class VoiceInput {
-    constructor(textareaId, buttonId) {
+    constructor(textareaId, buttonId, feedbackId) {
         this.textarea = document.getElementById(textareaId);
         this.button = document.getElementById(buttonId);
+        this.feedback = document.getElementById(feedbackId);
         this.recognition = null;
         this.isListening = false;
+        this.sessionId = null;
+        // Requests are chained so chunks reach the server in order and `final` goes last
+        this.queue = Promise.resolve();
 
         this.init();
     }
@@ -21,23 +25,32 @@ class VoiceInput {
         const SpeechRecognition = window.SpeechRecognition || window.webkitSpeechRecognition;
         this.recognition = new SpeechRecognition();
 
-        this.recognition.continuous = false;
-        this.recognition.interimResults = false;
+        // Keep listening and stream each finished phrase to the server as it arrives
+        this.recognition.continuous = true;
+        this.recognition.interimResults = true;
         this.recognition.lang = 'en-US'; // Default to English, can be made configurable
 
         this.recognition.onstart = () => {
             this.isListening = true;
+            this.sessionId = this.newSessionId();
             this.button.innerHTML = '<i class="fas fa-stop"></i> Stop Recording';
             this.button.classList.add('recording');
         };
 
         this.recognition.onresult = (event) => {
-            const transcript = event.results[0][0].transcript;
-            this.textarea.value += (this.textarea.value ? ' ' : '') + transcript;
+            for (let i = event.resultIndex; i < event.results.length; i++) {
+                if (!event.results[i].isFinal) {
+                    continue;
+                }
+                const transcript = event.results[i][0].transcript.trim();
+                this.textarea.value += (this.textarea.value ? ' ' : '') + transcript;
+                this.sendChunk(transcript, false);
+            }
         };
 
         this.recognition.onend = () => {
             this.isListening = false;
+            this.sendChunk('', true);
             this.button.innerHTML = '<i class="fas fa-microphone"></i> Voice Input';
             this.button.classList.remove('recording');
         };
@@ -58,9 +71,63 @@ class VoiceInput {
             }
         });
     }
+
+    newSessionId() {
+        if (window.crypto && window.crypto.randomUUID) {
+            return window.crypto.randomUUID();
+        }
+        return Date.now().toString(36) + Math.random().toString(36).slice(2);
+    }
+
+    // Queue a finished phrase; the server only re-scans the new tail of the transcript.
+    // Each request starts after the previous one has finished, so the final request
+    // is sent only once every earlier chunk has been handled.
+    sendChunk(chunk, final) {
+        if (!this.sessionId) {
+            return;
+        }
+        const sessionId = this.sessionId;
+        if (final) {
+            this.sessionId = null;
+        }
+
+        this.queue = this.queue
+            .then(() => fetch(`/api/transcript/${encodeURIComponent(sessionId)}`, {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({ chunk: chunk, final: final })
+            }))
+            .then(response => response.json())
+            .then(data => this.showFeedback(data))
+            .catch(error => console.error('Live extraction error:', error));
+    }
+
+    showFeedback(data) {
+        if (!this.feedback || data.status !== 'success') {
+            return;
+        }
+        const found = Object.entries(data.extracted_entities)
+            .map(([field, value]) => `${field.replace(/_/g, ' ')}: ${value}`);
+        const docType = data.document_type === 'unknown' ? 'not yet recognised' : data.document_type.replace(/_/g, ' ');
+
+        this.feedback.textContent = '';
+        const typeLine = document.createElement('div');
+        typeLine.textContent = `Document type: ${docType}`;
+        this.feedback.appendChild(typeLine);
+        if (found.length) {
+            const foundLine = document.createElement('div');
+            foundLine.textContent = `Found: ${found.join(', ')}`;
+            this.feedback.appendChild(foundLine);
+        }
+        if (data.missing_fields.length) {
+            const missingLine = document.createElement('div');
+            missingLine.textContent = `Still needed: ${data.missing_fields.map(f => f.replace(/_/g, ' ')).join(', ')}`;
+            this.feedback.appendChild(missingLine);
+        }
+    }
 }
 
 // Initialize voice input when DOM is loaded
 document.addEventListener('DOMContentLoaded', function() {
-    new VoiceInput('prompt', 'voice-input-btn');
+    new VoiceInput('prompt', 'voice-input-btn', 'live-extraction');
 });